@@ -0,0 +1,100 @@
+"""
+Бенчмарк сортировки сотрудников: компараторы cmp_to_key против sort_employees.
+
+Запуск из каталога python-lab3:
+    python examples/bench_sorting.py --count 1000000
+"""
+
+import sys
+import os
+
+# Добавляем корневую директорию проекта в путь
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+import argparse
+import random
+import time
+from functools import cmp_to_key
+from src.core.employee import Employee
+from src.employees.manager import Manager
+from src.employees.developer import Developer
+from src.employees.salesperson import Salesperson
+from src.utils.comparators import (
+    compare_by_salary, compare_by_department_and_name, sort_employees
+)
+
+
+def build_employees(count: int, seed: int = 42):
+    """Создать сотрудников всех типов со случайными данными."""
+    rng = random.Random(seed)
+    departments = [f"DEPT{i:02d}" for i in range(20)]
+    employees = []
+    for i in range(1, count + 1):
+        name = f"Сотрудник {rng.randrange(count)}"
+        department = rng.choice(departments)
+        base_salary = float(rng.randrange(3000, 9000, 50))
+        kind = i % 4
+        if kind == 0:
+            employees.append(Employee(i, name, department, base_salary))
+        elif kind == 1:
+            employees.append(Manager(i, name, department, base_salary, float(rng.randrange(0, 3000, 100))))
+        elif kind == 2:
+            employees.append(Developer(i, name, department, base_salary, ["Python"],
+                                       rng.choice(["junior", "middle", "senior"])))
+        else:
+            employees.append(Salesperson(i, name, department, base_salary, 0.1, float(rng.randrange(0, 50000))))
+    return employees
+
+
+def compare_by_department_salary_desc_name(emp1, emp2) -> int:
+    """Компаратор: отдел по возрастанию, зарплата по убыванию, имя по возрастанию."""
+    if emp1.department != emp2.department:
+        return -1 if emp1.department < emp2.department else 1
+    salary1, salary2 = emp1.calculate_salary(), emp2.calculate_salary()
+    if salary1 != salary2:
+        return -1 if salary1 > salary2 else 1
+    if emp1.name != emp2.name:
+        return -1 if emp1.name < emp2.name else 1
+    return 0
+
+
+def measure(label: str, func):
+    """Замерить время сортировки и вернуть результат."""
+    start = time.perf_counter()
+    result = func()
+    print(f"   {label:<52} {time.perf_counter() - start:8.3f} с")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк сортировки сотрудников")
+    parser.add_argument("--count", type=int, default=200_000, help="Количество сотрудников")
+    args = parser.parse_args()
+    
+    employees = build_employees(args.count)
+    print(f"Сотрудников: {args.count}")
+    
+    print("\n1. По зарплате:")
+    slow = measure("cmp_to_key(compare_by_salary)", lambda: sorted(employees, key=cmp_to_key(compare_by_salary)))
+    measure("sorted() через __lt__", lambda: sorted(employees))
+    fast = measure('sort_employees(employees, "salary")', lambda: sort_employees(employees, "salary"))
+    assert fast == slow
+    
+    print("\n2. По отделу и имени:")
+    slow = measure("cmp_to_key(compare_by_department_and_name)",
+                   lambda: sorted(employees, key=cmp_to_key(compare_by_department_and_name)))
+    fast = measure('sort_employees(..., "department", "name")',
+                   lambda: sort_employees(employees, "department", "name"))
+    assert fast == slow
+    
+    print("\n3. Отдел, зарплата по убыванию, имя:")
+    slow = measure("cmp_to_key(компаратор из трех полей)",
+                   lambda: sorted(employees, key=cmp_to_key(compare_by_department_salary_desc_name)))
+    fast = measure('sort_employees(..., "department", "-salary", "name")',
+                   lambda: sort_employees(employees, "department", "-salary", "name"))
+    assert fast == slow
+
+
+if __name__ == "__main__":
+    main()
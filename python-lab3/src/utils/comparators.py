@@ -1,8 +1,30 @@
-"""Функции-компараторы для сортировки сотрудников."""
+"""
+Функции-компараторы и ключевая сортировка сотрудников.
 
+Компараторы предназначены для functools.cmp_to_key и вычисляют
+сравниваемые значения при каждом сравнении. sort_employees вычисляет
+каждый ключ один раз на сотрудника и поддерживает сортировку
+по нескольким полям с разным направлением.
+"""
+
+from operator import attrgetter, methodcaller
+from typing import Callable, Iterable, List, Tuple, Union
 from src.core.abstract_employee import AbstractEmployee
 
 
+# Поле сортировки: имя поля ("-" в начале - по убыванию),
+# функция-ключ или пара (имя поля или функция, по убыванию)
+SortField = Union[str, Callable, Tuple[Union[str, Callable], bool]]
+
+SORT_KEYS = {
+    "id": attrgetter("id"),
+    "name": attrgetter("name"),
+    "department": attrgetter("department"),
+    "base_salary": attrgetter("base_salary"),
+    "salary": methodcaller("calculate_salary"),
+}
+
+
 def compare_by_name(emp1: AbstractEmployee, emp2: AbstractEmployee) -> int:
     """
     Компаратор для сортировки по имени.
@@ -66,6 +88,73 @@ def compare_by_department_and_name(emp1: AbstractEmployee, emp2: AbstractEmploye
     return compare_by_name(emp1, emp2)
 
 
+def _parse_sort_field(field: SortField) -> Tuple[Callable, bool]:
+    """
+    Разобрать описание поля сортировки.
+    
+    Args:
+        field: Имя поля, функция-ключ или пара (поле, по убыванию)
+    
+    Returns:
+        Пара (функция-ключ, по убыванию)
+    
+    Raises:
+        ValueError: Если поле неизвестно
+    """
+    descending = False
+    if isinstance(field, tuple):
+        field, descending = field
+    if callable(field):
+        return field, descending
+    if field.startswith("-"):
+        field, descending = field[1:], not descending
+    if field not in SORT_KEYS:
+        raise ValueError(f"Неизвестное поле сортировки: '{field}'. Доступные поля: {', '.join(SORT_KEYS)}")
+    return SORT_KEYS[field], descending
 
 
-
+def sort_employees(employees: Iterable[AbstractEmployee], *fields: SortField) -> List[AbstractEmployee]:
+    """
+    Отсортировать сотрудников по нескольким полям.
+    
+    Каждый ключ вычисляется один раз на сотрудника (в том числе
+    calculate_salary), после чего сортируются индексы. Соседние поля
+    с одинаковым направлением объединяются в один проход по кортежному
+    ключу, а проходы с разным направлением выполняются от последнего поля
+    к первому: сортировка в Python устойчива, поэтому порядок младших
+    полей сохраняется. Равные по всем полям сотрудники остаются
+    в исходном порядке.
+    
+    Пример: sort_employees(employees, "department", "-salary", "name")
+    
+    Args:
+        employees: Сотрудники для сортировки
+        *fields: Поля сортировки от старшего к младшему
+    
+    Returns:
+        Новый отсортированный список
+    
+    Raises:
+        ValueError: Если поле сортировки неизвестно
+    """
+    items = list(employees)
+    specs = [_parse_sort_field(field) for field in fields]
+    if not specs:
+        return items
+    
+    # Группы соседних полей с одинаковым направлением
+    groups: List[Tuple[List[Callable], bool]] = []
+    for key, descending in specs:
+        if groups and groups[-1][1] == descending:
+            groups[-1][0].append(key)
+        else:
+            groups.append(([key], descending))
+    
+    order = list(range(len(items)))
+    for keys, descending in reversed(groups):
+        if len(keys) == 1:
+            column = [keys[0](emp) for emp in items]
+        else:
+            column = list(zip(*([key(emp) for emp in items] for key in keys)))
+        order.sort(key=column.__getitem__, reverse=descending)
+    return [items[index] for index in order]
@@ -0,0 +1,97 @@
+"""
+Бенчмарк скомпилированных спецификаций.
+
+Сравнивает рекурсивный is_satisfied_by по объектам с вычислением масок
+по EmployeeColumns для одних и тех же деревьев спецификаций.
+
+Запуск из каталога python-lab5:
+    python examples/bench_compiled_specification.py --employees 1000000
+"""
+
+import sys
+import os
+
+# Добавляем корневую директорию проекта в путь
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+import argparse
+import random
+import time
+from src.core.employee import Employee
+from src.employees.developer import Developer
+from src.employees.manager import Manager
+from src.employees.salesperson import Salesperson
+from src.patterns.specification import (
+    EmployeeColumns, SalarySpecification, DepartmentSpecification,
+    SkillSpecification, EmployeeTypeSpecification
+)
+
+
+SKILLS = ["Python", "Kafka", "PHP", "Java", "Go", "Rust", "SQL", "Docker"]
+DEPARTMENTS = ["DEV", "QA", "SALES", "HR", "OPS"]
+
+
+def measure(label: str, func):
+    """Замерить функцию и вывести время."""
+    start = time.perf_counter()
+    result = func()
+    print(f"   {label:<40} {(time.perf_counter() - start) * 1000:10.1f} мс")
+    return result
+
+
+def build_employees(count: int, rng: random.Random) -> list:
+    """Создать сотрудников всех типов."""
+    employees = []
+    for emp_id in range(1, count + 1):
+        department = rng.choice(DEPARTMENTS)
+        base_salary = float(rng.randrange(30_000, 150_000, 1000))
+        kind = emp_id % 4
+        if kind == 0:
+            employees.append(Employee(emp_id, f"Сотрудник {emp_id}", department, base_salary))
+        elif kind == 1:
+            employees.append(Manager(emp_id, f"Менеджер {emp_id}", department, base_salary,
+                                     float(rng.randrange(0, 20_000, 500))))
+        elif kind == 2:
+            employees.append(Developer(emp_id, f"Разработчик {emp_id}", department, base_salary,
+                                       rng.sample(SKILLS, rng.randint(1, 4)),
+                                       rng.choice(["junior", "middle", "senior"])))
+        else:
+            employees.append(Salesperson(emp_id, f"Продавец {emp_id}", department, base_salary,
+                                         rng.choice([0.05, 0.1, 0.15]), float(rng.randrange(0, 500_000, 10_000))))
+    return employees
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк скомпилированных спецификаций")
+    parser.add_argument("--employees", type=int, default=1_000_000, help="Количество сотрудников")
+    args = parser.parse_args()
+    
+    employees = build_employees(args.employees, random.Random(42))
+    print(f"Сотрудников: {args.employees}")
+    columns = measure("построение EmployeeColumns", lambda: EmployeeColumns(employees))
+    
+    specs = {
+        "DEV AND зарплата >= 100000": DepartmentSpecification("DEV") & SalarySpecification(min_salary=100_000),
+        "(Python OR Go) AND NOT менеджер с зарплатой >= 120000": (
+            (SkillSpecification(["Python"]) | SkillSpecification(["Go"]))
+            & ~(EmployeeTypeSpecification(Manager) & SalarySpecification(min_salary=120_000))
+        ),
+        "NOT (QA OR HR) AND Salesperson": (
+            ~(DepartmentSpecification("QA") | DepartmentSpecification("HR"))
+            & EmployeeTypeSpecification(Salesperson)
+        ),
+    }
+    for label, spec in specs.items():
+        print(f"{label}:")
+        expected = measure("is_satisfied_by по объектам",
+                           lambda: [emp for emp in employees if spec.is_satisfied_by(emp)])
+        compiled = spec.compile()
+        found = measure("скомпилированная маска", lambda: compiled.filter(columns))
+        assert found == expected
+        measure("только количество", lambda: compiled.count(columns))
+        print(f"   найдено: {len(found)}")
+
+
+if __name__ == "__main__":
+    main()
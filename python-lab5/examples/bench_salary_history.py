@@ -0,0 +1,76 @@
+"""
+Бенчмарк истории зарплат: запись миллионов изменений и запросы на дату.
+
+Запуск из каталога python-lab5:
+    python examples/bench_salary_history.py --employees 100000 --events 2000000
+"""
+
+import sys
+import os
+
+# Добавляем корневую директорию проекта в путь
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+from src.core.company import Company
+from src.core.department import Department
+from src.core.employee import Employee
+from src.patterns.salary_history import SalaryHistory
+
+
+def measure(label: str, func):
+    """Замерить функцию и вывести время."""
+    start = time.perf_counter()
+    result = func()
+    print(f"   {label:<40} {time.perf_counter() - start:8.3f} с")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк истории зарплат")
+    parser.add_argument("--employees", type=int, default=100_000, help="Количество сотрудников")
+    parser.add_argument("--events", type=int, default=2_000_000, help="Количество изменений зарплат")
+    args = parser.parse_args()
+    
+    rng = random.Random(42)
+    company = Company("HistoryCorp")
+    departments = [Department(f"DEPT{i:02d}") for i in range(20)]
+    for dept in departments:
+        company.add_department(dept)
+    employees = []
+    for emp_id in range(1, args.employees + 1):
+        dept = departments[emp_id % len(departments)]
+        employee = Employee(emp_id, f"Сотрудник {emp_id}", dept.name, 5000.0)
+        dept.add_employee(employee)
+        employees.append(employee)
+    
+    history = SalaryHistory()
+    start = datetime(2020, 1, 1).timestamp()
+    step = 5 * 365 * 24 * 3600 / args.events
+    
+    def record_all():
+        for i in range(args.events):
+            employee = employees[rng.randrange(len(employees))]
+            new_salary = employee.base_salary + rng.choice((-100.0, 100.0, 250.0))
+            history.record(employee.id, employee.base_salary, new_salary, start + i * step)
+            employee.base_salary = new_salary
+    
+    print(f"Сотрудников: {args.employees}, изменений: {args.events}")
+    measure("запись изменений", record_all)
+    moments = [datetime(2020, 1, 1) + timedelta(days=rng.randrange(5 * 365)) for _ in range(100_000)]
+    measure("100 000 запросов salary_as_of", lambda: [history.salary_as_of(rng.randrange(1, args.employees + 1), m)
+                                                      for m in moments])
+    measure("фонд отдела на дату", lambda: history.department_payroll_as_of(departments[0], moments[0]))
+    measure("фонд компании на дату", lambda: history.company_payroll_as_of(company, moments[0]))
+    measure("изменение фонда за период", lambda: history.total_change_between(moments[0], moments[1]))
+    
+    # Проверка: на конец периода история совпадает с текущими зарплатами
+    assert history.company_payroll_as_of(company, datetime(2030, 1, 1)) == company.calculate_total_monthly_cost()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Бенчмарк индекса навыков: поиск разработчиков по комбинациям навыков.
+
+Сравнивает перебор is_satisfied_by с битовыми картами SkillIndex.
+
+Запуск из каталога python-lab5:
+    python examples/bench_skill_index.py --developers 1000000
+"""
+
+import sys
+import os
+
+# Добавляем корневую директорию проекта в путь
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+import argparse
+import random
+import time
+from src.core.department import Department
+from src.employees.developer import Developer
+from src.patterns.skill_index import SkillIndex
+from src.patterns.specification import SkillSpecification
+
+
+SKILLS = ["Python", "Kafka", "PHP", "Java", "Go", "Rust", "SQL", "Docker",
+          "Kubernetes", "React", "TypeScript", "C++", "Scala", "Spark", "Redis", "AWS"]
+
+
+def measure(label: str, func):
+    """Замерить функцию и вывести время."""
+    start = time.perf_counter()
+    result = func()
+    print(f"   {label:<48} {(time.perf_counter() - start) * 1000:10.1f} мс")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк индекса навыков")
+    parser.add_argument("--developers", type=int, default=1_000_000, help="Количество разработчиков")
+    parser.add_argument("--department-size", type=int, default=50, help="Сотрудников в отделе")
+    args = parser.parse_args()
+    
+    rng = random.Random(42)
+    # Department.add_employee проверяет дубликаты перебором, поэтому отделы небольшие
+    departments = [Department(f"DEPT{i:05d}") for i in range(max(1, args.developers // args.department_size))]
+    index = SkillIndex(departments)
+    
+    def hire_all():
+        for dev_id in range(1, args.developers + 1):
+            dept = departments[dev_id % len(departments)]
+            dept.add_employee(Developer(dev_id, f"Разработчик {dev_id}", dept.name, 5000.0,
+                                        rng.sample(SKILLS, rng.randint(1, 5)), "middle"))
+    
+    print(f"Разработчиков: {args.developers}")
+    measure("найм с индексацией", hire_all)
+    developers = [dev for dept in departments for dev in dept]
+    
+    python, kafka, php = (SkillSpecification([skill]) for skill in ("Python", "Kafka", "PHP"))
+    queries = {
+        "Python AND Kafka AND NOT PHP": python & kafka & ~php,
+        "(Python OR Go) AND Docker": (python | SkillSpecification(["Go"])) & SkillSpecification(["Docker"]),
+        "Rust AND Spark AND AWS": SkillSpecification(["Rust", "Spark", "AWS"]),
+    }
+    for label, spec in queries.items():
+        print(f"{label}:")
+        expected = measure("перебор is_satisfied_by",
+                           lambda: [dev for dev in developers if spec.is_satisfied_by(dev)])
+        found = measure("SkillIndex.find_by_specification", lambda: index.find_by_specification(spec))
+        assert {dev.id for dev in found} == {dev.id for dev in expected}
+        print(f"   найдено: {len(found)}")
+    
+    print("Python AND Kafka AND NOT PHP (только количество):")
+    measure("SkillIndex.count", lambda: index.count(all_of=["Python", "Kafka"], none_of=["PHP"]))
+    
+    print("Изменения после индексации:")
+    newbie = developers[0]
+    measure("add_skill", lambda: newbie.add_skill("Haskell"))
+    measure("увольнение", lambda: departments[newbie.id % len(departments)].remove_employee(newbie.id))
+    assert not index.find(all_of=["Haskell"])
+
+
+if __name__ == "__main__":
+    main()
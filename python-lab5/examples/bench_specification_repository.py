@@ -0,0 +1,87 @@
+"""
+Бенчмарк SpecificationRepository: индексы, план поиска и кэш результатов.
+
+Сравнивает полный перебор is_satisfied_by с первым (по индексам)
+и повторным (из кэша) поиском, а также поиск после изменения данных.
+
+Запуск из каталога python-lab5:
+    python examples/bench_specification_repository.py --employees 1000000
+"""
+
+import sys
+import os
+
+# Добавляем корневую директорию проекта в путь
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+import argparse
+import random
+import time
+from src.employees.developer import Developer
+from src.employees.manager import Manager
+from src.patterns.specification import (
+    Specification, SalarySpecification, DepartmentSpecification,
+    SkillSpecification, EmployeeTypeSpecification, SpecificationRepository
+)
+from examples.bench_compiled_specification import build_employees
+
+
+class NameContainsSpecification(Specification):
+    """Спецификация без индекса: подстрока в имени."""
+    
+    def __init__(self, fragment: str):
+        self._fragment = fragment
+    
+    def is_satisfied_by(self, employee) -> bool:
+        """Проверить, содержит ли имя сотрудника подстроку."""
+        return self._fragment in employee.name
+
+
+def measure(label: str, func):
+    """Замерить функцию и вывести время."""
+    start = time.perf_counter()
+    result = func()
+    print(f"   {label:<40} {(time.perf_counter() - start) * 1000:10.1f} мс")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк SpecificationRepository")
+    parser.add_argument("--employees", type=int, default=1_000_000, help="Количество сотрудников")
+    args = parser.parse_args()
+    
+    employees = build_employees(args.employees, random.Random(42))
+    print(f"Сотрудников: {args.employees}")
+    repository = measure("построение индексов", lambda: SpecificationRepository(employees))
+    
+    specs = {
+        "Rust AND Go AND зарплата >= 150000": (
+            SkillSpecification(["Rust", "Go"]) & SalarySpecification(min_salary=150_000)
+        ),
+        "HR AND Manager AND NOT зарплата > 100000": (
+            DepartmentSpecification("HR") & EmployeeTypeSpecification(Manager)
+            & ~SalarySpecification(min_salary=100_000.01)
+        ),
+        "зарплата 50000..51000 AND имя содержит '7'": (
+            NameContainsSpecification("7") & SalarySpecification(50_000, 51_000)
+        ),
+    }
+    for label, spec in specs.items():
+        print(f"{label}:")
+        print(f"   план: {repository.explain(spec)}")
+        expected = measure("перебор is_satisfied_by", lambda: [emp for emp in employees if spec.is_satisfied_by(emp)])
+        found = measure("поиск по индексам", lambda: repository.find_by_specification(spec))
+        assert found == expected
+        measure("повторный поиск", lambda: repository.find_by_specification(spec))
+        print(f"   найдено: {len(found)}, в кэше: {repository.explain(spec)['cached']}")
+    
+    print("После изменения данных:")
+    developer = next(emp for emp in employees if isinstance(emp, Developer))
+    measure("add_skill с переиндексацией", lambda: developer.add_skill("Haskell"))
+    spec = SkillSpecification(["Haskell"])
+    assert measure("поиск по новой версии", lambda: repository.find_by_specification(spec)) == [developer]
+
+
+if __name__ == "__main__":
+    main()
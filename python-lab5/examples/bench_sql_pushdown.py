@@ -0,0 +1,85 @@
+"""
+Бенчмарк фильтрации спецификаций внутри SQLite.
+
+Сравнивает загрузку всей таблицы employees с фильтрацией
+is_satisfied_by и поиск SqliteEmployeeRepository, который
+переводит спецификацию в условие WHERE.
+
+Запуск из каталога python-lab5:
+    python examples/bench_sql_pushdown.py --employees 500000
+"""
+
+import sys
+import os
+
+# Добавляем корневую директорию проекта в путь
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+import argparse
+import random
+import time
+from src.database.connection import DatabaseConnection
+from src.employees.developer import Developer
+from src.employees.manager import Manager
+from src.employees.salesperson import Salesperson
+from src.patterns.repository import SqliteEmployeeRepository
+from src.patterns.specification import (
+    Specification, SalarySpecification, DepartmentSpecification,
+    SkillSpecification, EmployeeTypeSpecification
+)
+from examples.bench_compiled_specification import build_employees
+
+
+class IdMultipleOfThreeSpecification(Specification):
+    """Спецификация без перевода в SQL."""
+    
+    def is_satisfied_by(self, employee) -> bool:
+        """Проверить, кратен ли ID сотрудника трем."""
+        return employee.id % 3 == 0
+
+
+def measure(label: str, func):
+    """Замерить функцию и вывести время."""
+    start = time.perf_counter()
+    result = func()
+    print(f"   {label:<40} {(time.perf_counter() - start) * 1000:10.1f} мс")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк фильтрации спецификаций в SQLite")
+    parser.add_argument("--employees", type=int, default=500_000, help="Количество сотрудников")
+    args = parser.parse_args()
+    
+    DatabaseConnection.get_instance().reset_instance()
+    repository = SqliteEmployeeRepository()
+    print(f"Сотрудников: {args.employees}")
+    measure("запись в таблицу", lambda: repository.add_all(build_employees(args.employees, random.Random(42))))
+    
+    specs = {
+        "DEV AND зарплата >= 100000": DepartmentSpecification("DEV") & SalarySpecification(min_salary=100_000),
+        "Python AND Kafka AND NOT Manager": (
+            SkillSpecification(["Python", "Kafka"]) & ~EmployeeTypeSpecification(Manager)
+        ),
+        "Developer AND зарплата от 150000 до 200000": (
+            EmployeeTypeSpecification(Developer) & SalarySpecification(150_000, 200_000)
+        ),
+        "Salesperson AND зарплата <= 60000 AND ID кратен 3": (
+            EmployeeTypeSpecification(Salesperson) & SalarySpecification(max_salary=60_000)
+            & IdMultipleOfThreeSpecification()
+        ),
+    }
+    for label, spec in specs.items():
+        print(f"{label}:")
+        expected = measure("get_all + фильтрация в Python",
+                           lambda: [emp for emp in repository.get_all() if spec.is_satisfied_by(emp)])
+        found = measure("условие WHERE в SQLite", lambda: repository.find_by_specification(spec))
+        assert [emp.to_dict() for emp in found] == [emp.to_dict() for emp in expected]
+        print(f"   найдено: {len(found)}")
+    
+    DatabaseConnection.get_instance().reset_instance()
+
+
+if __name__ == "__main__":
+    main()
@@ -3,13 +3,16 @@
 import json
 from typing import List, Optional, Dict
 from src.core.abstract_employee import AbstractEmployee
+from src.patterns.observer import Subject
 
 
-class Department:
+class Department(Subject):
     """
     Класс для представления отдела компании.
     
     Управляет коллекцией сотрудников с поддержкой полиморфизма.
+    Уведомляет наблюдателей о найме (employee_hired) и увольнении
+    (employee_fired) сотрудников.
     """
     
     def __init__(self, name: str):
@@ -21,6 +24,7 @@ class Department:
         """
         if not isinstance(name, str) or not name.strip():
             raise ValueError(f"Название отдела не должно быть пустой строкой, получено: '{name}'")
+        super().__init__()
         self.__name = name
         self.__employees: List[AbstractEmployee] = []
     
@@ -48,6 +52,7 @@ class Department:
         if employee in self.__employees:
             raise ValueError(f"Сотрудник с ID {employee.id} уже находится в отделе")
         self.__employees.append(employee)
+        self.notify("employee_hired", self._employee_event(employee))
     
     def remove_employee(self, employee_id: int) -> None:
         """
@@ -63,6 +68,16 @@ class Department:
         if employee is None:
             raise ValueError(f"Сотрудник с ID {employee_id} не найден в отделе")
         self.__employees.remove(employee)
+        self.notify("employee_fired", self._employee_event(employee))
+    
+    def _employee_event(self, employee: AbstractEmployee) -> dict:
+        """Данные уведомления о найме или увольнении сотрудника."""
+        return {
+            "employee_id": employee.id,
+            "employee_name": employee.name,
+            "employee": employee,
+            "department": self.__name
+        }
     
     def get_employees(self) -> List[AbstractEmployee]:
         """
@@ -1,13 +1,16 @@
 """Базовый класс Employee с инкапсуляцией данных."""
 
 from src.core.abstract_employee import AbstractEmployee
+from src.patterns.observer import Subject
 
 
-class Employee(AbstractEmployee):
+class Employee(AbstractEmployee, Subject):
     """
     Базовый класс для представления сотрудника компании.
     
     Реализует инкапсуляцию через приватные атрибуты и свойства.
+    Уведомляет наблюдателей об изменении полей через сеттеры
+    (employee_changed с названием поля).
     """
     
     def __init__(self, id: int, name: str, department: str, base_salary: float):
@@ -20,6 +23,7 @@ class Employee(AbstractEmployee):
             department: Отдел сотрудника
             base_salary: Базовая зарплата
         """
+        Subject.__init__(self)
         self.__id = id
         self.__name = name
         self.__department = department
@@ -45,6 +49,16 @@ class Employee(AbstractEmployee):
         if not isinstance(value, (int, float)) or value < 0:
             raise ValueError(f"Базовая зарплата должна быть неотрицательным числом, получено: {value}")
     
+    def _notify_changed(self, field: str) -> None:
+        """
+        Уведомить наблюдателей об изменении поля.
+        
+        Args:
+            field: Название измененного поля
+        """
+        if self._observers:
+            self.notify("employee_changed", {"employee_id": self.id, "employee": self, "field": field})
+    
     @property
     def id(self) -> int:
         """Получить ID сотрудника."""
@@ -55,6 +69,7 @@ class Employee(AbstractEmployee):
         """Установить ID сотрудника."""
         self._validate_id(value)
         self.__id = value
+        self._notify_changed("id")
     
     @property
     def name(self) -> str:
@@ -66,6 +81,7 @@ class Employee(AbstractEmployee):
         """Установить имя сотрудника."""
         self._validate_name(value)
         self.__name = value
+        self._notify_changed("name")
     
     @property
     def department(self) -> str:
@@ -78,6 +94,7 @@ class Employee(AbstractEmployee):
         if not isinstance(value, str) or not value.strip():
             raise ValueError(f"Отдел не должен быть пустой строкой, получено: '{value}'")
         self.__department = value
+        self._notify_changed("department")
     
     @property
     def base_salary(self) -> float:
@@ -89,6 +106,7 @@ class Employee(AbstractEmployee):
         """Установить базовую зарплату сотрудника."""
         self._validate_base_salary(value)
         self.__base_salary = float(value)
+        self._notify_changed("base_salary")
     
     def calculate_salary(self) -> float:
         """
@@ -9,6 +9,7 @@ class Developer(Employee):
     Класс для представления разработчика.
     
     Разработчик получает базовую зарплату, умноженную на коэффициент уровня.
+    Уведомляет наблюдателей о новых навыках (skill_added).
     """
     
     SENIORITY_COEFFICIENTS = {
@@ -66,6 +67,7 @@ class Developer(Employee):
         """Установить уровень seniority."""
         self._validate_seniority_level(value)
         self.__seniority_level = value
+        self._notify_changed("seniority_level")
     
     def add_skill(self, new_skill: str) -> None:
         """
@@ -78,6 +80,7 @@ class Developer(Employee):
             raise ValueError(f"Технология должна быть непустой строкой, получено: '{new_skill}'")
         if new_skill not in self.__tech_stack:
             self.__tech_stack.append(new_skill)
+            self.notify("skill_added", {"employee_id": self.id, "employee": self, "skill": new_skill})
     
     def calculate_salary(self) -> float:
         """
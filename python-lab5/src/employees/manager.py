@@ -40,6 +40,7 @@ class Manager(Employee):
         """Установить бонус менеджера."""
         self._validate_bonus(value)
         self.__bonus = float(value)
+        self._notify_changed("bonus")
     
     def calculate_salary(self) -> float:
         """
@@ -53,6 +53,7 @@ class Salesperson(Employee):
         """Установить процент комиссии."""
         self._validate_commission_rate(value)
         self.__commission_rate = float(value)
+        self._notify_changed("commission_rate")
     
     @property
     def sales_volume(self) -> float:
@@ -64,6 +65,7 @@ class Salesperson(Employee):
         """Установить объем продаж."""
         self._validate_sales_volume(value)
         self.__sales_volume = float(value)
+        self._notify_changed("sales_volume")
     
     def update_sales(self, new_sales: float) -> None:
         """
@@ -77,6 +79,7 @@ class Salesperson(Employee):
                 f"Новая сумма продаж должна быть неотрицательным числом, получено: {new_sales}"
             )
         self.__sales_volume += new_sales
+        self._notify_changed("sales_volume")
     
     def calculate_salary(self) -> float:
         """
@@ -5,6 +5,7 @@ from typing import Optional
 from src.core.company import Company
 from src.core.department import Department
 from src.core.abstract_employee import AbstractEmployee
+from src.patterns.salary_history import SalaryHistory
 from src.utils.exceptions import EmployeeNotFoundError, DepartmentNotFoundError
 
 
@@ -180,7 +181,8 @@ class UpdateSalaryCommand(Command):
     Реализует операцию изменения зарплаты с возможностью отмены.
     """
     
-    def __init__(self, employee_id: int, company: Company, new_salary: float):
+    def __init__(self, employee_id: int, company: Company, new_salary: float,
+                 history: Optional[SalaryHistory] = None):
         """
         Инициализация команды обновления зарплаты.
         
@@ -188,10 +190,12 @@ class UpdateSalaryCommand(Command):
             employee_id: ID сотрудника
             company: Объект компании
             new_salary: Новая зарплата
+            history: Журнал зарплат, в который записываются выполнение и отмена
         """
         self._employee_id = employee_id
         self._company = company
         self._new_salary = new_salary
+        self._history = history
         self._old_salary: Optional[float] = None
         self._employee: Optional[AbstractEmployee] = None
         self._executed = False
@@ -211,7 +215,7 @@ class UpdateSalaryCommand(Command):
             raise EmployeeNotFoundError(f"Сотрудник с ID {self._employee_id} не найден")
         
         self._old_salary = self._employee.base_salary
-        self._employee.base_salary = self._new_salary
+        self._apply(self._old_salary, self._new_salary)
         self._executed = True
         return True
     
@@ -225,9 +229,26 @@ class UpdateSalaryCommand(Command):
         if not self._executed or self._employee is None or self._old_salary is None:
             return False
         
-        self._employee.base_salary = self._old_salary
+        # Журнал только пополняется: отмена записывается как обратное изменение
+        self._apply(self._new_salary, self._old_salary)
         self._executed = False
         return True
+    
+    def _apply(self, old_salary: float, new_salary: float) -> None:
+        """
+        Установить зарплату и записать изменение в журнал.
+        
+        Если журнал отклонил запись, зарплата возвращается к прежней,
+        чтобы сотрудник и история не расходились.
+        """
+        self._employee.base_salary = new_salary
+        if self._history is None:
+            return
+        try:
+            self._history.record(self._employee_id, old_salary, new_salary)
+        except Exception:
+            self._employee.base_salary = old_salary
+            raise
 
 
 class CommandInvoker:
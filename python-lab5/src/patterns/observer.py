@@ -208,6 +208,7 @@ class ObservableEmployee(AbstractEmployee, Subject):
         self.notify("salary_changed", {
             "employee_id": self.id,
             "employee_name": self.name,
+            "employee": self,
             "old_salary": old_salary,
             "new_salary": new_salary
         })
@@ -1,10 +1,14 @@
 """Repository паттерн - репозитории для работы с данными."""
 
+import json
+import sqlite3
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 from src.core.abstract_employee import AbstractEmployee
 from src.core.department import Department
 from src.core.project import Project
+from src.database.connection import DatabaseConnection
+from src.patterns.specification import Specification
 
 
 class IEmployeeRepository(ABC):
@@ -143,6 +147,175 @@ class EmployeeRepository(IEmployeeRepository):
         del self._employees[employee_id]
 
 
+class SqliteEmployeeRepository(IEmployeeRepository):
+    """
+    Репозиторий сотрудников в таблице employees SQLite.
+    
+    Поиск по спецификации выполняется внутри SQLite: дерево спецификаций
+    переводится в параметризованное условие WHERE, и объекты создаются
+    только для подходящих строк.
+    """
+    
+    _COLUMNS = ("id", "name", "department", "base_salary", "employee_type", "bonus",
+                "tech_stack", "seniority_level", "commission_rate", "sales_volume")
+    
+    def __init__(self, connection: Optional[sqlite3.Connection] = None):
+        """
+        Инициализация репозитория.
+        
+        Args:
+            connection: Подключение с таблицей employees
+                (по умолчанию - подключение DatabaseConnection)
+        """
+        self._connection = connection or DatabaseConnection.get_instance().get_connection()
+    
+    @staticmethod
+    def _to_row(employee: AbstractEmployee) -> tuple:
+        """Преобразовать сотрудника в строку таблицы."""
+        data = Department._employee_to_dict(employee)
+        tech_stack = data.get("tech_stack")
+        return (data["id"], data["name"], data["department"], data["base_salary"], data["type"],
+                data.get("bonus"), None if tech_stack is None else json.dumps(tech_stack),
+                data.get("seniority_level"), data.get("commission_rate"), data.get("sales_volume"))
+    
+    @staticmethod
+    def _from_row(row: Dict[str, Any]) -> AbstractEmployee:
+        """Создать сотрудника из строки таблицы (словарь колонка -> значение)."""
+        data = {key: value for key, value in row.items() if value is not None}
+        data["type"] = data.pop("employee_type")
+        if "tech_stack" in data:
+            data["tech_stack"] = json.loads(data["tech_stack"])
+        return Department._employee_from_dict(data)
+    
+    def _select(self, query: str, params: Iterable = ()) -> List[AbstractEmployee]:
+        """
+        Выполнить SELECT и создать сотрудников из строк.
+        
+        Имена колонок берутся из cursor.description, поэтому row_factory
+        подключения может быть любым, в том числе стандартным (кортежи).
+        """
+        cursor = self._connection.execute(query, tuple(params))
+        columns = [column[0] for column in cursor.description]
+        return [self._from_row(dict(zip(columns, row))) for row in cursor]
+    
+    def add(self, employee: AbstractEmployee) -> None:
+        """
+        Добавить сотрудника.
+        
+        Args:
+            employee: Объект сотрудника
+        
+        Raises:
+            ValueError: Если сотрудник с таким ID уже существует
+        """
+        self.add_all([employee])
+    
+    def add_all(self, employees: Iterable[AbstractEmployee]) -> None:
+        """
+        Добавить сотрудников одной транзакцией.
+        
+        Args:
+            employees: Объекты сотрудников
+        
+        Raises:
+            ValueError: Если сотрудник с таким ID уже существует
+        """
+        placeholders = ", ".join("?" for _ in self._COLUMNS)
+        try:
+            with self._connection:
+                self._connection.executemany(
+                    f"INSERT INTO employees ({', '.join(self._COLUMNS)}) VALUES ({placeholders})",
+                    (self._to_row(employee) for employee in employees)
+                )
+        except sqlite3.IntegrityError as e:
+            raise ValueError(f"Сотрудник с таким ID уже существует: {e}") from e
+    
+    def get_by_id(self, employee_id: int) -> Optional[AbstractEmployee]:
+        """
+        Получить сотрудника по ID.
+        
+        Args:
+            employee_id: ID сотрудника
+        
+        Returns:
+            Объект сотрудника или None
+        """
+        found = self._select("SELECT * FROM employees WHERE id = ?", (employee_id,))
+        return found[0] if found else None
+    
+    def get_all(self) -> List[AbstractEmployee]:
+        """
+        Получить всех сотрудников.
+        
+        Returns:
+            Список всех сотрудников в порядке ID
+        """
+        return self._select("SELECT * FROM employees ORDER BY id")
+    
+    def update(self, employee: AbstractEmployee) -> None:
+        """
+        Обновить сотрудника.
+        
+        Args:
+            employee: Объект сотрудника
+        
+        Raises:
+            ValueError: Если сотрудник не найден
+        """
+        row = self._to_row(employee)
+        assignments = ", ".join(f"{column} = ?" for column in self._COLUMNS[1:])
+        with self._connection:
+            cursor = self._connection.execute(f"UPDATE employees SET {assignments} WHERE id = ?", row[1:] + row[:1])
+        if cursor.rowcount == 0:
+            raise ValueError(f"Сотрудник с ID {employee.id} не найден")
+    
+    def delete(self, employee_id: int) -> None:
+        """
+        Удалить сотрудника.
+        
+        Args:
+            employee_id: ID сотрудника
+        
+        Raises:
+            ValueError: Если сотрудник не найден
+        """
+        with self._connection:
+            cursor = self._connection.execute("DELETE FROM employees WHERE id = ?", (employee_id,))
+        if cursor.rowcount == 0:
+            raise ValueError(f"Сотрудник с ID {employee_id} не найден")
+    
+    def find_by_specification(self, spec: Specification) -> List[AbstractEmployee]:
+        """
+        Найти сотрудников по спецификации.
+        
+        Условия верхнего уровня, соединенные через &, переводятся в SQL
+        по отдельности; непереводимые проверяются is_satisfied_by по уже
+        отобранным сотрудникам.
+        
+        Args:
+            spec: Спецификация для фильтрации
+        
+        Returns:
+            Список сотрудников в порядке ID
+        """
+        conditions, params, residual = [], [], []
+        for conjunct in spec.conjuncts():
+            condition = conjunct.to_sql()
+            if condition is None:
+                residual.append(conjunct)
+            else:
+                conditions.append(f"({condition[0]})")
+                params.extend(condition[1])
+        
+        query = "SELECT * FROM employees"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        employees = self._select(query + " ORDER BY id", params)
+        if residual:
+            employees = [emp for emp in employees if all(part.is_satisfied_by(emp) for part in residual)]
+        return employees
+
+
 class IDepartmentRepository(ABC):
     """
     Интерфейс репозитория отделов.
@@ -0,0 +1,289 @@
+"""
+История зарплат с запросами на момент времени.
+
+История сотрудника хранится в двух типизированных массивах array('d'):
+моменты изменений (POSIX-время) и значения базовой зарплаты. Записи только
+добавляются в конец, поэтому массивы упорядочены по времени, а запрос
+"зарплата на дату" - двоичный поиск. Общий журнал с накопленной суммой
+изменений отвечает на вопрос "на сколько изменился фонд оплаты за период"
+за O(log n) от числа событий.
+
+SalaryHistory - наблюдатель: его можно подписать на ObservableEmployee
+(событие salary_changed) или передать в UpdateSalaryCommand. Отделы,
+поставленные под наблюдение (watch), сообщают о найме и увольнении, и
+история состава позволяет считать фонд отдела на дату с учетом переводов.
+"""
+
+import time
+from array import array
+from bisect import bisect_right
+from datetime import date, datetime, time as day_time
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from src.core.abstract_employee import AbstractEmployee
+from src.core.department import Department
+from src.patterns.observer import Observer
+
+
+Moment = Union[datetime, date, float]
+
+
+def _to_timestamp(moment: Moment) -> float:
+    """
+    Преобразовать момент времени в POSIX-время.
+    
+    Дата означает конец дня: в запрос попадают все изменения этого дня.
+    """
+    if isinstance(moment, datetime):
+        return moment.timestamp()
+    if isinstance(moment, date):
+        return datetime.combine(moment, day_time.max).timestamp()
+    return float(moment)
+
+
+class SalaryTimeline:
+    """Упорядоченная по времени история зарплаты одного сотрудника."""
+    
+    __slots__ = ('__timestamps', '__values')
+    
+    def __init__(self):
+        """Инициализация пустой истории."""
+        self.__timestamps = array('d')
+        self.__values = array('d')
+    
+    def append(self, timestamp: float, value: float) -> None:
+        """
+        Добавить значение в конец истории.
+        
+        Args:
+            timestamp: POSIX-время изменения
+            value: Новая зарплата
+        
+        Raises:
+            ValueError: Если момент раньше последнего записанного
+        """
+        if self.__timestamps and timestamp < self.__timestamps[-1]:
+            raise ValueError("История зарплат пополняется только в хронологическом порядке")
+        self.__timestamps.append(timestamp)
+        self.__values.append(value)
+    
+    def value_as_of(self, timestamp: float) -> Optional[float]:
+        """
+        Получить зарплату на момент времени.
+        
+        Args:
+            timestamp: POSIX-время
+        
+        Returns:
+            Последнее значение не позже момента или None, если истории еще нет
+        """
+        position = bisect_right(self.__timestamps, timestamp)
+        return self.__values[position - 1] if position else None
+    
+    @property
+    def last_value(self) -> float:
+        """Получить текущее (последнее) значение."""
+        return self.__values[-1]
+    
+    def __len__(self) -> int:
+        """Количество записей истории."""
+        return len(self.__values)
+    
+    def __iter__(self) -> Iterator[Tuple[float, float]]:
+        """Итерация по парам (POSIX-время, зарплата)."""
+        return zip(self.__timestamps, self.__values)
+
+
+class SalaryHistory(Observer):
+    """
+    Журнал изменений базовых зарплат сотрудников.
+    
+    Первое изменение сотрудника сохраняет и прежнюю зарплату: она считается
+    действовавшей с начала времени. Для сотрудников без записей запросы
+    по отделу используют текущую базовую зарплату.
+    
+    Состав отделов под наблюдением хранится по названию отдела в тех же
+    SalaryTimeline: значение 1.0 - сотрудник в отделе, 0.0 - нет.
+    Сотрудники, бывшие в отделе в момент watch, считаются его членами
+    с начала времени.
+    """
+    
+    def __init__(self, departments: Iterable[Department] = ()):
+        """
+        Инициализация пустого журнала.
+        
+        Args:
+            departments: Отделы, состав которых сразу ставится под наблюдение
+        """
+        self.__timelines: Dict[int, SalaryTimeline] = {}
+        # Общий журнал: моменты событий и накопленная сумма изменений после каждого
+        self.__timestamps = array('d')
+        self.__cumulative = array('d')
+        # Отдел -> ID сотрудника -> (сотрудник, история членства)
+        self.__memberships: Dict[str, Dict[int, Tuple[AbstractEmployee, SalaryTimeline]]] = {}
+        for department in departments:
+            self.watch(department)
+    
+    def watch(self, department: Department) -> None:
+        """
+        Подписаться на найм и увольнение в отделе.
+        
+        Args:
+            department: Отдел
+        """
+        department.attach(self)
+        members = self.__memberships.setdefault(department.name, {})
+        for employee in department:
+            if employee.id not in members:
+                self._record_membership(department.name, employee, True, float("-inf"))
+    
+    def unwatch(self, department: Department) -> None:
+        """
+        Отписаться от отдела и забыть историю его состава.
+        
+        Args:
+            department: Отдел
+        """
+        department.detach(self)
+        self.__memberships.pop(department.name, None)
+    
+    def update(self, event_type: str, data: dict) -> None:
+        """
+        Записать изменение зарплаты или состава отдела из уведомления.
+        
+        Args:
+            event_type: salary_changed, employee_hired или employee_fired
+            data: Данные события (employee_id, old_salary, new_salary или employee,
+                department; необязательно timestamp)
+        """
+        if event_type == "salary_changed":
+            self.record(data["employee_id"], data["old_salary"], data["new_salary"], data.get("timestamp"))
+        elif event_type in ("employee_hired", "employee_fired"):
+            moment = data.get("timestamp")
+            self._record_membership(data["department"], data["employee"], event_type == "employee_hired",
+                                    time.time() if moment is None else _to_timestamp(moment))
+    
+    def _record_membership(self, department_name: str, employee: AbstractEmployee,
+                           joined: bool, timestamp: float) -> None:
+        """Записать вход сотрудника в отдел или выход из него."""
+        members = self.__memberships.setdefault(department_name, {})
+        entry = members.get(employee.id)
+        timeline = SalaryTimeline() if entry is None else entry[1]
+        timeline.append(timestamp, 1.0 if joined else 0.0)
+        members[employee.id] = (employee, timeline)
+    
+    def record(self, employee_id: int, old_salary: float, new_salary: float,
+               moment: Optional[Moment] = None) -> None:
+        """
+        Записать изменение зарплаты.
+        
+        Args:
+            employee_id: ID сотрудника
+            old_salary: Зарплата до изменения (используется при первой записи сотрудника)
+            new_salary: Зарплата после изменения
+            moment: Момент изменения (по умолчанию - текущее время)
+        
+        Raises:
+            ValueError: Если момент раньше последнего события журнала
+        """
+        timestamp = time.time() if moment is None else _to_timestamp(moment)
+        if self.__timestamps and timestamp < self.__timestamps[-1]:
+            raise ValueError("История зарплат пополняется только в хронологическом порядке")
+        timeline = self.__timelines.get(employee_id)
+        if timeline is None:
+            timeline = SalaryTimeline()
+            timeline.append(float("-inf"), old_salary)
+            self.__timelines[employee_id] = timeline
+        delta = new_salary - timeline.last_value
+        timeline.append(timestamp, new_salary)
+        self.__timestamps.append(timestamp)
+        self.__cumulative.append((self.__cumulative[-1] if self.__cumulative else 0.0) + delta)
+    
+    def salary_as_of(self, employee_id: int, moment: Moment) -> Optional[float]:
+        """
+        Получить базовую зарплату сотрудника на момент времени.
+        
+        Args:
+            employee_id: ID сотрудника
+            moment: Дата, datetime или POSIX-время
+        
+        Returns:
+            Зарплата или None, если изменения сотрудника не записывались
+        """
+        timeline = self.__timelines.get(employee_id)
+        return timeline.value_as_of(_to_timestamp(moment)) if timeline is not None else None
+    
+    def get_changes(self, employee_id: int) -> List[Tuple[datetime, float]]:
+        """
+        Получить записанные изменения зарплаты сотрудника.
+        
+        Args:
+            employee_id: ID сотрудника
+        
+        Returns:
+            Список пар (момент изменения, новая зарплата) без исходного значения
+        """
+        timeline = self.__timelines.get(employee_id)
+        if timeline is None:
+            return []
+        return [(datetime.fromtimestamp(timestamp), value) for timestamp, value in list(timeline)[1:]]
+    
+    def department_payroll_as_of(self, department: Department, moment: Moment) -> float:
+        """
+        Восстановить фонд базовых зарплат отдела на момент времени.
+        
+        Для отдела под наблюдением состав берется из истории найма
+        и увольнений на тот же момент, для остальных - текущий.
+        
+        Args:
+            department: Отдел
+            moment: Дата, datetime или POSIX-время
+        
+        Returns:
+            Сумма базовых зарплат сотрудников отдела на момент
+        """
+        timestamp = _to_timestamp(moment)
+        members = self.__memberships.get(department.name)
+        if members is None:
+            employees = department
+        else:
+            employees = [employee for employee, membership in members.values()
+                         if membership.value_as_of(timestamp)]
+        total = 0.0
+        for employee in employees:
+            timeline = self.__timelines.get(employee.id)
+            total += employee.base_salary if timeline is None else timeline.value_as_of(timestamp)
+        return total
+    
+    def company_payroll_as_of(self, company, moment: Moment) -> float:
+        """
+        Восстановить фонд базовых зарплат компании на момент времени.
+        
+        Args:
+            company: Объект Company
+            moment: Дата, datetime или POSIX-время
+        
+        Returns:
+            Сумма базовых зарплат всех отделов на момент
+        """
+        return sum(self.department_payroll_as_of(dept, moment) for dept in company.get_departments())
+    
+    def total_change_between(self, start: Moment, end: Moment) -> float:
+        """
+        Получить суммарное изменение зарплат за период (start, end].
+        
+        Args:
+            start: Начало периода (не включается)
+            end: Конец периода (включается)
+        
+        Returns:
+            Сумма изменений всех записанных зарплат за период
+        """
+        def cumulative_at(moment: Moment) -> float:
+            position = bisect_right(self.__timestamps, _to_timestamp(moment))
+            return self.__cumulative[position - 1] if position else 0.0
+        
+        return cumulative_at(end) - cumulative_at(start)
+    
+    def __len__(self) -> int:
+        """Количество записанных изменений."""
+        return len(self.__timestamps)
@@ -0,0 +1,235 @@
+"""
+Инвертированный индекс навыков для поиска разработчиков.
+
+Каждому сотруднику отделов под наблюдением выделяется слот - номер бита.
+Сотрудник, состоящий в нескольких отделах под наблюдением, занимает один
+слот со счетчиком членства и освобождает его после ухода из последнего.
+Список сотрудников с навыком хранится как битовая карта (bytearray,
+один бит на слот): найм, увольнение и Developer.add_skill меняют
+отдельные биты. Запросы AND/OR/NOT переводят карты в целые числа Python
+и вычисляются побитовыми операциями над целыми словами, без перебора
+сотрудников.
+"""
+
+from typing import Dict, Iterable, List, Optional
+from src.core.abstract_employee import AbstractEmployee
+from src.core.department import Department
+from src.patterns.observer import Observer
+from src.patterns.specification import (
+    Specification, SkillSpecification, AndSpecification, OrSpecification, NotSpecification
+)
+from src.utils.bitmap import set_bit, clear_bit, to_int, count_bits, iter_bits
+
+
+class SkillIndex(Observer):
+    """
+    Индекс навык -> сотрудники, поддерживаемый по уведомлениям.
+    
+    Подписывается на отделы (employee_hired, employee_fired) и на
+    разработчиков (skill_added). Множество всех проиндексированных
+    сотрудников служит универсумом для NOT, поэтому результаты совпадают
+    с фильтрацией SpecificationRepository по тем же сотрудникам.
+    """
+    
+    def __init__(self, departments: Iterable[Department] = ()):
+        """
+        Инициализация индекса.
+        
+        Args:
+            departments: Отделы, которые сразу ставятся под наблюдение
+        """
+        self.__slots: Dict[int, int] = {}  # id(объекта сотрудника) -> слот
+        self.__employees: List[Optional[AbstractEmployee]] = []  # Слот -> сотрудник
+        self.__memberships: List[int] = []  # Слот -> число отделов под наблюдением с сотрудником
+        self.__free_slots: List[int] = []
+        self.__all = bytearray()  # Все проиндексированные сотрудники
+        self.__postings: Dict[str, bytearray] = {}  # Навык -> битовая карта
+        for department in departments:
+            self.watch(department)
+    
+    def watch(self, department: Department) -> None:
+        """
+        Поставить отдел под наблюдение и проиндексировать его сотрудников.
+        
+        Args:
+            department: Отдел
+        """
+        department.attach(self)
+        for employee in department:
+            self._add_employee(employee)
+    
+    def unwatch(self, department: Department) -> None:
+        """
+        Снять отдел с наблюдения и удалить его сотрудников из индекса.
+        
+        Args:
+            department: Отдел
+        """
+        department.detach(self)
+        for employee in department:
+            self._remove_employee(employee)
+    
+    def update(self, event_type: str, data: dict) -> None:
+        """
+        Обновить индекс по уведомлению.
+        
+        Args:
+            event_type: employee_hired, employee_fired или skill_added
+            data: Данные события с ключом employee
+        """
+        if event_type == "employee_hired":
+            self._add_employee(data["employee"])
+        elif event_type == "employee_fired":
+            self._remove_employee(data["employee"])
+        elif event_type == "skill_added":
+            slot = self.__slots.get(id(data["employee"]))
+            if slot is not None:
+                set_bit(self.__postings.setdefault(data["skill"], bytearray()), slot)
+    
+    def _add_employee(self, employee: AbstractEmployee) -> None:
+        """Выделить слот сотруднику и отметить его навыки."""
+        slot = self.__slots.get(id(employee))
+        if slot is not None:
+            self.__memberships[slot] += 1
+            return
+        if self.__free_slots:
+            slot = self.__free_slots.pop()
+            self.__employees[slot] = employee
+            self.__memberships[slot] = 1
+        else:
+            slot = len(self.__employees)
+            self.__employees.append(employee)
+            self.__memberships.append(1)
+        self.__slots[id(employee)] = slot
+        set_bit(self.__all, slot)
+        for skill in getattr(employee, 'tech_stack', ()):
+            set_bit(self.__postings.setdefault(skill, bytearray()), slot)
+        if hasattr(employee, 'attach') and hasattr(employee, 'tech_stack'):
+            employee.attach(self)
+    
+    def _remove_employee(self, employee: AbstractEmployee) -> None:
+        """Освободить слот сотрудника и снять его навыки, если он не остался в других отделах."""
+        slot = self.__slots.get(id(employee))
+        if slot is None:
+            return
+        self.__memberships[slot] -= 1
+        if self.__memberships[slot]:
+            return
+        del self.__slots[id(employee)]
+        clear_bit(self.__all, slot)
+        for skill in getattr(employee, 'tech_stack', ()):
+            clear_bit(self.__postings[skill], slot)
+        if hasattr(employee, 'detach') and hasattr(employee, 'tech_stack'):
+            employee.detach(self)
+        self.__employees[slot] = None
+        self.__free_slots.append(slot)
+    
+    def _skill_bits(self, skill: str) -> int:
+        """Битовая карта навыка как целое число."""
+        posting = self.__postings.get(skill)
+        return to_int(posting) if posting else 0
+    
+    def _all_bits(self) -> int:
+        """Битовая карта всех проиндексированных сотрудников."""
+        return to_int(self.__all)
+    
+    def _query_bits(self, all_of: Iterable[str], any_of: Iterable[str], none_of: Iterable[str]) -> int:
+        """Вычислить битовую карту запроса по навыкам."""
+        bits = self._all_bits()
+        for skill in all_of:
+            bits &= self._skill_bits(skill)
+        any_of = list(any_of)
+        if any_of:
+            union = 0
+            for skill in any_of:
+                union |= self._skill_bits(skill)
+            bits &= union
+        for skill in none_of:
+            bits &= ~self._skill_bits(skill)
+        return bits
+    
+    def _specification_bits(self, spec: Specification) -> int:
+        """
+        Вычислить битовую карту спецификации.
+        
+        Навыки и их комбинации через &, | и ~ считаются по индексу,
+        прочие спецификации проверяются по проиндексированным сотрудникам.
+        """
+        if isinstance(spec, SkillSpecification):
+            return self._query_bits(spec._required_skills, (), ())
+        if isinstance(spec, AndSpecification):
+            return self._specification_bits(spec._spec1) & self._specification_bits(spec._spec2)
+        if isinstance(spec, OrSpecification):
+            return self._specification_bits(spec._spec1) | self._specification_bits(spec._spec2)
+        if isinstance(spec, NotSpecification):
+            return self._all_bits() & ~self._specification_bits(spec._spec)
+        bitmap = bytearray()
+        for slot, employee in enumerate(self.__employees):
+            if employee is not None and spec.is_satisfied_by(employee):
+                set_bit(bitmap, slot)
+        return to_int(bitmap)
+    
+    def _employees_by_bits(self, bits: int) -> List[AbstractEmployee]:
+        """Сотрудники, соответствующие установленным битам."""
+        employees = self.__employees
+        return [employees[slot] for slot in iter_bits(bits)]
+    
+    def find(self, all_of: Iterable[str] = (), any_of: Iterable[str] = (),
+             none_of: Iterable[str] = ()) -> List[AbstractEmployee]:
+        """
+        Найти сотрудников по навыкам.
+        
+        Пример "Python AND Kafka AND NOT PHP":
+        index.find(all_of=["Python", "Kafka"], none_of=["PHP"])
+        
+        Args:
+            all_of: Навыки, которые должны быть все
+            any_of: Навыки, из которых нужен хотя бы один (если заданы)
+            none_of: Навыки, которых быть не должно
+        
+        Returns:
+            Список сотрудников в порядке слотов
+        """
+        return self._employees_by_bits(self._query_bits(all_of, any_of, none_of))
+    
+    def count(self, all_of: Iterable[str] = (), any_of: Iterable[str] = (),
+              none_of: Iterable[str] = ()) -> int:
+        """
+        Посчитать сотрудников по навыкам без построения списка.
+        
+        Args:
+            all_of: Навыки, которые должны быть все
+            any_of: Навыки, из которых нужен хотя бы один (если заданы)
+            none_of: Навыки, которых быть не должно
+        
+        Returns:
+            Количество сотрудников
+        """
+        return count_bits(self._query_bits(all_of, any_of, none_of))
+    
+    def find_by_specification(self, spec: Specification) -> List[AbstractEmployee]:
+        """
+        Найти сотрудников по спецификации с вычислением навыков по индексу.
+        
+        Args:
+            spec: Спецификация, например SkillSpecification(["Python"]) & ~SkillSpecification(["PHP"])
+        
+        Returns:
+            Список сотрудников в порядке слотов
+        """
+        return self._employees_by_bits(self._specification_bits(spec))
+    
+    def get_skill_counts(self) -> Dict[str, int]:
+        """
+        Получить количество сотрудников с каждым навыком.
+        
+        Returns:
+            Словарь навык -> количество (навыки без сотрудников не включаются)
+        """
+        counts = {skill: count_bits(to_int(posting))
+                  for skill, posting in self.__postings.items()}
+        return {skill: count for skill, count in counts.items() if count}
+    
+    def __len__(self) -> int:
+        """Количество проиндексированных сотрудников."""
+        return len(self.__slots)
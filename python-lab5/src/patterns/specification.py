@@ -1,8 +1,48 @@
-"""Specification паттерн - спецификации для фильтрации сотрудников."""
+"""
+Specification паттерн - спецификации для фильтрации сотрудников.
+
+Дерево спецификаций можно скомпилировать (Specification.compile) в одну
+функцию над колоночным представлением EmployeeColumns: узлы зарплаты,
+отдела, типа и навыков вычисляются как битовые маски строк, а &, | и ~
+становятся побитовыми операциями над масками.
+
+Те же узлы переводятся в параметризованное условие WHERE для таблицы
+employees SQLite (Specification.to_sql).
+
+SpecificationRepository ведет вторичные индексы по этим узлам и выбирает
+по ним план поиска, результаты повторных запросов берутся из кэша.
+Сотрудники-наблюдаемые (Subject) переиндексируются по своим уведомлениям,
+остальные проверяются перебором при каждом поиске.
+"""
 
 from abc import ABC, abstractmethod
-from typing import List
+from bisect import bisect_left, bisect_right, insort
+from collections import OrderedDict
+from heapq import merge
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Set, Tuple
 from src.core.abstract_employee import AbstractEmployee
+from src.patterns.observer import Observer, Subject
+from src.utils.bitmap import set_bit, to_int, range_mask, count_bits, iter_bits
+from src.utils.exceptions import StaleDataError
+
+
+# Скомпилированный узел: колонки -> битовая маска подходящих строк
+MaskFunction = Callable[['EmployeeColumns'], int]
+# Условие WHERE и его параметры
+SqlCondition = Tuple[str, list]
+
+
+def _salary_sql() -> str:
+    """Выражение SQL итоговой зарплаты по колонкам таблицы employees."""
+    from src.employees.developer import Developer
+    
+    seniority = " ".join(f"WHEN '{level}' THEN {coefficient!r}"
+                         for level, coefficient in Developer.SENIORITY_COEFFICIENTS.items())
+    return ("CASE employee_type "
+            "WHEN 'Manager' THEN base_salary + COALESCE(bonus, 0) "
+            f"WHEN 'Developer' THEN base_salary * CASE seniority_level {seniority} END "
+            "WHEN 'Salesperson' THEN base_salary + (COALESCE(sales_volume, 0) * COALESCE(commission_rate, 0)) "
+            "ELSE base_salary END")
 
 
 class Specification(ABC):
@@ -57,6 +97,43 @@ class Specification(ABC):
             Инвертированная спецификация
         """
         return NotSpecification(self)
+    
+    def compile(self) -> 'CompiledSpecification':
+        """
+        Скомпилировать дерево спецификаций в вычисление масок по колонкам.
+        
+        Returns:
+            Скомпилированная спецификация для EmployeeColumns
+        """
+        return CompiledSpecification(self._compile())
+    
+    def _compile(self) -> MaskFunction:
+        """
+        Построить функцию маски для узла.
+        
+        По умолчанию узел проверяется по объектам сотрудников
+        через is_satisfied_by.
+        """
+        return lambda columns: columns.rows_where(self.is_satisfied_by)
+    
+    def to_sql(self) -> Optional[SqlCondition]:
+        """
+        Перевести спецификацию в условие WHERE для таблицы employees.
+        
+        Returns:
+            Пара (условие с плейсхолдерами ?, параметры) или None,
+            если узел не переводится в SQL
+        """
+        return None
+    
+    def conjuncts(self) -> List['Specification']:
+        """
+        Разложить спецификацию на условия, соединенные через &.
+        
+        Returns:
+            Список условий (сама спецификация, если это не AND)
+        """
+        return [self]
 
 
 class AndSpecification(Specification):
@@ -88,6 +165,27 @@ class AndSpecification(Specification):
             True если сотрудник удовлетворяет обеим спецификациям
         """
         return self._spec1.is_satisfied_by(employee) and self._spec2.is_satisfied_by(employee)
+    
+    def _compile(self) -> MaskFunction:
+        """Пересечение масок."""
+        left, right = self._spec1._compile(), self._spec2._compile()
+        
+        def evaluate(columns: 'EmployeeColumns') -> int:
+            rows = left(columns)
+            return rows & right(columns) if rows else 0
+        
+        return evaluate
+    
+    def to_sql(self) -> Optional[SqlCondition]:
+        """Конъюнкция условий (None, если хотя бы одно не переводится)."""
+        left, right = self._spec1.to_sql(), self._spec2.to_sql()
+        if left is None or right is None:
+            return None
+        return f"({left[0]}) AND ({right[0]})", left[1] + right[1]
+    
+    def conjuncts(self) -> List[Specification]:
+        """Условия обеих частей."""
+        return self._spec1.conjuncts() + self._spec2.conjuncts()
 
 
 class OrSpecification(Specification):
@@ -119,6 +217,18 @@ class OrSpecification(Specification):
             True если сотрудник удовлетворяет хотя бы одной спецификации
         """
         return self._spec1.is_satisfied_by(employee) or self._spec2.is_satisfied_by(employee)
+    
+    def _compile(self) -> MaskFunction:
+        """Объединение масок."""
+        left, right = self._spec1._compile(), self._spec2._compile()
+        return lambda columns: left(columns) | right(columns)
+    
+    def to_sql(self) -> Optional[SqlCondition]:
+        """Дизъюнкция условий (None, если хотя бы одно не переводится)."""
+        left, right = self._spec1.to_sql(), self._spec2.to_sql()
+        if left is None or right is None:
+            return None
+        return f"({left[0]}) OR ({right[0]})", left[1] + right[1]
 
 
 class NotSpecification(Specification):
@@ -148,6 +258,16 @@ class NotSpecification(Specification):
             True если сотрудник НЕ удовлетворяет спецификации
         """
         return not self._spec.is_satisfied_by(employee)
+    
+    def _compile(self) -> MaskFunction:
+        """Дополнение маски до всех строк."""
+        inner = self._spec._compile()
+        return lambda columns: columns.all_rows & ~inner(columns)
+    
+    def to_sql(self) -> Optional[SqlCondition]:
+        """Отрицание условия."""
+        inner = self._spec.to_sql()
+        return None if inner is None else (f"NOT ({inner[0]})", inner[1])
 
 
 class SalarySpecification(Specification):
@@ -180,6 +300,22 @@ class SalarySpecification(Specification):
         """
         salary = employee.calculate_salary()
         return self._min_salary <= salary <= self._max_salary
+    
+    def _compile(self) -> MaskFunction:
+        """Отрезок строк, упорядоченных по зарплате."""
+        return lambda columns: columns.salary_rows(self._min_salary, self._max_salary)
+    
+    def to_sql(self) -> Optional[SqlCondition]:
+        """Диапазон вычисляемой по типу сотрудника зарплаты."""
+        salary = _salary_sql()
+        conditions, params = [], []
+        if self._min_salary != float('-inf'):
+            conditions.append(f"({salary}) >= ?")
+            params.append(self._min_salary)
+        if self._max_salary != float('inf'):
+            conditions.append(f"({salary}) <= ?")
+            params.append(self._max_salary)
+        return (" AND ".join(conditions) or "1"), params
 
 
 class DepartmentSpecification(Specification):
@@ -209,6 +345,14 @@ class DepartmentSpecification(Specification):
             True если сотрудник в указанном отделе
         """
         return employee.department == self._department
+    
+    def _compile(self) -> MaskFunction:
+        """Маска отдела."""
+        return lambda columns: columns.department_rows(self._department)
+    
+    def to_sql(self) -> Optional[SqlCondition]:
+        """Равенство отдела."""
+        return "department = ?", [self._department]
 
 
 class SkillSpecification(Specification):
@@ -242,6 +386,22 @@ class SkillSpecification(Specification):
         
         employee_skills = set(employee.tech_stack)
         return self._required_skills.issubset(employee_skills)
+    
+    def _compile(self) -> MaskFunction:
+        """Пересечение масок навыков."""
+        return lambda columns: columns.skill_rows(self._required_skills)
+    
+    def to_sql(self) -> Optional[SqlCondition]:
+        """
+        Наличие всех навыков в JSON-массиве tech_stack.
+        
+        Колонка tech_stack заполнена только у разработчиков.
+        """
+        skills = sorted(self._required_skills)
+        conditions = ["tech_stack IS NOT NULL"]
+        conditions.extend("EXISTS (SELECT 1 FROM json_each(employees.tech_stack) WHERE value = ?)"
+                          for _ in skills)
+        return " AND ".join(conditions), skills
 
 
 class EmployeeTypeSpecification(Specification):
@@ -271,23 +431,522 @@ class EmployeeTypeSpecification(Specification):
             True если сотрудник является указанным типом
         """
         return isinstance(employee, self._employee_type)
+    
+    def _compile(self) -> MaskFunction:
+        """Объединение масок класса и его подклассов."""
+        return lambda columns: columns.type_rows(self._employee_type)
+    
+    def to_sql(self) -> Optional[SqlCondition]:
+        """Принадлежность employee_type к классу или его подклассам."""
+        from src.core.employee import Employee
+        from src.employees.manager import Manager
+        from src.employees.developer import Developer
+        from src.employees.salesperson import Salesperson
+        
+        types = [cls.__name__ for cls in (Employee, Manager, Developer, Salesperson)
+                 if issubclass(cls, self._employee_type)]
+        if not types:
+            return "0", []
+        return f"employee_type IN ({', '.join('?' for _ in types)})", types
+
+
+class EmployeeColumns:
+    """
+    Колоночное представление сотрудников для скомпилированных спецификаций.
+    
+    Зарплаты считаются один раз, строки упорядочены по зарплате, поэтому
+    диапазон зарплат - непрерывный отрезок битов. Для отделов, классов
+    и навыков заранее строятся маски строк. Представление - снимок:
+    после изменения сотрудников его нужно построить заново.
+    """
+    
+    def __init__(self, employees: Iterable[AbstractEmployee]):
+        """
+        Построить колонки.
+        
+        Args:
+            employees: Сотрудники
+        """
+        self.__employees = list(employees)
+        salaries = [emp.calculate_salary() for emp in self.__employees]
+        self.__positions = sorted(range(len(salaries)), key=salaries.__getitem__)  # Строка -> позиция в списке
+        self.__salaries = [salaries[position] for position in self.__positions]
+        
+        departments: Dict[str, bytearray] = {}
+        types: Dict[type, bytearray] = {}
+        skills: Dict[str, bytearray] = {}
+        with_skills = bytearray()
+        for row, position in enumerate(self.__positions):
+            employee = self.__employees[position]
+            set_bit(departments.setdefault(employee.department, bytearray()), row)
+            set_bit(types.setdefault(type(employee), bytearray()), row)
+            if hasattr(employee, 'tech_stack'):
+                set_bit(with_skills, row)
+                for skill in employee.tech_stack:
+                    set_bit(skills.setdefault(skill, bytearray()), row)
+        self.__departments = {name: to_int(rows) for name, rows in departments.items()}
+        self.__types = {cls: to_int(rows) for cls, rows in types.items()}
+        self.__skills = {skill: to_int(rows) for skill, rows in skills.items()}
+        self.__with_skills = to_int(with_skills)
+        self.__all_rows = range_mask(0, len(self.__employees))
+    
+    @property
+    def all_rows(self) -> int:
+        """Маска всех строк."""
+        return self.__all_rows
+    
+    def salary_rows(self, min_salary: float, max_salary: float) -> int:
+        """Маска строк с зарплатой в диапазоне [min_salary, max_salary]."""
+        return range_mask(bisect_left(self.__salaries, min_salary), bisect_right(self.__salaries, max_salary))
+    
+    def department_rows(self, department: str) -> int:
+        """Маска строк отдела."""
+        return self.__departments.get(department, 0)
+    
+    def type_rows(self, employee_type: type) -> int:
+        """Маска строк, являющихся экземплярами класса (с подклассами)."""
+        rows = 0
+        for cls, cls_rows in self.__types.items():
+            if issubclass(cls, employee_type):
+                rows |= cls_rows
+        return rows
+    
+    def skill_rows(self, required_skills: Iterable[str]) -> int:
+        """Маска строк сотрудников со стеком технологий, имеющих все навыки."""
+        rows = self.__with_skills
+        for skill in required_skills:
+            rows &= self.__skills.get(skill, 0)
+        return rows
+    
+    def rows_where(self, predicate: Callable[[AbstractEmployee], bool]) -> int:
+        """Маска строк, проверенных предикатом по объектам сотрудников."""
+        rows = bytearray()
+        for row, position in enumerate(self.__positions):
+            if predicate(self.__employees[position]):
+                set_bit(rows, row)
+        return to_int(rows)
+    
+    def employees_by_rows(self, rows: int) -> List[AbstractEmployee]:
+        """Сотрудники строк маски в порядке исходного списка."""
+        positions = sorted(self.__positions[row] for row in iter_bits(rows))
+        return [self.__employees[position] for position in positions]
+    
+    def __len__(self) -> int:
+        """Количество строк."""
+        return len(self.__employees)
+
+
+class CompiledSpecification:
+    """Спецификация, скомпилированная в вычисление маски по EmployeeColumns."""
+    
+    def __init__(self, evaluate: MaskFunction):
+        """
+        Инициализация.
+        
+        Args:
+            evaluate: Функция колонки -> маска строк
+        """
+        self.__evaluate = evaluate
+    
+    def mask(self, columns: EmployeeColumns) -> int:
+        """
+        Вычислить маску подходящих строк.
+        
+        Args:
+            columns: Колоночное представление сотрудников
+        
+        Returns:
+            Битовая маска (бит i - строка i)
+        """
+        return self.__evaluate(columns)
+    
+    def filter(self, columns: EmployeeColumns) -> List[AbstractEmployee]:
+        """
+        Найти подходящих сотрудников.
+        
+        Args:
+            columns: Колоночное представление сотрудников
+        
+        Returns:
+            Сотрудники в порядке исходного списка
+        """
+        return columns.employees_by_rows(self.__evaluate(columns))
+    
+    def count(self, columns: EmployeeColumns) -> int:
+        """
+        Посчитать подходящих сотрудников.
+        
+        Args:
+            columns: Колоночное представление сотрудников
+        
+        Returns:
+            Количество сотрудников
+        """
+        return count_bits(self.__evaluate(columns))
+
+
+class _RepositoryObserver(Observer):
+    """Наблюдатель, переиндексирующий сотрудника репозитория по его уведомлениям."""
+    
+    def __init__(self, repository: 'SpecificationRepository'):
+        """
+        Инициализация наблюдателя.
+        
+        Args:
+            repository: Репозиторий, индексы которого поддерживаются
+        """
+        self._repository = repository
+    
+    # Поля, от которых индексы не зависят
+    _UNINDEXED_FIELDS = ("id", "name")
+    
+    def update(self, event_type: str, data: dict) -> None:
+        """
+        Переиндексировать сотрудника после изменения его полей.
+        
+        Args:
+            event_type: employee_changed, skill_added или salary_changed
+            data: Данные события с ключом employee
+        """
+        if event_type == "employee_changed" and data.get("field") in self._UNINDEXED_FIELDS:
+            return
+        if event_type in ("employee_changed", "skill_added", "salary_changed") and "employee" in data:
+            self._repository.update(data["employee"])
 
 
 class SpecificationRepository:
     """
     Репозиторий с поддержкой спецификаций.
     
-    Позволяет находить объекты по спецификациям.
+    Позволяет находить объекты по спецификациям. Для узлов отдела, типа,
+    навыков и зарплаты ведутся вторичные индексы: хеш отделов, корзины
+    типов, списки сотрудников по навыкам и отсортированный список зарплат.
+    Поиск начинается с самого селективного индекса, остальные условия
+    проверяются по кандидатам, дешевые раньше дорогих. Результаты
+    кэшируются по нормализованной спецификации и версии данных.
+    
+    Индексы поддерживаются по уведомлениям сотрудников-наблюдаемых
+    (Subject): сеттеры Employee и подклассов (employee_changed),
+    Developer.add_skill, ObservableEmployee.set_base_salary. Сотрудники,
+    которые не уведомляют об изменениях, в индексы и кэш не попадают
+    и проверяются is_satisfied_by при каждом поиске. Вызывать update
+    нужно только после изменений в обход уведомлений.
     """
     
-    def __init__(self, employees: List[AbstractEmployee]):
+    # Относительная стоимость проверки узла через is_satisfied_by
+    _CHECK_COSTS = {
+        DepartmentSpecification: 1,
+        EmployeeTypeSpecification: 1,
+        SkillSpecification: 2,
+        SalarySpecification: 3,
+    }
+    _UNKNOWN_CHECK_COST = 10
+    # Условия, индексы которых пересекаются с кандидатами без построения новых множеств
+    _SET_INDEXES = (DepartmentSpecification, EmployeeTypeSpecification, SkillSpecification)
+    # Во сколько раз оценка такого условия может превышать лучшую
+    _INTERSECT_RATIO = 4
+    
+    def __init__(self, employees: List[AbstractEmployee], cache_size: int = 128):
         """
         Инициализация репозитория.
         
+        Список сотрудников не копируется: дописанные в его конец сотрудники
+        индексируются при следующем поиске. Удаление из списка не
+        отслеживается (для него есть remove), а уменьшение списка
+        приводит к StaleDataError при поиске.
+        
         Args:
             employees: Список сотрудников
+            cache_size: Количество запоминаемых результатов поиска
+        
+        Raises:
+            ValueError: Если сотрудник встречается в списке дважды
+        """
+        self.__rows: Dict[int, AbstractEmployee] = {}  # Номер строки -> сотрудник, в порядке добавления
+        self.__row_by_object: Dict[int, int] = {}  # id(объекта сотрудника) -> номер строки
+        self.__indexed: Dict[int, Tuple[str, type, Tuple[str, ...], float]] = {}  # Строка -> значения в индексах
+        self.__by_department: Dict[str, Set[int]] = {}
+        self.__by_type: Dict[type, Set[int]] = {}
+        self.__by_skill: Dict[str, Set[int]] = {}
+        self.__with_skills: Set[int] = set()  # Строки сотрудников со стеком технологий
+        self.__unobserved: Set[int] = set()  # Строки сотрудников без уведомлений, проверяются перебором
+        self.__salaries: List[Tuple[float, int]] = []  # (зарплата, строка) по возрастанию
+        self.__next_row = 0
+        self.__version = 0
+        self.__cache: 'OrderedDict[Hashable, List[AbstractEmployee]]' = OrderedDict()
+        self.__cache_size = cache_size
+        self.__observer = _RepositoryObserver(self)
+        self.__source = employees if isinstance(employees, list) else None
+        self.__source_length = 0  # Сколько элементов списка уже проиндексировано
+        for employee in employees:
+            self._add(employee, keep_sorted=False)
+        self.__source_length = len(employees) if self.__source is not None else 0
+        self.__salaries.sort()
+    
+    @property
+    def version(self) -> int:
+        """Версия данных: увеличивается при каждом изменении."""
+        return self.__version
+    
+    def add(self, employee: AbstractEmployee) -> None:
+        """
+        Добавить сотрудника и проиндексировать его.
+        
+        Args:
+            employee: Объект сотрудника
+        
+        Raises:
+            ValueError: Если сотрудник уже в репозитории
+        """
+        self._add(employee, keep_sorted=True)
+    
+    def _add(self, employee: AbstractEmployee, keep_sorted: bool) -> None:
+        """Выделить строку сотруднику и проиндексировать его."""
+        if id(employee) in self.__row_by_object:
+            raise ValueError(f"Сотрудник с ID {employee.id} уже находится в репозитории")
+        row = self.__next_row
+        self.__next_row += 1
+        self.__rows[row] = employee
+        self.__row_by_object[id(employee)] = row
+        self._index(row, employee, keep_sorted)
+        if isinstance(employee, Subject):
+            employee.attach(self.__observer)
+        else:
+            self.__unobserved.add(row)
+        self.__version += 1
+    
+    def remove(self, employee: AbstractEmployee) -> None:
+        """
+        Удалить сотрудника.
+        
+        Args:
+            employee: Объект сотрудника
+        
+        Raises:
+            ValueError: Если сотрудника нет в репозитории
+        """
+        row = self._row_of(employee)
+        self._unindex(row)
+        del self.__rows[row]
+        del self.__row_by_object[id(employee)]
+        if isinstance(employee, Subject):
+            employee.detach(self.__observer)
+        self.__unobserved.discard(row)
+        self.__version += 1
+    
+    def update(self, employee: AbstractEmployee) -> None:
+        """
+        Переиндексировать сотрудника после изменения его данных.
+        
+        Args:
+            employee: Объект сотрудника
+        
+        Raises:
+            ValueError: Если сотрудника нет в репозитории
+        """
+        row = self._row_of(employee)
+        self._unindex(row)
+        self._index(row, employee, keep_sorted=True)
+        self.__version += 1
+    
+    def _row_of(self, employee: AbstractEmployee) -> int:
+        """Номер строки сотрудника."""
+        row = self.__row_by_object.get(id(employee))
+        if row is None:
+            raise ValueError(f"Сотрудник с ID {employee.id} не найден в репозитории")
+        return row
+    
+    def _index(self, row: int, employee: AbstractEmployee, keep_sorted: bool) -> None:
+        """
+        Добавить строку во вторичные индексы.
+        
+        При keep_sorted=False зарплата добавляется в конец списка,
+        и список нужно отсортировать после загрузки.
+        """
+        skills = tuple(employee.tech_stack) if hasattr(employee, 'tech_stack') else ()
+        salary = employee.calculate_salary()
+        self.__indexed[row] = (employee.department, type(employee), skills, salary)
+        self.__by_department.setdefault(employee.department, set()).add(row)
+        self.__by_type.setdefault(type(employee), set()).add(row)
+        if hasattr(employee, 'tech_stack'):
+            self.__with_skills.add(row)
+            for skill in skills:
+                self.__by_skill.setdefault(skill, set()).add(row)
+        if keep_sorted:
+            insort(self.__salaries, (salary, row))
+        else:
+            self.__salaries.append((salary, row))
+    
+    def _unindex(self, row: int) -> None:
+        """Удалить строку из вторичных индексов по сохраненным значениям."""
+        department, employee_type, skills, salary = self.__indexed.pop(row)
+        self.__by_department[department].discard(row)
+        self.__by_type[employee_type].discard(row)
+        self.__with_skills.discard(row)
+        for skill in skills:
+            self.__by_skill[skill].discard(row)
+        del self.__salaries[bisect_left(self.__salaries, (salary, row))]
+    
+    def _salary_bounds(self, spec: SalarySpecification) -> Tuple[int, int]:
+        """Отрезок отсортированного списка зарплат для диапазона."""
+        return (bisect_left(self.__salaries, (spec._min_salary, -1)),
+                bisect_right(self.__salaries, (spec._max_salary, float('inf'))))
+    
+    def _type_buckets(self, spec: EmployeeTypeSpecification) -> List[Set[int]]:
+        """Корзины класса спецификации и его подклассов."""
+        return [rows for cls, rows in self.__by_type.items() if issubclass(cls, spec._employee_type)]
+    
+    def _estimate(self, spec: Specification) -> Optional[int]:
+        """
+        Оценить число подходящих строк по статистике индексов.
+        
+        Индексами отвечаются только узлы встроенных классов: подкласс
+        может переопределить is_satisfied_by.
+        
+        Returns:
+            Оценка или None, если узел не отвечается индексами
+        """
+        if type(spec) is DepartmentSpecification:
+            return len(self.__by_department.get(spec._department, ()))
+        if type(spec) is EmployeeTypeSpecification:
+            return sum(len(rows) for rows in self._type_buckets(spec))
+        if type(spec) is SkillSpecification:
+            return min((len(self.__by_skill.get(skill, ())) for skill in spec._required_skills),
+                       default=len(self.__with_skills))
+        if type(spec) is SalarySpecification:
+            start, stop = self._salary_bounds(spec)
+            return max(stop - start, 0)
+        if isinstance(spec, (AndSpecification, OrSpecification)):
+            left, right = self._estimate(spec._spec1), self._estimate(spec._spec2)
+            if left is None or right is None:
+                return None
+            return min(left, right) if isinstance(spec, AndSpecification) else min(left + right, len(self.__rows))
+        if isinstance(spec, NotSpecification):
+            inner = self._estimate(spec._spec)
+            return None if inner is None else len(self.__rows) - inner
+        return None
+    
+    def _lookup(self, spec: Specification) -> Set[int]:
+        """Строки, подходящие под узел, по индексам (узел должен иметь оценку)."""
+        if isinstance(spec, DepartmentSpecification):
+            return self.__by_department.get(spec._department, set())
+        if isinstance(spec, EmployeeTypeSpecification):
+            return set().union(*self._type_buckets(spec))
+        if isinstance(spec, SkillSpecification):
+            postings = sorted((self.__by_skill.get(skill, set()) for skill in spec._required_skills), key=len)
+            return self.__with_skills.intersection(*postings) if postings else self.__with_skills
+        if isinstance(spec, SalarySpecification):
+            start, stop = self._salary_bounds(spec)
+            return {row for _, row in self.__salaries[start:stop]}
+        if isinstance(spec, AndSpecification):
+            return self._lookup(spec._spec1) & self._lookup(spec._spec2)
+        if isinstance(spec, OrSpecification):
+            return self._lookup(spec._spec1) | self._lookup(spec._spec2)
+        return self.__rows.keys() - self._lookup(spec._spec)
+    
+    def _check_cost(self, spec: Specification) -> int:
+        """Стоимость проверки узла по объекту сотрудника."""
+        if isinstance(spec, (AndSpecification, OrSpecification)):
+            return self._check_cost(spec._spec1) + self._check_cost(spec._spec2)
+        if isinstance(spec, NotSpecification):
+            return self._check_cost(spec._spec)
+        return self._CHECK_COSTS.get(type(spec), self._UNKNOWN_CHECK_COST)
+    
+    def _plan(self, spec: Specification) -> Tuple[List[Specification], int, List[Specification]]:
         """
-        self._employees = employees
+        Выбрать план поиска.
+        
+        Кандидатов дает самое селективное условие с индексом. Условия
+        отдела, типа и навыков, чьи индексы уже хранятся множествами,
+        пересекаются с кандидатами, если их оценка не более чем
+        в _INTERSECT_RATIO раз больше. Остальные проверяются по объектам,
+        начиная с самых дешевых.
+        
+        Returns:
+            Условия для индексов (пустой список - полный перебор),
+            оценка числа кандидатов и условия для проверки по объектам
+        """
+        conjuncts = spec.conjuncts()
+        indexed = []
+        for position, conjunct in enumerate(conjuncts):
+            estimate = self._estimate(conjunct)
+            if estimate is not None:
+                indexed.append((estimate, position, conjunct))
+        indexed.sort(key=lambda item: item[:2])
+        if not indexed:
+            return [], len(self.__rows), sorted(conjuncts, key=self._check_cost)
+        
+        estimate, _, driver = indexed[0]
+        index_conditions = [driver] + [
+            conjunct for conjunct_estimate, _, conjunct in indexed[1:]
+            if type(conjunct) in self._SET_INDEXES and conjunct_estimate <= estimate * self._INTERSECT_RATIO
+        ]
+        filters = [conjunct for conjunct in conjuncts if all(conjunct is not used for used in index_conditions)]
+        return index_conditions, estimate, sorted(filters, key=self._check_cost)
+    
+    @classmethod
+    def _cache_key(cls, spec: Specification) -> Optional[Hashable]:
+        """
+        Нормализованный ключ спецификации.
+        
+        Порядок и повторы операндов & и | не важны, двойное
+        отрицание снимается. Для узлов других классов ключа нет:
+        их результат не кэшируется.
+        """
+        if isinstance(spec, (AndSpecification, OrSpecification)):
+            operator = type(spec)
+            operands = []
+            stack = [spec._spec1, spec._spec2]
+            while stack:
+                node = stack.pop()
+                if type(node) is operator:
+                    stack.extend((node._spec1, node._spec2))
+                    continue
+                key = cls._cache_key(node)
+                if key is None:
+                    return None
+                operands.append(key)
+            return "and" if operator is AndSpecification else "or", frozenset(operands)
+        if isinstance(spec, NotSpecification):
+            inner = cls._cache_key(spec._spec)
+            if inner is None:
+                return None
+            return inner[1] if inner[0] == "not" else ("not", inner)
+        if type(spec) is DepartmentSpecification:
+            return "department", spec._department
+        if type(spec) is EmployeeTypeSpecification:
+            return "type", spec._employee_type
+        if type(spec) is SkillSpecification:
+            return "skills", frozenset(spec._required_skills)
+        if type(spec) is SalarySpecification:
+            return "salary", spec._min_salary, spec._max_salary
+        return None
+    
+    def _sync_source(self) -> None:
+        """
+        Проиндексировать сотрудников, дописанных в исходный список.
+        
+        Raises:
+            StaleDataError: Если исходный список стал короче
+        """
+        source = self.__source
+        if source is None or len(source) == self.__source_length:
+            return
+        if len(source) < self.__source_length:
+            raise StaleDataError("Из исходного списка удалены сотрудники: используйте remove")
+        for employee in source[self.__source_length:]:
+            if id(employee) not in self.__row_by_object:
+                self._add(employee, keep_sorted=True)
+        self.__source_length = len(source)
+    
+    def _with_unobserved(self, spec: Specification, employees: List[AbstractEmployee]) -> List[AbstractEmployee]:
+        """Добавить к результату подходящих сотрудников без уведомлений с сохранением порядка строк."""
+        rows = self.__rows
+        extra = [rows[row] for row in sorted(self.__unobserved) if spec.is_satisfied_by(rows[row])]
+        if not extra:
+            return list(employees)
+        row_by_object = self.__row_by_object
+        return list(merge(employees, extra, key=lambda employee: row_by_object[id(employee)]))
     
     def find_by_specification(self, spec: Specification) -> List[AbstractEmployee]:
         """
@@ -297,11 +956,81 @@ class SpecificationRepository:
             spec: Спецификация для фильтрации
         
         Returns:
-            Список сотрудников, удовлетворяющих спецификации
+            Список сотрудников, удовлетворяющих спецификации, в порядке добавления
+        
+        Raises:
+            StaleDataError: Если исходный список стал короче
         """
-        return [emp for emp in self._employees if spec.is_satisfied_by(emp)]
-
-
-
-
-
+        self._sync_source()
+        unobserved = self.__unobserved
+        key = self._cache_key(spec)
+        if key is not None:
+            key = (self.__version, key)
+            cached = self.__cache.get(key)
+            if cached is not None:
+                self.__cache.move_to_end(key)
+                return self._with_unobserved(spec, cached) if unobserved else list(cached)
+        
+        # Индексы и кэш отвечают только за сотрудников с уведомлениями
+        index_conditions, _, filters = self._plan(spec)
+        if index_conditions:
+            rows = self._lookup(index_conditions[0])
+            for condition in index_conditions[1:]:
+                rows = rows & self._lookup(condition)
+            if unobserved:
+                rows = rows - unobserved
+            employees = [self.__rows[row] for row in sorted(rows)]
+        elif unobserved:
+            employees = [emp for row, emp in self.__rows.items() if row not in unobserved]
+        else:
+            employees = list(self.__rows.values())
+        for condition in filters:
+            employees = [emp for emp in employees if condition.is_satisfied_by(emp)]
+        
+        if key is not None and self.__cache_size > 0:
+            self.__cache[key] = employees
+            if len(self.__cache) > self.__cache_size:
+                self.__cache.popitem(last=False)
+            employees = list(employees)
+        return self._with_unobserved(spec, employees) if unobserved else employees
+    
+    def explain(self, spec: Specification) -> Dict[str, Any]:
+        """
+        Описать план поиска.
+        
+        Args:
+            spec: Спецификация
+        
+        Returns:
+            Словарь: indexes (классы условий для индексов), estimated_rows,
+            filters (классы условий в порядке проверки), cached
+        """
+        index_conditions, estimate, filters = self._plan(spec)
+        key = self._cache_key(spec)
+        return {
+            "indexes": [type(condition).__name__ for condition in index_conditions],
+            "estimated_rows": estimate,
+            "filters": [type(condition).__name__ for condition in filters],
+            "cached": key is not None and (self.__version, key) in self.__cache,
+        }
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Получить статистику индексов.
+        
+        Returns:
+            Словарь с количеством сотрудников всего, по отделам, типам,
+            навыкам, диапазоном зарплат и числом сотрудников без уведомлений
+        """
+        return {
+            "employees": len(self.__rows),
+            "departments": {name: len(rows) for name, rows in self.__by_department.items() if rows},
+            "types": {cls.__name__: len(rows) for cls, rows in self.__by_type.items() if rows},
+            "skills": {skill: len(rows) for skill, rows in self.__by_skill.items() if rows},
+            "salary_range": (self.__salaries[0][0], self.__salaries[-1][0]) if self.__salaries else None,
+            "unobserved": len(self.__unobserved),
+        }
+    
+    def __len__(self) -> int:
+        """Количество сотрудников в репозитории."""
+        return len(self.__rows)
@@ -0,0 +1,55 @@
+"""
+Битовые карты множеств строк.
+
+Множество номеров хранится как целое число Python (бит i - строка i)
+или, при точечном обновлении, как bytearray в порядке little-endian.
+Операции над множествами - побитовые &, |, ~ над целыми числами.
+"""
+
+import re
+from typing import Iterator
+
+
+# Номера установленных битов для каждого значения байта
+_BYTE_BITS = [tuple(bit for bit in range(8) if value >> bit & 1) for value in range(256)]
+_NONZERO_BYTE = re.compile(b'[^\x00]')
+
+
+def set_bit(bitmap: bytearray, position: int) -> None:
+    """Установить бит, расширяя карту при необходимости."""
+    index = position >> 3
+    if index >= len(bitmap):
+        bitmap.extend(bytes(index + 1 - len(bitmap)))
+    bitmap[index] |= 1 << (position & 7)
+
+
+def clear_bit(bitmap: bytearray, position: int) -> None:
+    """Сбросить бит."""
+    index = position >> 3
+    if index < len(bitmap):
+        bitmap[index] &= ~(1 << (position & 7)) & 0xFF
+
+
+def to_int(bitmap: bytearray) -> int:
+    """Преобразовать карту bytearray в целое число."""
+    return int.from_bytes(bitmap, 'little')
+
+
+def range_mask(start: int, stop: int) -> int:
+    """Карта с установленными битами start..stop-1."""
+    return ((1 << stop) - 1) ^ ((1 << start) - 1) if stop > start else 0
+
+
+def count_bits(bits: int) -> int:
+    """Количество установленных битов."""
+    return bin(bits).count("1")
+
+
+def iter_bits(bits: int) -> Iterator[int]:
+    """Перебрать номера установленных битов по возрастанию."""
+    data = bits.to_bytes((bits.bit_length() + 7) // 8, 'little')
+    for match in _NONZERO_BYTE.finditer(data):  # Нулевые байты пропускаются на уровне C
+        index = match.start()
+        base = index << 3
+        for bit in _BYTE_BITS[data[index]]:
+            yield base + bit
@@ -26,6 +26,6 @@ class DuplicateIdError(Exception):
     pass
 
 
-
-
-
+class StaleDataError(Exception):
+    """Исключение при устаревших данных индекса."""
+    pass
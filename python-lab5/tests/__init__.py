@@ -0,0 +1 @@
+"""Тесты для системы учета сотрудников."""
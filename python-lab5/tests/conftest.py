@@ -0,0 +1,77 @@
+"""Общие фикстуры тестов."""
+
+import random
+import pytest
+from src.core.employee import Employee
+from src.employees.developer import Developer
+from src.employees.manager import Manager
+from src.employees.salesperson import Salesperson
+from src.patterns.specification import (
+    Specification, SalarySpecification, DepartmentSpecification,
+    SkillSpecification, EmployeeTypeSpecification
+)
+
+
+SKILLS = ["Python", "Kafka", "PHP", "Go", "Rust", "SQL"]
+DEPARTMENTS = ["DEV", "QA", "SALES", "HR"]
+EMPLOYEE_TYPES = [Employee, Manager, Developer, Salesperson]
+
+
+class IdDivisibleSpecification(Specification):
+    """Спецификация без индекса и перевода в SQL."""
+    
+    def __init__(self, divisor: int):
+        self._divisor = divisor
+    
+    def is_satisfied_by(self, employee) -> bool:
+        """Проверить, делится ли ID сотрудника на делитель."""
+        return employee.id % self._divisor == 0
+
+
+def build_employees(count: int, rng: random.Random) -> list:
+    """Создать сотрудников всех типов со случайными полями."""
+    employees = []
+    for emp_id in range(1, count + 1):
+        department = rng.choice(DEPARTMENTS)
+        base_salary = float(rng.randrange(1000, 10_000, 500))
+        kind = rng.choice(EMPLOYEE_TYPES)
+        if kind is Manager:
+            employees.append(Manager(emp_id, f"Менеджер {emp_id}", department, base_salary,
+                                     float(rng.randrange(0, 2000, 250))))
+        elif kind is Developer:
+            employees.append(Developer(emp_id, f"Разработчик {emp_id}", department, base_salary,
+                                       rng.sample(SKILLS, rng.randint(0, 3)),
+                                       rng.choice(["junior", "middle", "senior"])))
+        elif kind is Salesperson:
+            employees.append(Salesperson(emp_id, f"Продавец {emp_id}", department, base_salary,
+                                         rng.choice([0.05, 0.1]), float(rng.randrange(0, 20_000, 1000))))
+        else:
+            employees.append(Employee(emp_id, f"Сотрудник {emp_id}", department, base_salary))
+    return employees
+
+
+def random_specification(rng: random.Random, depth: int = 3) -> Specification:
+    """Построить случайное дерево спецификаций из всех видов узлов."""
+    if depth > 0 and rng.random() < 0.7:
+        kind = rng.choice(["and", "or", "not"])
+        if kind == "not":
+            return ~random_specification(rng, depth - 1)
+        left, right = random_specification(rng, depth - 1), random_specification(rng, depth - 1)
+        return left & right if kind == "and" else left | right
+    leaf = rng.randrange(5)
+    if leaf == 0:
+        low = float(rng.randrange(0, 20_000, 500))
+        return SalarySpecification(low, low + rng.choice([0, 500, 3000, float('inf')]))
+    if leaf == 1:
+        return DepartmentSpecification(rng.choice(DEPARTMENTS + ["MISSING"]))
+    if leaf == 2:
+        return SkillSpecification(rng.sample(SKILLS, rng.randint(1, 2)))
+    if leaf == 3:
+        return EmployeeTypeSpecification(rng.choice(EMPLOYEE_TYPES))
+    return IdDivisibleSpecification(rng.randint(2, 5))
+
+
+@pytest.fixture
+def employees():
+    """Двести сотрудников всех типов."""
+    return build_employees(200, random.Random(42))
@@ -0,0 +1,111 @@
+"""Тесты SqliteEmployeeRepository и перевода спецификаций в SQL."""
+
+import random
+import sqlite3
+import pytest
+from src.database.connection import DatabaseConnection
+from src.employees.developer import Developer
+from src.employees.manager import Manager
+from src.patterns.repository import SqliteEmployeeRepository
+from src.patterns.specification import DepartmentSpecification, SalarySpecification
+from tests.conftest import IdDivisibleSpecification, random_specification
+
+
+@pytest.fixture
+def database(tmp_path):
+    """Файл базы с таблицами DatabaseConnection."""
+    path = str(tmp_path / "employees.db")
+    DatabaseConnection.get_instance().get_connection(path)
+    yield path
+    DatabaseConnection.get_instance().reset_instance()
+
+
+@pytest.fixture(params=["row_factory", "plain"])
+def repository(request, database, employees):
+    """Репозиторий с сотрудниками на подключении с sqlite3.Row и на обычном sqlite3.connect."""
+    if request.param == "plain":
+        connection = sqlite3.connect(database)
+        request.addfinalizer(connection.close)
+    else:
+        connection = DatabaseConnection.get_instance().get_connection()
+    repository = SqliteEmployeeRepository(connection)
+    repository.add_all(employees)
+    return repository
+
+
+def as_dicts(employees) -> list:
+    """Сериализовать сотрудников для сравнения."""
+    return [emp.to_dict() for emp in employees]
+
+
+class TestSqliteEmployeeRepository:
+    """Тесты хранения сотрудников в SQLite."""
+    
+    def test_get_by_id_and_get_all(self, repository, employees):
+        """Тест чтения сотрудников всех типов."""
+        # Act
+        loaded = repository.get_all()
+        
+        # Assert
+        assert as_dicts(loaded) == as_dicts(employees)
+        assert repository.get_by_id(employees[5].id).to_dict() == employees[5].to_dict()
+        assert repository.get_by_id(10_000) is None
+    
+    def test_update_and_delete(self, repository, employees):
+        """Тест обновления и удаления сотрудника."""
+        # Arrange
+        developer = next(emp for emp in employees[1:] if isinstance(emp, Developer))
+        developer.add_skill("Haskell")
+        
+        # Act
+        repository.update(developer)
+        repository.delete(employees[0].id)
+        
+        # Assert
+        assert repository.get_by_id(developer.id).tech_stack == developer.tech_stack
+        assert repository.get_by_id(employees[0].id) is None
+        assert len(repository.get_all()) == len(employees) - 1
+    
+    def test_errors(self, repository, employees):
+        """Тест ошибок при дубликате и отсутствующем сотруднике."""
+        # Assert
+        with pytest.raises(ValueError):
+            repository.add(employees[0])
+        with pytest.raises(ValueError):
+            repository.update(Manager(10_000, "Ghost", "DEV", 1000, 100))
+        with pytest.raises(ValueError):
+            repository.delete(10_000)
+
+
+class TestSqlPushdown:
+    """Тесты совпадения условий WHERE с is_satisfied_by."""
+    
+    @pytest.mark.parametrize("seed", range(10))
+    def test_random_trees_match_is_satisfied_by(self, repository, employees, seed):
+        """Тест поиска в SQLite по случайным деревьям спецификаций."""
+        # Arrange
+        rng = random.Random(seed)
+        
+        for _ in range(10):
+            spec = random_specification(rng)
+            
+            # Act
+            found = repository.find_by_specification(spec)
+            
+            # Assert
+            assert as_dicts(found) == as_dicts(emp for emp in employees if spec.is_satisfied_by(emp))
+    
+    def test_to_sql_of_leaves_and_residual(self):
+        """Тест перевода узлов в SQL и отказа для непереводимых."""
+        # Arrange
+        spec = DepartmentSpecification("DEV") & SalarySpecification(min_salary=100)
+        
+        # Act
+        condition, params = spec.to_sql()
+        
+        # Assert
+        assert condition.startswith("(department = ?) AND (")
+        assert params == ["DEV", 100]
+        assert IdDivisibleSpecification(3).to_sql() is None
+        assert (spec & IdDivisibleSpecification(3)).to_sql() is None
+        assert len((spec & IdDivisibleSpecification(3)).conjuncts()) == 3
@@ -0,0 +1,147 @@
+"""Тесты истории зарплат и запросов на момент времени."""
+
+import pytest
+from datetime import date, datetime
+from src.core.company import Company
+from src.core.department import Department
+from src.core.employee import Employee
+from src.patterns import salary_history
+from src.patterns.command import UpdateSalaryCommand
+from src.patterns.salary_history import SalaryHistory
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Управляемое текущее время для событий без явного момента."""
+    now = {"value": datetime(2024, 1, 1).timestamp()}
+    monkeypatch.setattr(salary_history.time, "time", lambda: now["value"])
+    
+    def set_now(moment: datetime) -> None:
+        now["value"] = moment.timestamp()
+    
+    return set_now
+
+
+@pytest.fixture
+def company():
+    """Компания из двух отделов по два сотрудника."""
+    company = Company("HistoryCorp")
+    dev, sales = Department("DEV"), Department("SALES")
+    company.add_department(dev)
+    company.add_department(sales)
+    dev.add_employee(Employee(1, "Alice", "DEV", 1000))
+    dev.add_employee(Employee(2, "Bob", "DEV", 2000))
+    sales.add_employee(Employee(3, "Carol", "SALES", 3000))
+    sales.add_employee(Employee(4, "Dan", "SALES", 4000))
+    return company
+
+
+class TestSalaryHistory:
+    """Тесты журнала изменений зарплат."""
+    
+    def test_salary_as_of(self):
+        """Тест зарплаты на дату до, между и после изменений."""
+        # Arrange
+        history = SalaryHistory()
+        
+        # Act
+        history.record(1, 1000, 1500, date(2024, 3, 1))
+        history.record(1, 1500, 1800, datetime(2024, 6, 1, 12))
+        
+        # Assert
+        assert history.salary_as_of(1, date(2023, 12, 31)) == 1000
+        assert history.salary_as_of(1, date(2024, 3, 1)) == 1500
+        assert history.salary_as_of(1, datetime(2024, 6, 1, 11)) == 1500
+        assert history.salary_as_of(1, date(2024, 6, 1)) == 1800
+        assert history.salary_as_of(2, date(2024, 6, 1)) is None
+        assert [value for _, value in history.get_changes(1)] == [1500, 1800]
+    
+    def test_total_change_between(self):
+        """Тест изменения фонда за период по накопленным суммам."""
+        # Arrange
+        history = SalaryHistory()
+        history.record(1, 1000, 1500, date(2024, 1, 10))
+        history.record(2, 2000, 1900, date(2024, 2, 10))
+        history.record(1, 1500, 1600, date(2024, 3, 10))
+        
+        # Assert
+        assert history.total_change_between(date(2024, 1, 1), date(2024, 12, 31)) == 500
+        assert history.total_change_between(date(2024, 1, 31), date(2024, 2, 28)) == -100
+        assert len(history) == 3
+    
+    def test_rejects_out_of_order_records(self):
+        """Тест отказа записывать изменения задним числом."""
+        # Arrange
+        history = SalaryHistory()
+        history.record(1, 1000, 1500, date(2024, 3, 1))
+        
+        # Act & Assert
+        with pytest.raises(ValueError):
+            history.record(2, 2000, 2500, date(2024, 2, 1))
+    
+    def test_department_payroll_follows_membership(self, company, clock):
+        """Тест фонда отдела на дату с учетом найма, увольнения и перевода."""
+        # Arrange
+        history = SalaryHistory(company.get_departments())
+        dev = company._find_department_by_name("DEV")
+        sales = company._find_department_by_name("SALES")
+        
+        # Act
+        clock(datetime(2024, 2, 1))
+        dev.add_employee(Employee(5, "Eve", "DEV", 500))
+        clock(datetime(2024, 3, 1))
+        company.transfer_employee(3, "SALES", "DEV")
+        clock(datetime(2024, 4, 1))
+        dev.remove_employee(1)
+        history.record(2, 2000, 2500, datetime(2024, 4, 1))
+        
+        # Assert
+        assert history.department_payroll_as_of(dev, date(2024, 1, 15)) == 3000
+        assert history.department_payroll_as_of(dev, date(2024, 2, 15)) == 3500
+        assert history.department_payroll_as_of(dev, date(2024, 3, 15)) == 6500
+        assert history.department_payroll_as_of(dev, date(2024, 4, 15)) == 6000
+        assert history.department_payroll_as_of(sales, date(2024, 2, 15)) == 7000
+        assert history.department_payroll_as_of(sales, date(2024, 3, 15)) == 4000
+        assert history.company_payroll_as_of(company, date(2024, 1, 15)) == 10000
+    
+    def test_unwatched_department_uses_current_members(self, company):
+        """Тест: без наблюдения за отделом берется текущий состав."""
+        # Arrange
+        history = SalaryHistory()
+        dev = company._find_department_by_name("DEV")
+        history.record(1, 1000, 1200, date(2024, 3, 1))
+        
+        # Assert
+        assert history.department_payroll_as_of(dev, date(2024, 1, 1)) == 3000
+        assert history.department_payroll_as_of(dev, date(2024, 4, 1)) == 3200
+
+
+class TestUpdateSalaryCommandHistory:
+    """Тесты записи команд изменения зарплаты в журнал."""
+    
+    def test_execute_and_undo_are_recorded(self, company):
+        """Тест записи выполнения и отмены в журнал."""
+        # Arrange
+        history = SalaryHistory()
+        command = UpdateSalaryCommand(1, company, 1500, history)
+        
+        # Act
+        command.execute()
+        command.undo()
+        
+        # Assert
+        assert company.find_employee_by_id(1).base_salary == 1000
+        assert [value for _, value in history.get_changes(1)] == [1500, 1000]
+    
+    def test_salary_is_restored_when_history_rejects_record(self, company):
+        """Тест отката зарплаты, если журнал не принял запись."""
+        # Arrange
+        history = SalaryHistory()
+        history.record(2, 2000, 2100, datetime(2100, 1, 1))
+        command = UpdateSalaryCommand(1, company, 1500, history)
+        
+        # Act & Assert
+        with pytest.raises(ValueError):
+            command.execute()
+        assert company.find_employee_by_id(1).base_salary == 1000
+        assert history.salary_as_of(1, datetime(2100, 1, 1)) is None
@@ -0,0 +1,151 @@
+"""Тесты индекса навыков SkillIndex."""
+
+import random
+import pytest
+from src.core.department import Department
+from src.core.employee import Employee
+from src.employees.developer import Developer
+from src.patterns.skill_index import SkillIndex
+from src.patterns.specification import SkillSpecification, SalarySpecification
+
+
+SKILLS = ["Python", "Kafka", "PHP", "Go", "Docker"]
+
+
+def developer(emp_id: int, department: str, skills: list) -> Developer:
+    """Создать разработчика с заданным стеком."""
+    return Developer(emp_id, f"Dev {emp_id}", department, 1000 * emp_id, skills, "middle")
+
+
+@pytest.fixture
+def departments():
+    """Два отдела с разработчиками и одним сотрудником без стека."""
+    dev, ops = Department("DEV"), Department("OPS")
+    dev.add_employee(developer(1, "DEV", ["Python", "Kafka"]))
+    dev.add_employee(developer(2, "DEV", ["Python", "PHP"]))
+    dev.add_employee(Employee(3, "Plain", "DEV", 500))
+    ops.add_employee(developer(4, "OPS", ["Go", "Kafka"]))
+    return dev, ops
+
+
+def ids(employees) -> set:
+    """Множество ID сотрудников."""
+    return {emp.id for emp in employees}
+
+
+class TestSkillIndex:
+    """Тесты поддержки индекса по уведомлениям и запросов."""
+    
+    def test_find_and_count(self, departments):
+        """Тест запросов AND/OR/NOT по навыкам."""
+        # Arrange
+        index = SkillIndex(departments)
+        
+        # Assert
+        assert len(index) == 4
+        assert ids(index.find(all_of=["Python", "Kafka"])) == {1}
+        assert ids(index.find(any_of=["PHP", "Go"])) == {2, 4}
+        assert ids(index.find(all_of=["Kafka"], none_of=["Go"])) == {1}
+        assert ids(index.find(none_of=["Python"])) == {3, 4}
+        assert index.count(all_of=["Kafka"]) == 2
+        assert index.get_skill_counts() == {"Python": 2, "Kafka": 2, "PHP": 1, "Go": 1}
+    
+    def test_hire_fire_and_add_skill_update_index(self, departments):
+        """Тест обновления индекса при найме, увольнении и добавлении навыка."""
+        # Arrange
+        dev, ops = departments
+        index = SkillIndex(departments)
+        newcomer = developer(5, "OPS", ["Docker"])
+        fired = dev.find_employee_by_id(1)
+        
+        # Act
+        ops.add_employee(newcomer)
+        dev.remove_employee(1)
+        newcomer.add_skill("Python")
+        fired.add_skill("Go")
+        
+        # Assert
+        assert ids(index.find(all_of=["Python"])) == {2, 5}
+        assert ids(index.find(all_of=["Kafka"])) == {4}
+        assert ids(index.find(all_of=["Go"])) == {4}
+        assert len(index) == 4
+    
+    def test_freed_slot_is_reused(self, departments):
+        """Тест повторного использования слота уволенного сотрудника."""
+        # Arrange
+        dev, _ = departments
+        index = SkillIndex(departments)
+        
+        # Act
+        dev.remove_employee(2)
+        dev.add_employee(developer(6, "DEV", ["Go"]))
+        
+        # Assert
+        assert ids(index.find(all_of=["PHP"])) == set()
+        assert ids(index.find(all_of=["Go"])) == {4, 6}
+        assert len(index) == 4
+    
+    def test_employee_in_two_departments(self, departments):
+        """Тест: сотрудник остается в индексе, пока состоит хотя бы в одном отделе."""
+        # Arrange
+        dev, ops = departments
+        index = SkillIndex(departments)
+        shared = dev.find_employee_by_id(1)
+        
+        # Act
+        ops.add_employee(shared)
+        dev.remove_employee(1)
+        
+        # Assert
+        assert ids(index.find(all_of=["Python", "Kafka"])) == {1}
+        assert len(index) == 4
+        
+        # Act
+        ops.remove_employee(1)
+        
+        # Assert
+        assert ids(index.find(all_of=["Kafka"])) == {4}
+        assert len(index) == 3
+    
+    def test_unwatch_removes_only_that_department(self, departments):
+        """Тест снятия отдела с наблюдения."""
+        # Arrange
+        dev, ops = departments
+        index = SkillIndex(departments)
+        
+        # Act
+        index.unwatch(ops)
+        ops.add_employee(developer(7, "OPS", ["Python"]))
+        
+        # Assert
+        assert ids(index.find(all_of=["Python"])) == {1, 2}
+        assert ids(index.find(all_of=["Go"])) == set()
+    
+    def test_find_by_specification_matches_scan(self):
+        """Тест совпадения поиска по спецификации с перебором после случайных изменений."""
+        # Arrange
+        rng = random.Random(7)
+        departments = [Department(f"D{i}") for i in range(3)]
+        index = SkillIndex(departments)
+        for emp_id in range(1, 200):
+            dept = rng.choice(departments)
+            dept.add_employee(developer(emp_id, dept.name, rng.sample(SKILLS, rng.randint(0, 3))))
+        for _ in range(100):
+            dept = rng.choice(departments)
+            employees = dept.get_employees()
+            if employees and rng.random() < 0.5:
+                dept.remove_employee(rng.choice(employees).id)
+            elif employees:
+                rng.choice(employees).add_skill(rng.choice(SKILLS))
+        python, kafka, php = (SkillSpecification([skill]) for skill in ("Python", "Kafka", "PHP"))
+        specs = [
+            python & kafka & ~php,
+            (python | SkillSpecification(["Go"])) & ~SkillSpecification(["Docker"]),
+            ~(kafka | php) & SalarySpecification(min_salary=50_000),
+        ]
+        everyone = [emp for dept in departments for emp in dept]
+        
+        # Assert
+        for spec in specs:
+            expected = ids(emp for emp in everyone if spec.is_satisfied_by(emp))
+            assert ids(index.find_by_specification(spec)) == expected
@@ -0,0 +1,226 @@
+"""Тесты спецификаций: скомпилированные маски и репозиторий против is_satisfied_by."""
+
+import random
+import pytest
+from src.core.abstract_employee import AbstractEmployee
+from src.core.employee import Employee
+from src.employees.developer import Developer
+from src.employees.manager import Manager
+from src.patterns.observer import ObservableEmployee
+from src.patterns.specification import (
+    EmployeeColumns, SalarySpecification, DepartmentSpecification, SkillSpecification,
+    EmployeeTypeSpecification, SpecificationRepository
+)
+from src.utils.exceptions import StaleDataError
+from tests.conftest import random_specification
+
+
+class PlainEmployee(AbstractEmployee):
+    """Сотрудник с открытыми полями, не уведомляющий об изменениях."""
+    
+    def __init__(self, id: int, department: str, base_salary: float):
+        self.id = id
+        self.name = f"Plain {id}"
+        self.department = department
+        self.base_salary = base_salary
+    
+    def calculate_salary(self) -> float:
+        return self.base_salary
+    
+    def get_info(self) -> str:
+        return self.name
+
+
+def expected_by_scan(spec, employees) -> list:
+    """Отфильтровать сотрудников рекурсивной проверкой по объектам."""
+    return [emp for emp in employees if spec.is_satisfied_by(emp)]
+
+
+class TestCompiledSpecification:
+    """Тесты компиляции дерева спецификаций в маски по колонкам."""
+    
+    @pytest.mark.parametrize("seed", range(20))
+    def test_random_trees_match_is_satisfied_by(self, employees, seed):
+        """Тест совпадения скомпилированных масок с is_satisfied_by на случайных деревьях."""
+        # Arrange
+        rng = random.Random(seed)
+        columns = EmployeeColumns(employees)
+        
+        for _ in range(10):
+            spec = random_specification(rng)
+            
+            # Act
+            compiled = spec.compile()
+            
+            # Assert
+            expected = expected_by_scan(spec, employees)
+            assert compiled.filter(columns) == expected
+            assert compiled.count(columns) == len(expected)
+    
+    def test_salary_bounds_are_inclusive(self, employees):
+        """Тест включения границ диапазона зарплаты."""
+        # Arrange
+        columns = EmployeeColumns(employees)
+        salary = employees[0].calculate_salary()
+        spec = SalarySpecification(salary, salary)
+        
+        # Act
+        found = spec.compile().filter(columns)
+        
+        # Assert
+        assert employees[0] in found
+        assert found == expected_by_scan(spec, employees)
+    
+    def test_empty_columns(self):
+        """Тест компиляции над пустым набором сотрудников."""
+        # Arrange
+        columns = EmployeeColumns([])
+        spec = ~(DepartmentSpecification("DEV") | SkillSpecification(["Python"]))
+        
+        # Assert
+        assert spec.compile().filter(columns) == []
+        assert EmployeeTypeSpecification(Developer).compile().count(columns) == 0
+
+
+class TestSpecificationRepository:
+    """Тесты индексов, плана поиска и кэша репозитория."""
+    
+    @pytest.mark.parametrize("seed", range(20))
+    def test_random_trees_match_is_satisfied_by(self, employees, seed):
+        """Тест совпадения поиска по индексам и из кэша с перебором."""
+        # Arrange
+        rng = random.Random(seed)
+        repository = SpecificationRepository(employees, cache_size=4)
+        
+        for _ in range(10):
+            spec = random_specification(rng)
+            expected = expected_by_scan(spec, employees)
+            
+            # Act & Assert
+            assert repository.find_by_specification(spec) == expected
+            assert repository.find_by_specification(spec) == expected
+    
+    def test_changes_through_add_remove_update(self, employees):
+        """Тест согласованности после add, remove и update."""
+        # Arrange
+        repository = SpecificationRepository(list(employees))
+        spec = DepartmentSpecification("DEV") & SalarySpecification(min_salary=5000)
+        repository.find_by_specification(spec)
+        newcomer = Employee(1000, "Newcomer", "DEV", 9000)
+        changed = next(emp for emp in employees[2:] if type(emp) is Employee)
+        
+        # Act
+        repository.add(newcomer)
+        repository.remove(employees[1])
+        changed.department = "DEV"
+        changed.base_salary = 6000
+        repository.update(changed)
+        
+        # Assert
+        current = [emp for emp in employees if emp is not employees[1]] + [newcomer]
+        assert repository.find_by_specification(spec) == expected_by_scan(spec, current)
+        assert len(repository) == len(employees)
+    
+    def test_explain_uses_most_selective_index(self, employees):
+        """Тест выбора самого селективного индекса."""
+        # Arrange
+        repository = SpecificationRepository(employees)
+        spec = SkillSpecification(["Python", "Go", "Rust"]) & SalarySpecification(min_salary=0)
+        
+        # Act
+        plan = repository.explain(spec)
+        
+        # Assert
+        assert plan["indexes"] == ["SkillSpecification"]
+        assert plan["filters"] == ["SalarySpecification"]
+        assert plan["cached"] is False
+    
+    def test_notifications_reindex_employees(self, employees):
+        """Тест переиндексации по уведомлениям Developer и ObservableEmployee."""
+        # Arrange
+        observable = ObservableEmployee(Employee(1000, "Observed", "QA", 1000))
+        repository = SpecificationRepository(employees + [observable])
+        developer = next(emp for emp in employees if isinstance(emp, Developer))
+        haskell = SkillSpecification(["Haskell"])
+        rich = SalarySpecification(min_salary=50_000)
+        assert repository.find_by_specification(haskell) == []
+        assert repository.find_by_specification(rich) == []
+        
+        # Act
+        developer.add_skill("Haskell")
+        observable.set_base_salary(60_000)
+        
+        # Assert
+        assert repository.find_by_specification(haskell) == [developer]
+        assert repository.find_by_specification(rich) == [observable]
+    
+    def test_removed_developer_is_not_reindexed(self, employees):
+        """Тест отписки от сотрудника при удалении из репозитория."""
+        # Arrange
+        repository = SpecificationRepository(employees)
+        developer = next(emp for emp in employees if isinstance(emp, Developer))
+        repository.remove(developer)
+        
+        # Act
+        developer.add_skill("Haskell")
+        
+        # Assert
+        assert repository.find_by_specification(SkillSpecification(["Haskell"])) == []
+    
+    def test_setter_changes_reindex_employees(self):
+        """Тест: изменения через сеттеры Employee и Manager видны без update."""
+        # Arrange
+        employee = Employee(1, "A", "DEV", 1000.0)
+        manager = Manager(2, "B", "QA", 1000.0, 100.0)
+        repository = SpecificationRepository([employee, manager])
+        by_salary = SalarySpecification(4000, 6000)
+        by_department = DepartmentSpecification("OPS")
+        assert repository.find_by_specification(by_salary) == []
+        
+        # Act
+        employee.base_salary = 5000
+        manager.department = "OPS"
+        manager.bonus = 4000
+        
+        # Assert
+        assert repository.find_by_specification(by_salary) == [employee, manager]
+        assert repository.find_by_specification(by_department) == [manager]
+        assert repository.find_by_specification(DepartmentSpecification("QA")) == []
+    
+    def test_unobservable_employees_are_scanned(self, employees):
+        """Тест: сотрудники без уведомлений проверяются перебором при каждом поиске."""
+        # Arrange
+        plain = PlainEmployee(1000, "DEV", 3000.0)
+        source = employees[:100] + [plain] + employees[100:]
+        repository = SpecificationRepository(source)
+        spec = DepartmentSpecification("DEV") & SalarySpecification(min_salary=3000)
+        assert repository.find_by_specification(spec) == expected_by_scan(spec, source)
+        
+        # Act
+        plain.department = "OPS"
+        without_plain = repository.find_by_specification(spec)
+        plain.department = "DEV"
+        
+        # Assert
+        assert without_plain == expected_by_scan(spec, [emp for emp in source if emp is not plain])
+        assert repository.find_by_specification(spec) == expected_by_scan(spec, source)
+        assert plain in repository.find_by_specification(spec)
+        assert repository.get_statistics()["unobserved"] == 1
+    
+    def test_source_list_appends_are_indexed(self, employees):
+        """Тест индексации сотрудников, дописанных в исходный список."""
+        # Arrange
+        source = list(employees)
+        repository = SpecificationRepository(source)
+        spec = DepartmentSpecification("NEW")
+        assert repository.find_by_specification(spec) == []
+        
+        # Act
+        source.append(Employee(1000, "Appended", "NEW", 1000))
+        
+        # Assert
+        assert repository.find_by_specification(spec) == [source[-1]]
+        source.pop()
+        source.pop()
+        with pytest.raises(StaleDataError):
+            repository.find_by_specification(spec)
@@ -0,0 +1,54 @@
+"""
+Бенчмарк массовой реорганизации.
+
+Сравнивает перенос сотрудников циклом вызовов transfer_employee
+с одним вызовом bulk_transfer на том же наборе переносов.
+
+Запуск из каталога python-lab8:
+    python -m benchmarks.bench_bulk_transfer --count 200000 --moves 100000
+"""
+
+import argparse
+import gc
+import random
+import time
+from benchmarks.bench_snapshot import build_company
+
+
+def plan_moves(company, moves: int, seed: int = 42):
+    """Выбрать случайных сотрудников и целевые отделы."""
+    rng = random.Random(seed)
+    names = [dept.name for dept in company.get_departments()]
+    employee_ids = rng.sample([emp.id for emp in company.iter_all_employees()], moves)
+    return [(emp_id, rng.choice(names)) for emp_id in employee_ids]
+
+
+def per_call(company, moves) -> None:
+    """Перенести сотрудников по одному."""
+    for emp_id, to_dept in moves:
+        from_dept = company.find_employee_department(emp_id).name
+        if from_dept != to_dept:
+            company.transfer_employee(emp_id, from_dept, to_dept)
+
+
+def main() -> None:
+    """Точка входа бенчмарка."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=200_000, help="Количество сотрудников")
+    parser.add_argument("--moves", type=int, default=100_000, help="Количество переносов")
+    args = parser.parse_args()
+    
+    for label, apply in [("transfer_employee в цикле", per_call),
+                         ("bulk_transfer", lambda company, moves: company.bulk_transfer(moves))]:
+        company = moves = None
+        gc.collect()  # Предыдущая компания не должна нагружать сборщик мусора
+        company = build_company(args.count, projects=0)
+        moves = plan_moves(company, args.moves)
+        start = time.perf_counter()
+        apply(company, moves)
+        elapsed = time.perf_counter() - start
+        print(f"{label:<28} {elapsed:8.3f} с  {args.moves / elapsed:12,.0f} переносов/с")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Бенчмарк пропускной способности компании под многопоточной нагрузкой.
+
+Сравнивает общую блокировку читателей-писателей (ReadWriteLock) с одной
+глобальной блокировкой (ExclusiveLock) на смеси операций: по умолчанию
+90% чтений (поиск сотрудника, статистика отделов, месячные затраты)
+и 10% записей (перенос сотрудника между отделами).
+
+Под GIL чистые вычисления не выполняются параллельно, поэтому выигрыш
+ReadWriteLock проявляется, когда читатель удерживает блокировку во время
+ввода-вывода (например, отправки ответа). Это моделирует --hold-ms.
+
+Запуск из каталога python-lab8:
+    python -m benchmarks.bench_concurrency --count 20000 --threads 8
+    python -m benchmarks.bench_concurrency --hold-ms 1 --operations 500
+"""
+
+import argparse
+import random
+import threading
+import time
+from benchmarks.bench_snapshot import build_company
+from src.utils.exceptions import EmployeeNotFoundError
+from src.utils.locks import ReadWriteLock, ExclusiveLock
+
+
+def worker(company, count: int, operations: int, write_ratio: float, hold: float, seed: int) -> None:
+    """Выполнить смесь операций чтения и записи."""
+    rng = random.Random(seed)
+    names = [dept.name for dept in company.get_departments()]
+    for _ in range(operations):
+        emp_id = rng.randint(1, count)
+        if rng.random() < write_ratio:
+            source = company.find_employee_department(emp_id)
+            try:
+                company.transfer_employee(emp_id, source.name, rng.choice(names))
+            except EmployeeNotFoundError:
+                pass  # Сотрудника уже перенес другой поток
+        elif hold:
+            with company.read_transaction():
+                company.find_employee_by_id(emp_id)
+                company.get_department_stats()
+                time.sleep(hold)  # Ответ клиенту под согласованным чтением
+        else:
+            kind = emp_id % 3
+            if kind == 0:
+                company.find_employee_by_id(emp_id)
+            elif kind == 1:
+                company.get_department_stats()
+            else:
+                company.calculate_total_monthly_cost()
+
+
+def run(lock_cls, args) -> float:
+    """Прогнать нагрузку и вернуть число операций в секунду."""
+    company = build_company(args.count, projects=0, lock=lock_cls())
+    threads = [
+        threading.Thread(target=worker, args=(company, args.count, args.operations,
+                                               args.write_ratio, args.hold_ms / 1000, seed))
+        for seed in range(args.threads)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return args.threads * args.operations / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Точка входа бенчмарка."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=20_000, help="Количество сотрудников")
+    parser.add_argument("--threads", type=int, default=8, help="Количество потоков")
+    parser.add_argument("--operations", type=int, default=20_000, help="Операций на поток")
+    parser.add_argument("--write-ratio", type=float, default=0.1, help="Доля операций записи")
+    parser.add_argument("--hold-ms", type=float, default=0.0,
+                        help="Время удержания блокировки чтения на ввод-вывод, мс")
+    args = parser.parse_args()
+    
+    for label, lock_cls in [("ExclusiveLock (глобальная)", ExclusiveLock),
+                            ("ReadWriteLock", ReadWriteLock)]:
+        print(f"{label:<30} {run(lock_cls, args):12,.0f} опер/с")
+
+
+if __name__ == "__main__":
+    main()
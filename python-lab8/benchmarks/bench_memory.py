@@ -0,0 +1,116 @@
+"""
+Бенчмарк памяти объектов сотрудников (tracemalloc).
+
+Сравнивает текущие слотовые классы с прежней раскладкой: атрибуты
+в __dict__ экземпляра, собственный список tech_stack у каждого разработчика
+и неинтернированные строки, прочитанные из внешнего источника.
+
+Запуск из каталога python-lab8:
+    python -m benchmarks.bench_memory --count 1000000
+"""
+
+import argparse
+import gc
+import tracemalloc
+from typing import Callable, List
+from src.core.employee import Employee
+from src.employees.manager import Manager
+from src.employees.developer import Developer
+from src.employees.salesperson import Salesperson
+
+DEPARTMENTS = ["Development", "Sales", "Support", "Research"]
+LEVELS = ["junior", "middle", "senior"]
+STACKS = [["Python", "SQL"], ["Java", "Kafka"], ["Python", "Django", "PostgreSQL"], ["Go"]]
+
+
+def _fresh(value: str) -> str:
+    """Получить новую (неинтернированную) копию строки, как после парсинга JSON."""
+    return "".join(list(value))
+
+
+class _LegacyEmployee:
+    """Прежняя раскладка Employee: name-mangled атрибуты в __dict__."""
+    
+    def __init__(self, id, name, department, base_salary):
+        self.__id = id
+        self.__name = name
+        self.__department = department
+        self.__base_salary = base_salary
+
+
+class _LegacyManager(_LegacyEmployee):
+    """Прежняя раскладка Manager."""
+    
+    def __init__(self, id, name, department, base_salary, bonus):
+        super().__init__(id, name, department, base_salary)
+        self.__bonus = bonus
+
+
+class _LegacyDeveloper(_LegacyEmployee):
+    """Прежняя раскладка Developer: собственный список технологий."""
+    
+    def __init__(self, id, name, department, base_salary, tech_stack, seniority_level):
+        super().__init__(id, name, department, base_salary)
+        self.__tech_stack = list(tech_stack)
+        self.__seniority_level = seniority_level
+
+
+class _LegacySalesperson(_LegacyEmployee):
+    """Прежняя раскладка Salesperson."""
+    
+    def __init__(self, id, name, department, base_salary, commission_rate, sales_volume):
+        super().__init__(id, name, department, base_salary)
+        self.__commission_rate = commission_rate
+        self.__sales_volume = sales_volume
+
+
+def build(count: int, employee, manager, developer, salesperson) -> List:
+    """Создать count сотрудников всех типов указанными конструкторами."""
+    result = []
+    for i in range(1, count + 1):
+        dept = _fresh(DEPARTMENTS[i % len(DEPARTMENTS)])
+        name = f"Employee {i}"
+        kind = i % 4
+        if kind == 0:
+            result.append(employee(i, name, dept, 5000.0))
+        elif kind == 1:
+            result.append(manager(i, name, dept, 7000.0, 1500.0))
+        elif kind == 2:
+            stack = [_fresh(skill) for skill in STACKS[i % len(STACKS)]]
+            result.append(developer(i, name, dept, 6000.0, stack, _fresh(LEVELS[i % len(LEVELS)])))
+        else:
+            result.append(salesperson(i, name, dept, 4000.0, 0.1, 25000.0))
+    return result
+
+
+def measure(factory: Callable[[], List]) -> int:
+    """Измерить объем памяти, занятый результатом factory()."""
+    gc.collect()
+    tracemalloc.start()
+    objects = factory()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    gc.collect()
+    return current
+
+
+def main() -> None:
+    """Точка входа бенчмарка."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=1_000_000, help="Количество сотрудников")
+    args = parser.parse_args()
+    
+    before = measure(lambda: build(args.count, _LegacyEmployee, _LegacyManager,
+                                   _LegacyDeveloper, _LegacySalesperson))
+    after = measure(lambda: build(args.count, Employee, Manager, Developer, Salesperson))
+    
+    mb = 1024 * 1024
+    print(f"Сотрудников: {args.count}")
+    print(f"До (__dict__, списки):       {before / mb:10.1f} МБ ({before / args.count:6.1f} Б/объект)")
+    print(f"После (__slots__, интерн.):  {after / mb:10.1f} МБ ({after / args.count:6.1f} Б/объект)")
+    print(f"Экономия: {(1 - after / before) * 100:.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Бенчмарк десериализации сотрудников.
+
+Сравнивает прежний разбор записи (импорты модулей при каждом вызове
+и цепочка if/elif) с реестром типов и измеряет полную загрузку
+компании через Company.from_dict.
+
+Запуск из каталога python-lab8:
+    python -m benchmarks.bench_registry --count 500000
+"""
+
+import argparse
+import gc
+import time
+from src.core.company import Company
+from src.core.registry import employee_from_dict
+from benchmarks.bench_snapshot import build_company
+
+
+def legacy_employee_from_dict(data: dict):
+    """Разбор записи в том виде, в каком он был до реестра типов."""
+    from src.core.employee import Employee
+    from src.employees.manager import Manager
+    from src.employees.developer import Developer
+    from src.employees.salesperson import Salesperson
+    
+    emp_type = data.get("type", "Employee")
+    
+    if emp_type == "Manager":
+        return Manager(
+            id=data["id"],
+            name=data["name"],
+            department=data["department"],
+            base_salary=data["base_salary"],
+            bonus=data.get("bonus", 0)
+        )
+    elif emp_type == "Developer":
+        return Developer(
+            id=data["id"],
+            name=data["name"],
+            department=data["department"],
+            base_salary=data["base_salary"],
+            tech_stack=data.get("tech_stack", []),
+            seniority_level=data.get("seniority_level", "junior")
+        )
+    elif emp_type == "Salesperson":
+        return Salesperson(
+            id=data["id"],
+            name=data["name"],
+            department=data["department"],
+            base_salary=data["base_salary"],
+            commission_rate=data.get("commission_rate", 0),
+            sales_volume=data.get("sales_volume", 0)
+        )
+    else:
+        return Employee.from_dict(data)
+
+
+def measure(label: str, func, count: int) -> None:
+    """Замерить функцию и вывести скорость."""
+    gc.collect()
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<32} {elapsed:8.3f} с  {count / elapsed:12,.0f} записей/с")
+
+
+def main() -> None:
+    """Точка входа бенчмарка."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=500_000, help="Количество сотрудников")
+    args = parser.parse_args()
+    
+    with build_company(args.count, projects=0).snapshot() as snapshot:
+        data = snapshot.to_dict()
+    records = [record for dept in data["departments"] for record in dept["employees"]]
+    
+    measure("if/elif с импортами", lambda: [legacy_employee_from_dict(r) for r in records], len(records))
+    measure("реестр типов", lambda: [employee_from_dict(r) for r in records], len(records))
+    measure("Company.from_dict", lambda: Company.from_dict(data), len(records))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Бенчмарк запросов top-k и процентилей зарплат.
+
+Сравнивает сортировку копии всех сотрудников через __lt__
+(дважды calculate_salary на сравнение) с запросами компании
+по кэшу зарплат.
+
+Запуск из каталога python-lab8:
+    python -m benchmarks.bench_salary_queries --count 500000
+"""
+
+import argparse
+import time
+from benchmarks.bench_snapshot import build_company
+
+
+def measure(label: str, func) -> None:
+    """Замерить функцию и вывести время."""
+    start = time.perf_counter()
+    func()
+    print(f"{label:<44} {time.perf_counter() - start:8.3f} с")
+
+
+def sorted_percentiles(company, points):
+    """Процентили через полную сортировку сотрудников."""
+    employees = sorted(company.get_all_employees())
+    return {point: employees[round((len(employees) - 1) * point / 100)].calculate_salary() for point in points}
+
+
+def main() -> None:
+    """Точка входа бенчмарка."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=500_000, help="Количество сотрудников")
+    parser.add_argument("--k", type=int, default=100, help="Размер top-k")
+    args = parser.parse_args()
+    
+    company = build_company(args.count, projects=0)
+    points = (50, 90, 99)
+    
+    measure("top-k: sorted(get_all_employees())", lambda: sorted(company.get_all_employees(), reverse=True)[:args.k])
+    measure("top-k: get_top_earners", lambda: company.get_top_earners(args.k))
+    measure("top-k по отделам: get_top_earners", lambda: company.get_top_earners(args.k, by="department"))
+    measure("процентили: sorted(get_all_employees())", lambda: sorted_percentiles(company, points))
+    measure("процентили: get_salary_percentiles", lambda: company.get_salary_percentiles(points))
+    measure("процентили по типам: get_salary_percentiles", lambda: company.get_salary_percentiles(points, by="type"))
+    measure("процентили приближенно", lambda: company.get_salary_percentiles(points, approximate=True))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Бенчмарк моделирования сценариев зарплат.
+
+Сравнивает прежний способ (копия компании и изменение сеттерами)
+с векторным расчетом сценариев в одном процессе и в пуле процессов.
+
+Запуск из каталога python-lab8:
+    python -m benchmarks.bench_scenarios --count 500000 --scenarios 24 --processes 4
+"""
+
+import argparse
+import time
+from src.core.company import Company
+from src.payroll.columnar import PayrollFrame
+from src.payroll.scenarios import Adjustment, Scenario, run_scenarios
+from benchmarks.bench_snapshot import build_company
+
+
+def make_scenarios(count: int, departments):
+    """Построить набор сценариев повышения и ограничения бонусов."""
+    scenarios = []
+    for i in range(count):
+        department = departments[i % len(departments)]
+        scenarios.append(Scenario(f"scenario_{i}", (
+            Adjustment("base_salary", "scale", 1 + (i % 10) / 100, employee_type="Developer",
+                       department=department, seniority="senior"),
+            Adjustment("bonus", "cap", 1000 + 100 * i),
+        )))
+    return scenarios
+
+
+def clone_and_mutate(company, scenario) -> float:
+    """Рассчитать сценарий на копии компании через сеттеры."""
+    with company.snapshot() as snapshot:
+        clone = Company.from_dict(snapshot.to_dict())
+    for adjustment in scenario.adjustments:
+        for dept in clone.get_departments():
+            if adjustment.department not in (None, dept.name):
+                continue
+            for emp in dept:
+                if adjustment.employee_type not in (None, type(emp).__name__):
+                    continue
+                if adjustment.seniority not in (None, getattr(emp, "seniority_level", None)):
+                    continue
+                if not hasattr(emp, adjustment.field):
+                    continue
+                current = getattr(emp, adjustment.field)
+                if adjustment.operation == "scale":
+                    setattr(emp, adjustment.field, current * adjustment.value)
+                elif adjustment.operation == "cap":
+                    setattr(emp, adjustment.field, min(current, adjustment.value))
+    return clone.calculate_total_monthly_cost()
+
+
+def measure(label: str, func, scenarios: int):
+    """Замерить функцию и вывести время на сценарий."""
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<40} {elapsed:8.3f} с  {elapsed / scenarios * 1000:10.1f} мс/сценарий")
+    return result
+
+
+def main() -> None:
+    """Точка входа бенчмарка."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=500_000, help="Количество сотрудников")
+    parser.add_argument("--scenarios", type=int, default=24, help="Количество сценариев")
+    parser.add_argument("--processes", type=int, default=4, help="Размер пула процессов")
+    parser.add_argument("--clone-scenarios", type=int, default=1,
+                        help="Сколько сценариев считать через копию компании")
+    args = parser.parse_args()
+    
+    company = build_company(args.count, projects=0)
+    scenarios = make_scenarios(args.scenarios, [dept.name for dept in company.get_departments()])
+    
+    cloned = measure("копия компании + сеттеры",
+                     lambda: [clone_and_mutate(company, s) for s in scenarios[:args.clone_scenarios]],
+                     args.clone_scenarios)
+    frame = measure("построение PayrollFrame", lambda: PayrollFrame.from_company(company), 1)
+    sequential = measure("векторно, один процесс", lambda: run_scenarios(frame, scenarios), args.scenarios)
+    measure(f"векторно, пул из {args.processes} процессов",
+            lambda: run_scenarios(frame, scenarios, processes=args.processes), args.scenarios)
+    for total, result in zip(cloned, sequential):
+        assert abs(total - result.total_cost) <= 1e-6 * total
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Бенчмарк холодного старта из снимков компании.
+
+Сравнивает время загрузки JSON (load_from_json), потокового NDJSON
+(load_from_ndjson) и бинарного снимка (open_binary): открытие с поиском
+одного сотрудника и полную материализацию через to_company().
+
+Запуск из каталога python-lab8:
+    python -m benchmarks.bench_snapshot --count 200000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from src.core.company import Company
+from src.core.department import Department
+from src.core.employee import Employee
+from src.core.project import Project
+from src.employees.manager import Manager
+from src.employees.developer import Developer
+from src.employees.salesperson import Salesperson
+
+STACKS = [["Python", "SQL"], ["Java", "Kafka"], ["Go"]]
+LEVELS = ["junior", "middle", "senior"]
+
+
+def build_company(count: int, departments: int = 20, projects: int = 100, lock=None) -> Company:
+    """Создать компанию с count сотрудниками и проектами."""
+    company = Company("BenchCorp", lock=lock)
+    depts = [Department(f"Dept {i}") for i in range(departments)]
+    for dept in depts:
+        company.add_department(dept)
+    batches = [[] for _ in depts]
+    for i in range(1, count + 1):
+        dept = depts[i % departments]
+        kind = i % 4
+        if kind == 0:
+            emp = Employee(i, f"Employee {i}", dept.name, 5000.0)
+        elif kind == 1:
+            emp = Manager(i, f"Employee {i}", dept.name, 7000.0, 1500.0)
+        elif kind == 2:
+            emp = Developer(i, f"Employee {i}", dept.name, 6000.0, STACKS[i % 3], LEVELS[i % 3])
+        else:
+            emp = Salesperson(i, f"Employee {i}", dept.name, 4000.0, 0.1, 25000.0)
+        batches[i % departments].append(emp)
+    for dept, batch in zip(depts, batches):
+        dept.add_employees(batch)
+    for p in range(1, projects + 1):
+        company.add_project(Project(p, f"Project {p}", "Bench", "2030-01-01", "active"))
+        for emp_id in range(p, count + 1, max(1, count // 50)):
+            company.assign_employee_to_project(emp_id, p)
+    return company
+
+
+def timed(label: str, func) -> None:
+    """Выполнить func и напечатать время."""
+    start = time.perf_counter()
+    func()
+    print(f"{label:<40} {time.perf_counter() - start:8.3f} с")
+
+
+def main() -> None:
+    """Точка входа бенчмарка."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=200_000, help="Количество сотрудников")
+    args = parser.parse_args()
+    
+    company = build_company(args.count)
+    probe_id = args.count // 2
+    with tempfile.TemporaryDirectory() as tmp:
+        json_file = os.path.join(tmp, "company.json")
+        ndjson_file = os.path.join(tmp, "company.ndjson")
+        binary_file = os.path.join(tmp, "company.bin")
+        company.save_to_json(json_file)
+        company.save_to_ndjson(ndjson_file)
+        company.save_to_binary(binary_file)
+        for path in (json_file, ndjson_file, binary_file):
+            print(f"{os.path.basename(path):<16} {os.path.getsize(path) / 1024 / 1024:8.1f} МБ")
+        
+        def open_and_probe():
+            with Company.open_binary(binary_file) as mapped:
+                assert mapped.find_employee_by_id(probe_id) is not None
+        
+        def open_and_materialize():
+            with Company.open_binary(binary_file) as mapped:
+                mapped.to_company()
+        
+        print(f"Сотрудников: {args.count}")
+        timed("load_from_json", lambda: Company.load_from_json(json_file))
+        timed("load_from_ndjson", lambda: Company.load_from_ndjson(ndjson_file))
+        timed("open_binary + find_employee_by_id", open_and_probe)
+        timed("open_binary + to_company", open_and_materialize)
+
+
+if __name__ == "__main__":
+    main()
@@ -14,6 +14,8 @@ class AbstractEmployee(ABC):
     Определяет общий интерфейс для работы с сотрудниками.
     """
     
+    __slots__ = ()
+    
     @abstractmethod
     def calculate_salary(self) -> float:
         """
@@ -33,5 +35,15 @@ class AbstractEmployee(ABC):
             Строка с полной информацией
         """
         pass
-
-
+    
+    def _attach_observer(self, observer) -> None:
+        """
+        Подписать контейнер (отдел, проект) на изменения сотрудника.
+        
+        По умолчанию сотрудник не сообщает об изменениях.
+        """
+        pass
+    
+    def _detach_observer(self, observer) -> None:
+        """Отписать контейнер от изменений сотрудника."""
+        pass
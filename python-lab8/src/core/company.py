@@ -1,15 +1,25 @@
 """Класс Company (Компания) с агрегацией отделов и проектов."""
 
+import heapq
 import json
-import csv
-from typing import List, Optional, Dict
+import math
+import random
+import weakref
+from contextlib import nullcontext
+from bisect import bisect_left, bisect_right, insort
+from datetime import date, datetime, timedelta
+from itertools import chain, islice
+from types import MappingProxyType
+from typing import List, Optional, Dict, Tuple, Union, Iterator, Mapping, Iterable
 from src.core.department import Department
-from src.core.project import Project
+from src.core.project import Project, parse_deadline
 from src.core.abstract_employee import AbstractEmployee
+from src.core.snapshot import CompanySnapshot
 from src.utils.exceptions import (
     EmployeeNotFoundError, DepartmentNotFoundError, ProjectNotFoundError,
-    DuplicateIdError
+    DuplicateIdError, AggregateConsistencyError
 )
+from src.utils.locks import read_locked, write_locked
 
 
 class Company:
@@ -19,24 +29,70 @@ class Company:
     Использует агрегацию для управления отделами и проектами.
     """
     
-    def __init__(self, name: str):
+    # Режим проверки: каждый запрос месячных затрат сверяется с полным пересчетом
+    CHECK_CONSISTENCY = False
+    
+    def __init__(self, name: str, lock=None):
         """
         Инициализация компании.
         
         Args:
             name: Название компании
+            lock: Блокировка для многопоточного режима (например, ReadWriteLock).
+                Она разделяется с отделами и проектами компании, так что все
+                изменения агрегата, включая перенос и найм, атомарны.
+                None - без синхронизации.
         """
         if not isinstance(name, str) or not name.strip():
             raise ValueError(f"Название компании не должно быть пустой строкой, получено: '{name}'")
         self.__name = name
-        self.__departments: List[Department] = []  # Агрегация
-        self.__projects: List[Project] = []  # Агрегация
+        self._lock = lock
+        self.__departments: Dict[str, Department] = {}  # Агрегация: название -> отдел
+        self.__projects: Dict[int, Project] = {}  # Агрегация: ID -> проект
+        # Проекты по статусам: статус -> {ID проекта: проект}
+        self.__projects_by_status: Dict[str, Dict[int, Project]] = {}
+        # Упорядоченные ключи (срок, ID проекта): общий и по статусам
+        self.__deadline_index: List[Tuple[datetime, int]] = []
+        self.__deadline_index_by_status: Dict[str, List[Tuple[datetime, int]]] = {}
+        # Материализованный анализ бюджетов: статус -> {"count", "total_budget"}
+        self.__budget_by_status: Dict[str, Dict] = {}
+        self.__total_budget = 0.0
+        # Индекс сотрудников: ID -> (сотрудник, отдел)
+        self.__employee_index: Dict[int, Tuple[AbstractEmployee, Department]] = {}
+        self.__total_monthly_cost = 0.0  # Накопленная сумма зарплат всех отделов
+        # Кэш зарплат: ID сотрудника -> итоговая зарплата
+        self.__salaries: Dict[int, float] = {}
+        # Назначения: ID сотрудника -> {ID проекта: проект}
+        self.__employee_projects: Dict[int, Dict[int, Project]] = {}
+        # Загрузка: число проектов -> упорядоченное множество ID сотрудников
+        self.__workload_buckets: Dict[int, Dict[int, None]] = {}
+        # Живые снимки, которым сохраняются прежние состояния перед изменениями
+        self.__snapshots = weakref.WeakSet()
     
     @property
     def name(self) -> str:
         """Получить название компании."""
         return self.__name
     
+    def read_transaction(self):
+        """
+        Контекстный менеджер согласованного чтения нескольких запросов.
+        
+        В многопоточном режиме удерживает блокировку чтения: все запросы
+        внутри блока видят одно и то же состояние компании.
+        """
+        return self._lock.read() if self._lock is not None else nullcontext()
+    
+    def write_transaction(self):
+        """
+        Контекстный менеджер атомарной последовательности изменений.
+        
+        В многопоточном режиме удерживает блокировку записи: читатели
+        не увидят промежуточного состояния между изменениями блока.
+        """
+        return self._lock.write() if self._lock is not None else nullcontext()
+    
+    @write_locked
     def add_department(self, department: Department) -> None:
         """
         Добавить отдел в компанию.
@@ -45,14 +101,26 @@ class Company:
             department: Объект отдела
         
         Raises:
-            ValueError: Если отдел уже добавлен
+            ValueError: Если отдел уже добавлен или название занято
         """
         if not isinstance(department, Department):
             raise TypeError(f"Отдел должен быть экземпляром Department, получено: {type(department)}")
-        if department in self.__departments:
+        if self.__departments.get(department.name) is department:
             raise ValueError(f"Отдел '{department.name}' уже добавлен в компанию")
-        self.__departments.append(department)
+        if department.name in self.__departments:
+            raise ValueError(f"Отдел с названием '{department.name}' уже существует")
+        for emp in department:
+            self._validate_new_employee(department, emp)
+        self._before_collections_changed()
+        self.__departments[department.name] = department
+        for emp in department:
+            self.__employee_index[emp.id] = (emp, department)
+            self.__salaries[emp.id] = emp.calculate_salary()
+        self.__total_monthly_cost += department.calculate_total_salary()
+        department._attach_observer(self)
+        department._lock = self._lock
     
+    @write_locked
     def remove_department(self, department_name: str) -> None:
         """
         Удалить отдел из компании.
@@ -69,8 +137,14 @@ class Company:
             raise DepartmentNotFoundError(f"Отдел '{department_name}' не найден")
         if len(department) > 0:
             raise ValueError(f"Нельзя удалить отдел '{department_name}', в нем есть сотрудники")
-        self.__departments.remove(department)
+        self._before_collections_changed()
+        del self.__departments[department.name]
+        department._detach_observer(self)
+        department._lock = None
+        if not self.__employee_index:
+            self.__total_monthly_cost = 0.0  # Сбрасываем накопленную погрешность
     
+    @read_locked
     def get_departments(self) -> List[Department]:
         """
         Получить список всех отделов.
@@ -78,8 +152,18 @@ class Company:
         Returns:
             Список отделов
         """
-        return self.__departments.copy()
+        return list(self.__departments.values())
+    
+    def departments_view(self) -> Mapping[str, Department]:
+        """
+        Получить представление отделов только для чтения без копирования.
+        
+        Returns:
+            Отображение название -> отдел в порядке добавления
+        """
+        return MappingProxyType(self.__departments)
     
+    @write_locked
     def add_project(self, project: Project) -> None:
         """
         Добавить проект в компанию.
@@ -92,12 +176,22 @@ class Company:
         """
         if not isinstance(project, Project):
             raise TypeError(f"Проект должен быть экземпляром Project, получено: {type(project)}")
-        if project in self.__projects:
+        existing = self.__projects.get(project.project_id)
+        if existing is project:
             raise ValueError(f"Проект '{project.name}' уже добавлен в компанию")
-        if self._find_project_by_id(project.project_id) is not None:
+        if existing is not None:
             raise DuplicateIdError(f"Проект с ID {project.project_id} уже существует")
-        self.__projects.append(project)
+        self._before_collections_changed()
+        self.__projects[project.project_id] = project
+        insort(self.__deadline_index, (project.deadline, project.project_id))
+        self._index_project_status(project, project.status)
+        self._count_project_status(project.status, 1)
+        for emp in project.get_team():
+            self._on_team_member_added(project, emp)
+        project._attach_observer(self)
+        project._lock = self._lock
     
+    @write_locked
     def remove_project(self, project_id: int) -> None:
         """
         Удалить проект из компании.
@@ -114,8 +208,17 @@ class Company:
             raise ProjectNotFoundError(f"Проект с ID {project_id} не найден")
         if project.get_team_size() > 0:
             raise ValueError(f"Нельзя удалить проект '{project.name}', над ним работает команда")
-        self.__projects.remove(project)
+        self._before_collections_changed()
+        del self.__projects[project_id]
+        self._remove_deadline_key(self.__deadline_index, project)
+        self._unindex_project_status(project, project.status)
+        self._count_project_status(project.status, -1)
+        if not self.__projects:
+            self.__total_budget = 0.0  # Сбрасываем накопленную погрешность
+        project._detach_observer(self)
+        project._lock = None
     
+    @read_locked
     def get_projects(self) -> List[Project]:
         """
         Получить список всех проектов.
@@ -123,8 +226,18 @@ class Company:
         Returns:
             Список проектов
         """
-        return self.__projects.copy()
+        return list(self.__projects.values())
+    
+    def projects_view(self) -> Mapping[int, Project]:
+        """
+        Получить представление проектов только для чтения без копирования.
+        
+        Returns:
+            Отображение ID -> проект в порядке добавления
+        """
+        return MappingProxyType(self.__projects)
     
+    @read_locked
     def get_all_employees(self) -> List[AbstractEmployee]:
         """
         Получить всех сотрудников компании.
@@ -132,11 +245,104 @@ class Company:
         Returns:
             Список всех сотрудников из всех отделов
         """
-        employees = []
-        for dept in self.__departments:
-            employees.extend(dept.get_employees())
-        return employees
+        return list(self.iter_all_employees())
+    
+    def iter_all_employees(self) -> Iterator[AbstractEmployee]:
+        """
+        Лениво перебрать всех сотрудников компании без построения списка.
+        
+        Изменять состав компании во время перебора нельзя.
+        
+        Yields:
+            Сотрудники в порядке отделов и их добавления
+        """
+        for dept in self.__departments.values():
+            yield from dept
     
+    @read_locked
+    def get_employees_page(self, offset: int, limit: int) -> List[AbstractEmployee]:
+        """
+        Получить страницу сотрудников по смещению.
+        
+        Отделы целиком пропускаются по их размеру, поэтому стоимость
+        O(число отделов + limit), а не O(offset).
+        
+        Args:
+            offset: Количество пропускаемых сотрудников
+            limit: Максимальный размер страницы
+        
+        Returns:
+            Список сотрудников страницы
+        
+        Raises:
+            ValueError: При отрицательном смещении или лимите
+        """
+        if offset < 0 or limit < 0:
+            raise ValueError(f"Смещение и лимит должны быть неотрицательными, получено: {offset}, {limit}")
+        page: List[AbstractEmployee] = []
+        for dept in self.__departments.values():
+            if len(page) >= limit:
+                break
+            size = len(dept)
+            if offset >= size:
+                offset -= size
+                continue
+            page.extend(dept[offset:offset + limit - len(page)])
+            offset = 0
+        return page
+    
+    @read_locked
+    def get_employees_by_cursor(self, limit: int,
+                                cursor: Optional[Tuple[str, int]] = None
+                                ) -> Tuple[List[AbstractEmployee], Optional[Tuple[str, int]]]:
+        """
+        Получить страницу сотрудников по курсору.
+        
+        Курсор - пара (название отдела, позиция в отделе), с которой начинается
+        следующая страница. Он остается корректным, пока компания не изменяется.
+        
+        Args:
+            limit: Максимальный размер страницы (больше нуля)
+            cursor: Курсор из предыдущего вызова (None - с начала)
+        
+        Returns:
+            Кортеж (сотрудники страницы, курсор следующей страницы или None)
+        
+        Raises:
+            ValueError: При неположительном лимите
+            DepartmentNotFoundError: Если отдел курсора больше не существует
+        """
+        if limit <= 0:
+            raise ValueError(f"Лимит должен быть положительным, получено: {limit}")
+        departments = iter(self.__departments.values())
+        position = 0
+        if cursor is not None:
+            name, position = cursor
+            if name not in self.__departments:
+                raise DepartmentNotFoundError(f"Отдел '{name}' из курсора не найден")
+            departments = self._iter_departments_from(name)
+        page: List[AbstractEmployee] = []
+        for dept in departments:
+            chunk = dept[position:position + limit - len(page)]
+            page.extend(chunk)
+            if len(page) == limit:
+                next_position = position + len(chunk)
+                if next_position < len(dept):
+                    return page, (dept.name, next_position)
+                following = next(self._iter_departments_from(dept.name, skip=1), None)
+                return page, (following.name, 0) if following is not None else None
+            position = 0
+        return page, None
+    
+    def _iter_departments_from(self, name: str, skip: int = 0) -> Iterator[Department]:
+        """Перебрать отделы, начиная с указанного, пропустив первые skip."""
+        departments = iter(self.__departments.values())
+        for dept in departments:
+            if dept.name == name:
+                return islice(chain((dept,), departments), skip, None)
+        return iter(())
+    
+    @read_locked
     def find_employee_by_id(self, employee_id: int) -> Optional[AbstractEmployee]:
         """
         Найти сотрудника по ID во всей компании.
@@ -147,21 +353,149 @@ class Company:
         Returns:
             Объект сотрудника или None
         """
-        for dept in self.__departments:
-            employee = dept.find_employee_by_id(employee_id)
-            if employee is not None:
-                return employee
-        return None
+        entry = self.__employee_index.get(employee_id)
+        return entry[0] if entry is not None else None
     
+    @read_locked
+    def find_employee_department(self, employee_id: int) -> Optional[Department]:
+        """
+        Найти отдел, в котором работает сотрудник.
+        
+        Args:
+            employee_id: ID сотрудника
+        
+        Returns:
+            Объект отдела или None
+        """
+        entry = self.__employee_index.get(employee_id)
+        return entry[1] if entry is not None else None
+    
+    def _validate_new_employee(self, department: Department, employee: AbstractEmployee) -> None:
+        """
+        Проверить уникальность ID сотрудника в масштабе компании.
+        
+        Raises:
+            DuplicateIdError: Если сотрудник с таким ID уже работает в другом отделе
+        """
+        entry = self.__employee_index.get(employee.id)
+        if entry is not None and entry[1] is not department:
+            raise DuplicateIdError(
+                f"Сотрудник с ID {employee.id} уже работает в отделе '{entry[1].name}'"
+            )
+    
+    def _on_employee_added(self, department: Department, employee: AbstractEmployee) -> None:
+        """Обновить индекс и затраты после добавления сотрудника в отдел."""
+        salary = employee.calculate_salary()
+        self.__employee_index[employee.id] = (employee, department)
+        self.__salaries[employee.id] = salary
+        self.__total_monthly_cost += salary
+    
+    def _on_employee_removed(self, department: Department, employee: AbstractEmployee) -> None:
+        """Обновить индекс и затраты после удаления сотрудника из отдела."""
+        entry = self.__employee_index.get(employee.id)
+        if entry is not None and entry[1] is department:
+            del self.__employee_index[employee.id]
+            del self.__salaries[employee.id]
+        if self.__employee_index:
+            self.__total_monthly_cost -= employee.calculate_salary()
+        else:
+            self.__total_monthly_cost = 0.0
+    
+    def _on_department_salary_changed(self, department: Department, employee: AbstractEmployee,
+                                      old_salary: float, new_salary: float) -> None:
+        """Применить изменение зарплаты сотрудника к месячным затратам и кэшу зарплат."""
+        self.__salaries[employee.id] = new_salary
+        self.__total_monthly_cost += new_salary - old_salary
+    
+    def _validate_employee_id_change(self, employee: AbstractEmployee, new_id: int) -> None:
+        """
+        Проверить, что новый ID сотрудника не занят в компании.
+        
+        Raises:
+            DuplicateIdError: Если ID уже принадлежит другому сотруднику
+        """
+        entry = self.__employee_index.get(new_id)
+        if entry is not None and entry[0] is not employee:
+            raise DuplicateIdError(
+                f"Сотрудник с ID {new_id} уже работает в отделе '{entry[1].name}'"
+            )
+    
+    def _on_employee_id_changed(self, employee: AbstractEmployee, old_id: int) -> None:
+        """Перенести записи индексов на новый ID сотрудника."""
+        entry = self.__employee_index.pop(old_id, None)
+        if entry is not None:
+            self.__employee_index[employee.id] = entry
+            self.__salaries[employee.id] = self.__salaries.pop(old_id)
+        projects = self.__employee_projects.pop(old_id, None)
+        if projects is not None:
+            self.__employee_projects[employee.id] = projects
+            bucket = self.__workload_buckets[len(projects)]
+            del bucket[old_id]
+            bucket[employee.id] = None
+    
+    def _move_workload(self, employee_id: int, old_count: int, new_count: int) -> None:
+        """Переместить сотрудника между корзинами загрузки."""
+        if old_count:
+            bucket = self.__workload_buckets[old_count]
+            del bucket[employee_id]
+            if not bucket:
+                del self.__workload_buckets[old_count]
+        if new_count:
+            self.__workload_buckets.setdefault(new_count, {})[employee_id] = None
+    
+    def _on_team_member_added(self, project: Project, employee: AbstractEmployee) -> None:
+        """Учесть назначение сотрудника на проект."""
+        projects = self.__employee_projects.setdefault(employee.id, {})
+        projects[project.project_id] = project
+        self._move_workload(employee.id, len(projects) - 1, len(projects))
+        self._on_project_budget_changed(project, employee.calculate_salary())
+    
+    def _on_team_member_removed(self, project: Project, employee: AbstractEmployee) -> None:
+        """Учесть снятие сотрудника с проекта."""
+        projects = self.__employee_projects.get(employee.id)
+        if projects is None or projects.pop(project.project_id, None) is None:
+            return
+        self._move_workload(employee.id, len(projects) + 1, len(projects))
+        self._on_project_budget_changed(project, -employee.calculate_salary())
+        if not projects:
+            del self.__employee_projects[employee.id]
+    
+    @read_locked
     def calculate_total_monthly_cost(self) -> float:
         """
         Рассчитать общие месячные затраты на зарплаты.
         
+        Значение поддерживается инкрементально; в режиме CHECK_CONSISTENCY
+        оно сверяется с пересчетом по отделам.
+        
         Returns:
             Сумма зарплат всех сотрудников компании
+        
+        Raises:
+            AggregateConsistencyError: Если в режиме проверки сумма разошлась с пересчетом
         """
-        return sum(dept.calculate_total_salary() for dept in self.__departments)
+        if self.CHECK_CONSISTENCY:
+            expected = sum(dept.calculate_total_salary() for dept in self.__departments.values())
+            if not math.isclose(self.__total_monthly_cost, expected, rel_tol=1e-9, abs_tol=1e-6):
+                raise AggregateConsistencyError(
+                    f"Месячные затраты компании '{self.__name}' расходятся с пересчетом: "
+                    f"{self.__total_monthly_cost} != {expected}"
+                )
+        return self.__total_monthly_cost
     
+    @write_locked
+    def recalculate_total_monthly_cost(self) -> float:
+        """
+        Пересчитать месячные затраты с нуля (включая суммы отделов и кэш зарплат).
+        
+        Returns:
+            Сумма зарплат всех сотрудников компании
+        """
+        self.__salaries = {emp_id: emp.calculate_salary() for emp_id, (emp, _) in self.__employee_index.items()}
+        self.__total_monthly_cost = sum(dept.recalculate_total_salary() for dept in self.__departments.values())
+        return self.__total_monthly_cost
+    
+    @read_locked
     def get_projects_by_status(self, status: str) -> List[Project]:
         """
         Фильтровать проекты по статусу.
@@ -172,22 +506,201 @@ class Company:
         Returns:
             Список проектов с указанным статусом
         """
-        return [proj for proj in self.__projects if proj.status == status]
+        return list(self.__projects_by_status.get(status, {}).values())
+    
+    @read_locked
+    def get_projects_due_between(self, start: Union[str, date], end: Union[str, date],
+                                 status: Optional[str] = None) -> List[Project]:
+        """
+        Найти проекты со сроком в диапазоне дат (включительно).
+        
+        Args:
+            start: Начало диапазона (дата или строка YYYY-MM-DD)
+            end: Конец диапазона (дата или строка YYYY-MM-DD)
+            status: Статус для фильтрации (None - любой)
+        
+        Returns:
+            Список проектов по возрастанию срока
+        """
+        keys = self._deadline_keys(status)
+        low = bisect_left(keys, (self._to_datetime(start),))
+        high = bisect_right(keys, (self._to_datetime(end), math.inf))
+        return [self.__projects[project_id] for _, project_id in keys[low:high]]
+    
+    def get_projects_due_within(self, days: int, since: Union[str, date, None] = None,
+                                status: Optional[str] = None) -> List[Project]:
+        """
+        Найти проекты со сроком в ближайшие days дней.
+        
+        Args:
+            days: Число дней
+            since: Начальная дата (по умолчанию сегодня)
+            status: Статус для фильтрации (None - любой)
+        
+        Returns:
+            Список проектов по возрастанию срока
+        """
+        start = self._to_datetime(date.today() if since is None else since)
+        return self.get_projects_due_between(start, start + timedelta(days=days), status)
+    
+    @read_locked
+    def get_nearest_deadlines(self, k: int, since: Union[str, date, None] = None,
+                              status: Optional[str] = None) -> List[Project]:
+        """
+        Найти k проектов с ближайшими сроками, не раньше указанной даты.
+        
+        Args:
+            k: Количество проектов
+            since: Начальная дата (по умолчанию сегодня)
+            status: Статус для фильтрации (None - любой)
+        
+        Returns:
+            Список не более чем из k проектов по возрастанию срока
+        """
+        keys = self._deadline_keys(status)
+        low = bisect_left(keys, (self._to_datetime(date.today() if since is None else since),))
+        return [self.__projects[project_id] for _, project_id in keys[low:low + max(k, 0)]]
+    
+    def _deadline_keys(self, status: Optional[str]) -> List[Tuple[datetime, int]]:
+        """Получить упорядоченные ключи сроков для статуса."""
+        if status is None:
+            return self.__deadline_index
+        return self.__deadline_index_by_status.get(status, [])
+    
+    @staticmethod
+    def _to_datetime(value: Union[str, date]) -> datetime:
+        """Привести дату или строку YYYY-MM-DD к datetime."""
+        if isinstance(value, datetime):
+            return value
+        if isinstance(value, date):
+            return datetime(value.year, value.month, value.day)
+        return parse_deadline(value)
+    
+    @staticmethod
+    def _remove_deadline_key(keys: List[Tuple[datetime, int]], project: Project) -> None:
+        """Удалить ключ проекта из упорядоченного списка сроков."""
+        del keys[bisect_left(keys, (project.deadline, project.project_id))]
+    
+    def _index_project_status(self, project: Project, status: str) -> None:
+        """Добавить проект в индексы статусов."""
+        self.__projects_by_status.setdefault(status, {})[project.project_id] = project
+        insort(self.__deadline_index_by_status.setdefault(status, []),
+               (project.deadline, project.project_id))
+    
+    def _unindex_project_status(self, project: Project, status: str) -> None:
+        """Убрать проект из индексов статусов."""
+        bucket = self.__projects_by_status[status]
+        del bucket[project.project_id]
+        keys = self.__deadline_index_by_status[status]
+        self._remove_deadline_key(keys, project)
+        if not bucket:
+            del self.__projects_by_status[status]
+            del self.__deadline_index_by_status[status]
+    
+    def _on_project_status_changed(self, project: Project, old_status: str) -> None:
+        """Перенести проект в индексах статусов."""
+        self._unindex_project_status(project, old_status)
+        self._index_project_status(project, project.status)
+        budget = project.calculate_total_salary()
+        self._count_project_status(old_status, -1)
+        self._change_status_budget(old_status, -budget)
+        self._count_project_status(project.status, 1)
+        self._change_status_budget(project.status, budget)
+    
+    def _count_project_status(self, status: str, delta: int) -> None:
+        """Изменить число проектов со статусом в анализе бюджетов."""
+        entry = self.__budget_by_status.setdefault(status, {"count": 0, "total_budget": 0.0})
+        entry["count"] += delta
+        if not entry["count"]:
+            del self.__budget_by_status[status]
+    
+    def _change_status_budget(self, status: str, delta: float) -> None:
+        """Применить изменение бюджета проекта к анализу бюджетов."""
+        entry = self.__budget_by_status.get(status)
+        if entry is not None:
+            entry["total_budget"] += delta
+    
+    def _on_project_budget_changed(self, project: Project, delta: float) -> None:
+        """Применить изменение бюджета команды проекта."""
+        self._change_status_budget(project.status, delta)
+        self.__total_budget += delta
+    
+    @read_locked
+    def snapshot(self) -> CompanySnapshot:
+        """
+        Получить согласованный снимок компании на текущий момент.
+        
+        Создание стоит O(число отделов): копируются только материализованные
+        статистики. Дальнейшие изменения компании сохраняют в снимок прежние
+        состояния затронутых объектов, поэтому память снимка растет с числом
+        изменений. Снимок следует закрыть (close или with), когда он не нужен.
+        
+        Returns:
+            Объект CompanySnapshot
+        """
+        snapshot = CompanySnapshot(self, self.get_department_stats(),
+                                   self.get_project_budget_analysis(),
+                                   self.calculate_total_monthly_cost())
+        self.__snapshots.add(snapshot)
+        return snapshot
+    
+    @write_locked
+    def _release_snapshot(self, snapshot: CompanySnapshot) -> None:
+        """Перестать сохранять изменения для снимка."""
+        self.__snapshots.discard(snapshot)
+    
+    def _before_collections_changed(self) -> None:
+        """Сохранить наборы отделов и проектов в живые снимки перед изменением."""
+        if self.__snapshots:
+            for snapshot in self.__snapshots:
+                snapshot._capture_departments(self.__departments)
+                snapshot._capture_projects(self.__projects)
+    
+    def _before_department_changed(self, department: Department) -> None:
+        """Сохранить состав отдела в живые снимки перед изменением."""
+        if self.__snapshots:
+            for snapshot in self.__snapshots:
+                snapshot._capture_members(department)
+    
+    def _before_employee_changed(self, employee: AbstractEmployee) -> None:
+        """Сохранить состояние сотрудника в живые снимки перед изменением."""
+        if self.__snapshots:
+            for snapshot in self.__snapshots:
+                snapshot._capture_employee(employee)
+    
+    def _before_project_changed(self, project: Project) -> None:
+        """Сохранить статус и команду проекта в живые снимки перед изменением."""
+        if self.__snapshots:
+            for snapshot in self.__snapshots:
+                snapshot._capture_project(project)
+    
+    def _validate_department_rename(self, department: Department, new_name: str) -> None:
+        """
+        Проверить, что новое название отдела не занято.
+        
+        Raises:
+            ValueError: Если в компании уже есть отдел с таким названием
+        """
+        if self.__departments.get(new_name, department) is not department:
+            raise ValueError(f"Отдел с названием '{new_name}' уже существует")
+        self._before_collections_changed()
+    
+    def _on_department_renamed(self, department: Department, old_name: str) -> None:
+        """Перестроить ключи индекса отделов на месте с сохранением порядка."""
+        rekeyed = [(department.name if name == old_name else name, dept)
+                   for name, dept in self.__departments.items()]
+        self.__departments.clear()
+        self.__departments.update(rekeyed)
     
     def _find_department_by_name(self, name: str) -> Optional[Department]:
         """Найти отдел по названию."""
-        for dept in self.__departments:
-            if dept.name == name:
-                return dept
-        return None
+        return self.__departments.get(name)
     
     def _find_project_by_id(self, project_id: int) -> Optional[Project]:
         """Найти проект по ID."""
-        for proj in self.__projects:
-            if proj.project_id == project_id:
-                return proj
-        return None
+        return self.__projects.get(project_id)
     
+    @write_locked
     def transfer_employee(self, employee_id: int, from_dept: str, to_dept: str) -> bool:
         """
         Перенести сотрудника между отделами.
@@ -212,23 +725,87 @@ class Company:
         if target_dept is None:
             raise DepartmentNotFoundError(f"Целевой отдел '{to_dept}' не найден")
         
-        employee = source_dept.find_employee_by_id(employee_id)
-        if employee is None:
+        entry = self.__employee_index.get(employee_id)
+        if entry is None or entry[1] is not source_dept:
             raise EmployeeNotFoundError(f"Сотрудник с ID {employee_id} не найден в отделе '{from_dept}'")
+        employee = entry[0]
         
         source_dept.remove_employee(employee_id)
         target_dept.add_employee(employee)
         return True
     
+    @write_locked
+    def bulk_transfer(self, moves: Iterable[Tuple[int, str]]) -> int:
+        """
+        Перенести сотрудников между отделами одной операцией.
+        
+        Сначала проверяется весь пакет, затем каждый отдел изменяется один раз
+        (пакетное удаление и добавление без поштучных уведомлений), а индекс
+        сотрудников обновляется одним проходом. Общие затраты компании при
+        переносе не меняются. При ошибке во время применения все отделы
+        возвращаются в исходное состояние, а индекс не изменяется.
+        
+        Args:
+            moves: Пары (ID сотрудника, название целевого отдела)
+        
+        Returns:
+            Количество перенесенных сотрудников (без переносов в свой же отдел)
+        
+        Raises:
+            DepartmentNotFoundError: Если целевой отдел не найден
+            EmployeeNotFoundError: Если сотрудник не найден
+            ValueError: Если сотрудник встречается в пакете дважды
+        """
+        index = self.__employee_index
+        departments = self.__departments
+        planned: Dict[int, Tuple[AbstractEmployee, Department]] = {}
+        removals: Dict[Department, List[int]] = {}
+        additions: Dict[Department, List[AbstractEmployee]] = {}
+        for employee_id, to_dept in moves:
+            target = departments.get(to_dept)
+            if target is None:
+                raise DepartmentNotFoundError(f"Целевой отдел '{to_dept}' не найден")
+            entry = index.get(employee_id)
+            if entry is None:
+                raise EmployeeNotFoundError(f"Сотрудник с ID {employee_id} не найден")
+            if employee_id in planned:
+                raise ValueError(f"Сотрудник с ID {employee_id} указан в пакете повторно")
+            employee, source = entry
+            planned[employee_id] = (employee, target)
+            if source is not target:
+                removals.setdefault(source, []).append(employee_id)
+                additions.setdefault(target, []).append(employee)
+        if not removals:
+            return 0
+        
+        touched = {dept: list(dept) for dept in (*removals, *additions)}
+        for dept in touched:
+            self._before_department_changed(dept)
+        try:
+            for source, employee_ids in removals.items():
+                source._take_employees(employee_ids)
+            for target, employees in additions.items():
+                target._put_employees(employees)
+        except BaseException:
+            for dept, members in touched.items():
+                dept._replace_members(members)
+            raise
+        index.update(planned)
+        return sum(len(employees) for employees in additions.values())
+    
+    @read_locked
     def get_department_stats(self) -> Dict:
         """
         Получить статистику по отделам.
         
+        Суммы зарплат и счетчики типов поддерживаются отделами
+        инкрементально, поэтому запрос стоит O(число отделов).
+        
         Returns:
             Словарь со статистикой
         """
         stats = {}
-        for dept in self.__departments:
+        for dept in self.__departments.values():
             stats[dept.name] = {
                 "employee_count": len(dept),
                 "total_salary": dept.calculate_total_salary(),
@@ -236,32 +813,171 @@ class Company:
             }
         return stats
     
+    @read_locked
+    def get_top_earners(self, k: int, by: Optional[str] = None) -> Union[List[AbstractEmployee],
+                                                                        Dict[str, List[AbstractEmployee]]]:
+        """
+        Получить k самых высокооплачиваемых сотрудников.
+        
+        Зарплаты берутся из кэша компании, а отбор идет через кучу
+        (heapq.nlargest) за O(n log k) без сортировки всего списка.
+        Сотрудники с равной зарплатой идут в порядке индекса компании.
+        
+        Args:
+            k: Количество сотрудников (в каждой группе при группировке)
+            by: None - по всей компании, "department" - по отделам, "type" - по типам
+        
+        Returns:
+            Список сотрудников по убыванию зарплаты или словарь группа -> список
+        
+        Raises:
+            ValueError: При отрицательном k или неизвестной группировке
+        """
+        if not isinstance(k, int) or k < 0:
+            raise ValueError(f"k должно быть неотрицательным целым числом, получено: {k}")
+        if self.CHECK_CONSISTENCY:
+            self._check_salary_cache()
+        salaries = self.__salaries
+        index = self.__employee_index
+        
+        def top(employee_ids: Iterable[int]) -> List[AbstractEmployee]:
+            return [index[emp_id][0] for emp_id in heapq.nlargest(k, employee_ids, key=salaries.__getitem__)]
+        
+        if by is None:
+            return top(salaries)
+        return {group: top(employee_ids) for group, employee_ids in self._group_employee_ids(by).items()}
+    
+    @read_locked
+    def get_salary_percentiles(self, percentiles: Iterable[float] = (50, 90, 99), by: Optional[str] = None,
+                               approximate: bool = False,
+                               sample_size: int = 10_000) -> Union[Dict[float, float],
+                                                                   Dict[str, Dict[float, float]]]:
+        """
+        Получить процентили зарплат.
+        
+        Точные процентили считаются сортировкой кэшированных зарплат
+        с линейной интерполяцией между соседними значениями (как numpy.percentile
+        по умолчанию). В приближенном режиме группа больше sample_size
+        заменяется случайной выборкой такого размера с фиксированным зерном:
+        ошибка ранга порядка 1/sqrt(sample_size).
+        
+        Args:
+            percentiles: Процентили от 0 до 100
+            by: None - по всей компании, "department" - по отделам, "type" - по типам
+            approximate: Считать по выборке
+            sample_size: Размер выборки в приближенном режиме
+        
+        Returns:
+            Словарь процентиль -> зарплата или группа -> такой словарь.
+            Для компании без сотрудников возвращается пустой словарь.
+        
+        Raises:
+            ValueError: При процентиле вне [0, 100] или неизвестной группировке
+        """
+        points = list(percentiles)
+        for point in points:
+            if not 0 <= point <= 100:
+                raise ValueError(f"Процентиль должен быть от 0 до 100, получено: {point}")
+        if self.CHECK_CONSISTENCY:
+            self._check_salary_cache()
+        rng = random.Random(0)
+        
+        def compute(values: List[float]) -> Dict[float, float]:
+            if not values:
+                return {}
+            if approximate and len(values) > sample_size:
+                values = rng.sample(values, sample_size)
+            values.sort()
+            return {point: self._percentile(values, point) for point in points}
+        
+        if by is None:
+            return compute(list(self.__salaries.values()))
+        salaries = self.__salaries
+        return {group: compute([salaries[emp_id] for emp_id in employee_ids])
+                for group, employee_ids in self._group_employee_ids(by).items()}
+    
+    @staticmethod
+    def _percentile(sorted_values: List[float], point: float) -> float:
+        """Процентиль отсортированного непустого списка с линейной интерполяцией."""
+        rank = (len(sorted_values) - 1) * point / 100
+        lower = math.floor(rank)
+        upper = min(lower + 1, len(sorted_values) - 1)
+        return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (rank - lower)
+    
+    def _group_employee_ids(self, by: str) -> Dict[str, List[int]]:
+        """
+        Сгруппировать ID сотрудников по отделу или типу.
+        
+        Raises:
+            ValueError: При неизвестной группировке
+        """
+        if by == "department":
+            return {name: list(dept.employees_view()) for name, dept in self.__departments.items() if len(dept)}
+        if by == "type":
+            groups: Dict[str, List[int]] = {}
+            for emp_id, (employee, _) in self.__employee_index.items():
+                groups.setdefault(employee.__class__.__name__, []).append(emp_id)
+            return groups
+        raise ValueError(f"Группировка должна быть 'department' или 'type', получено: '{by}'")
+    
+    def _check_salary_cache(self) -> None:
+        """Сверить кэш зарплат с calculate_salary() каждого сотрудника."""
+        for emp_id, (employee, _) in self.__employee_index.items():
+            cached = self.__salaries.get(emp_id)
+            if cached is None or not math.isclose(cached, employee.calculate_salary(), rel_tol=1e-9, abs_tol=1e-6):
+                raise AggregateConsistencyError(
+                    f"Кэш зарплаты сотрудника {emp_id} компании '{self.__name}' расходится с пересчетом: "
+                    f"{cached} != {employee.calculate_salary()}"
+                )
+        if len(self.__salaries) != len(self.__employee_index):
+            raise AggregateConsistencyError(f"Кэш зарплат компании '{self.__name}' содержит лишние записи")
+    
+    @read_locked
     def get_project_budget_analysis(self) -> Dict:
         """
         Получить анализ бюджетов проектов.
         
+        Анализ поддерживается инкрементально при изменении проектов, их статусов,
+        команд и зарплат участников, поэтому запрос стоит O(число статусов).
+        
         Returns:
             Словарь с анализом бюджетов
+        
+        Raises:
+            AggregateConsistencyError: Если в режиме проверки анализ разошелся с пересчетом
         """
         analysis = {
             "total_projects": len(self.__projects),
-            "by_status": {},
-            "total_budget": 0.0
+            "by_status": {status: dict(entry) for status, entry in self.__budget_by_status.items()},
+            "total_budget": self.__total_budget
         }
-        
-        for proj in self.__projects:
-            status = proj.status
-            budget = proj.calculate_total_salary()
-            
-            if status not in analysis["by_status"]:
-                analysis["by_status"][status] = {"count": 0, "total_budget": 0.0}
-            
-            analysis["by_status"][status]["count"] += 1
-            analysis["by_status"][status]["total_budget"] += budget
-            analysis["total_budget"] += budget
-        
+        if self.CHECK_CONSISTENCY:
+            self._check_budget_analysis(analysis)
         return analysis
     
+    def _check_budget_analysis(self, analysis: Dict) -> None:
+        """Сверить материализованный анализ бюджетов с полным пересчетом."""
+        expected: Dict[str, Dict] = {}
+        for proj in self.__projects.values():
+            entry = expected.setdefault(proj.status, {"count": 0, "total_budget": 0.0})
+            entry["count"] += 1
+            entry["total_budget"] += proj.calculate_total_salary()
+        actual = analysis["by_status"]
+        consistent = (
+            expected.keys() == actual.keys()
+            and all(expected[s]["count"] == actual[s]["count"]
+                    and math.isclose(expected[s]["total_budget"], actual[s]["total_budget"],
+                                     rel_tol=1e-9, abs_tol=1e-6)
+                    for s in expected)
+            and math.isclose(sum(e["total_budget"] for e in expected.values()),
+                             analysis["total_budget"], rel_tol=1e-9, abs_tol=1e-6)
+        )
+        if not consistent:
+            raise AggregateConsistencyError(
+                f"Анализ бюджетов компании '{self.__name}' расходится с пересчетом: "
+                f"{actual} != {expected}"
+            )
+    
     def find_overloaded_employees(self) -> List[AbstractEmployee]:
         """
         Найти перегруженных сотрудников (участвующих в нескольких проектах).
@@ -269,21 +985,57 @@ class Company:
         Returns:
             Список перегруженных сотрудников
         """
-        employee_project_count = {}
-        for proj in self.__projects:
-            for emp in proj.get_team():
-                emp_id = emp.id
-                employee_project_count[emp_id] = employee_project_count.get(emp_id, 0) + 1
+        return self.find_employees_with_more_projects_than(1)
+    
+    @read_locked
+    def find_employees_with_more_projects_than(self, k: int) -> List[AbstractEmployee]:
+        """
+        Найти сотрудников компании, назначенных более чем на k проектов.
+        
+        Просматриваются только корзины загрузки с числом проектов больше k,
+        без обхода проектов и команд.
         
-        overloaded = []
-        for emp_id, count in employee_project_count.items():
-            if count > 1:
+        Args:
+            k: Пороговое число проектов
+        
+        Returns:
+            Список сотрудников (по возрастанию загрузки)
+        """
+        result = []
+        for count in sorted(c for c in self.__workload_buckets if c > k):
+            for emp_id in self.__workload_buckets[count]:
                 employee = self.find_employee_by_id(emp_id)
                 if employee is not None:
-                    overloaded.append(employee)
+                    result.append(employee)
+        return result
+    
+    @read_locked
+    def get_employee_projects(self, employee_id: int) -> List[Project]:
+        """
+        Получить проекты, на которые назначен сотрудник.
+        
+        Args:
+            employee_id: ID сотрудника
+        
+        Returns:
+            Список проектов в порядке назначения
+        """
+        return list(self.__employee_projects.get(employee_id, {}).values())
+    
+    @read_locked
+    def get_employee_project_count(self, employee_id: int) -> int:
+        """
+        Получить число проектов сотрудника.
+        
+        Args:
+            employee_id: ID сотрудника
         
-        return overloaded
+        Returns:
+            Количество проектов
+        """
+        return len(self.__employee_projects.get(employee_id, ()))
     
+    @write_locked
     def assign_employee_to_project(self, employee_id: int, project_id: int) -> bool:
         """
         Назначить сотрудника на проект.
@@ -310,6 +1062,7 @@ class Company:
         project.add_team_member(employee)
         return True
     
+    @read_locked
     def check_employee_availability(self, employee_id: int) -> bool:
         """
         Проверить доступность сотрудника (не перегружен ли).
@@ -320,24 +1073,20 @@ class Company:
         Returns:
             True если сотрудник доступен (участвует менее чем в 2 проектах)
         """
-        project_count = sum(1 for proj in self.__projects 
-                           if proj.find_team_member(employee_id) is not None)
-        return project_count < 2
+        return self.get_employee_project_count(employee_id) < 2
     
     def save_to_json(self, filename: str) -> None:
         """
         Сохранить всю компанию в JSON файл.
         
+        Запись идет из снимка, поэтому изменения компании во время
+        сохранения не блокируются и не попадают в файл.
+        
         Args:
             filename: Имя файла для сохранения
         """
-        data = {
-            "name": self.__name,
-            "departments": [self._department_to_dict(dept) for dept in self.__departments],
-            "projects": [proj.to_dict() for proj in self.__projects]
-        }
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        with self.snapshot() as snapshot:
+            snapshot.save_to_json(filename)
     
     @classmethod
     def load_from_json(cls, filename: str) -> 'Company':
@@ -353,6 +1102,22 @@ class Company:
         with open(filename, 'r', encoding='utf-8') as f:
             data = json.load(f)
         
+        return cls.from_dict(data)
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> 'Company':
+        """
+        Создать компанию из словаря в формате save_to_json.
+        
+        Команда проекта может быть задана как словарями сотрудников,
+        так и списком их ID.
+        
+        Args:
+            data: Словарь с данными компании
+        
+        Returns:
+            Объект Company
+        """
         company = cls(data["name"])
         
         # Загружаем отделы
@@ -365,8 +1130,8 @@ class Company:
             project = Project.from_dict(proj_data)
             company.add_project(project)
             # Восстанавливаем команды проектов
-            for emp_data in proj_data.get("team", []):
-                emp_id = emp_data.get("id")
+            for member in proj_data.get("team", []):
+                emp_id = member.get("id") if isinstance(member, dict) else member
                 if emp_id:
                     try:
                         company.assign_employee_to_project(emp_id, project.project_id)
@@ -375,55 +1140,87 @@ class Company:
         
         return company
     
+    @read_locked
+    def save_to_ndjson(self, filename: str, compression: Optional[str] = None) -> None:
+        """
+        Сохранить компанию потоково в формате NDJSON (одна запись на строку).
+        
+        Команды проектов сохраняются как списки ID сотрудников.
+        
+        Args:
+            filename: Имя файла для сохранения
+            compression: None, "gzip" или "zstd"
+        """
+        from src.storage.ndjson import write_company
+        write_company(self, filename, compression)
+    
+    @classmethod
+    def load_from_ndjson(cls, filename: str) -> 'Company':
+        """
+        Загрузить компанию потоково из NDJSON (также читает формат save_to_json).
+        
+        Сжатие gzip/zstd определяется автоматически.
+        
+        Args:
+            filename: Имя файла для загрузки
+        
+        Returns:
+            Объект Company
+        """
+        from src.storage.ndjson import read_company
+        return read_company(filename, cls)
+    
+    @read_locked
+    def save_to_binary(self, filename: str) -> None:
+        """
+        Сохранить компанию в бинарный колоночный снимок.
+        
+        Args:
+            filename: Имя файла для сохранения
+        """
+        from src.storage.binary import write_company
+        write_company(self, filename)
+    
     @staticmethod
-    def _department_to_dict(department: Department) -> dict:
-        """Преобразовать отдел в словарь."""
-        from src.core.department import Department as DeptClass
-        return {
-            "name": department.name,
-            "employees": [DeptClass._employee_to_dict(emp) for emp in department.get_employees()]
-        }
+    def open_binary(filename: str):
+        """
+        Открыть бинарный снимок через mmap без загрузки объектов.
+        
+        Отделы и сотрудники создаются при первом обращении;
+        полную компанию возвращает to_company() полученного снимка.
+        
+        Args:
+            filename: Имя файла снимка
+        
+        Returns:
+            Объект MappedCompany
+        """
+        from src.storage.binary import MappedCompany
+        return MappedCompany(filename)
     
     def export_employees_csv(self, filename: str) -> None:
         """
         Экспортировать отчет по сотрудникам в CSV.
         
+        Отчет строится по снимку компании на момент вызова.
+        
         Args:
             filename: Имя файла для экспорта
         """
-        employees = self.get_all_employees()
-        with open(filename, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(["ID", "Имя", "Отдел", "Тип", "Базовая зарплата", "Итоговая зарплата"])
-            for emp in employees:
-                writer.writerow([
-                    emp.id,
-                    emp.name,
-                    emp.department,
-                    emp.__class__.__name__,
-                    emp.base_salary,
-                    emp.calculate_salary()
-                ])
+        with self.snapshot() as snapshot:
+            snapshot.export_employees_csv(filename)
     
     def export_projects_csv(self, filename: str) -> None:
         """
         Экспортировать отчет по проектам в CSV.
         
+        Отчет строится по снимку компании на момент вызова.
+        
         Args:
             filename: Имя файла для экспорта
         """
-        with open(filename, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(["ID проекта", "Название", "Статус", "Срок", "Размер команды", "Бюджет команды"])
-            for proj in self.__projects:
-                writer.writerow([
-                    proj.project_id,
-                    proj.name,
-                    proj.status,
-                    proj.deadline.strftime("%Y-%m-%d"),
-                    proj.get_team_size(),
-                    proj.calculate_total_salary()
-                ])
+        with self.snapshot() as snapshot:
+            snapshot.export_projects_csv(filename)
     
     def __str__(self) -> str:
         """Строковое представление компании."""
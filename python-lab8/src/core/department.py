@@ -1,8 +1,16 @@
 """Класс Department (Отдел) для управления сотрудниками."""
 
 import json
-from typing import List, Optional, Dict
+import math
+from bisect import bisect_left
+from collections import Counter
+from types import MappingProxyType
+from typing import List, Optional, Dict, Iterable, Mapping
 from src.core.abstract_employee import AbstractEmployee
+from src.core.registry import employee_from_dict
+import src.employees  # noqa: F401  Регистрирует встроенные типы сотрудников
+from src.utils.exceptions import AggregateConsistencyError
+from src.utils.locks import read_locked, write_locked
 
 
 class Department:
@@ -12,6 +20,9 @@ class Department:
     Управляет коллекцией сотрудников с поддержкой полиморфизма.
     """
     
+    # Режим проверки: каждый запрос суммарной зарплаты сверяется с полным пересчетом
+    CHECK_CONSISTENCY = False
+    
     def __init__(self, name: str):
         """
         Инициализация отдела.
@@ -22,7 +33,18 @@ class Department:
         if not isinstance(name, str) or not name.strip():
             raise ValueError(f"Название отдела не должно быть пустой строкой, получено: '{name}'")
         self.__name = name
-        self.__employees: List[AbstractEmployee] = []
+        # Упорядоченный по времени добавления словарь ID -> сотрудник
+        self.__employees: Dict[int, AbstractEmployee] = {}
+        # Порядок для доступа по индексу поддерживается при каждом изменении:
+        # сотрудники и возрастающие номера их добавления в том же порядке, что и словарь
+        self.__ordered: List[AbstractEmployee] = []
+        self.__ordered_seqs: List[int] = []
+        self.__seqs: Dict[int, int] = {}  # ID -> номер добавления
+        self.__next_seq = 0
+        self.__observers: List = []  # Компании, которые индексируют сотрудников отдела
+        self.__total_salary = 0.0  # Накопленная сумма зарплат
+        self.__type_counts: Dict[str, int] = {}  # Накопленное число сотрудников по типам
+        self._lock = None  # Блокировка компании в многопоточном режиме
     
     @property
     def name(self) -> str:
@@ -30,12 +52,19 @@ class Department:
         return self.__name
     
     @name.setter
+    @write_locked
     def name(self, value: str) -> None:
         """Установить название отдела."""
         if not isinstance(value, str) or not value.strip():
             raise ValueError(f"Название отдела не должно быть пустой строкой, получено: '{value}'")
+        for observer in self.__observers:
+            observer._validate_department_rename(self, value)
+        old_name = self.__name
         self.__name = value
+        for observer in self.__observers:
+            observer._on_department_renamed(self, old_name)
     
+    @write_locked
     def add_employee(self, employee: AbstractEmployee) -> None:
         """
         Добавить сотрудника в отдел.
@@ -45,10 +74,51 @@ class Department:
         """
         if not isinstance(employee, AbstractEmployee):
             raise TypeError(f"Сотрудник должен быть экземпляром AbstractEmployee, получено: {type(employee)}")
-        if employee in self.__employees:
+        if employee.id in self.__employees:
             raise ValueError(f"Сотрудник с ID {employee.id} уже находится в отделе")
-        self.__employees.append(employee)
+        for observer in self.__observers:
+            observer._validate_new_employee(self, employee)
+            observer._before_department_changed(self)
+        self.__employees[employee.id] = employee
+        self._order_append((employee,))
+        self.__total_salary += employee.calculate_salary()
+        self._count_type(employee, 1)
+        employee._attach_observer(self)
+        for observer in self.__observers:
+            observer._on_employee_added(self, employee)
+    
+    @write_locked
+    def add_employees(self, employees: Iterable[AbstractEmployee]) -> None:
+        """
+        Добавить нескольких сотрудников за один проход.
+        
+        Все сотрудники проверяются до изменения отдела: при ошибке
+        не добавляется ни один из них.
+        
+        Args:
+            employees: Итерируемый набор сотрудников
+        
+        Raises:
+            TypeError: Если элемент не является сотрудником
+            ValueError: Если ID дублируется в отделе или внутри набора
+        """
+        batch: Dict[int, AbstractEmployee] = {}
+        for employee in employees:
+            if not isinstance(employee, AbstractEmployee):
+                raise TypeError(f"Сотрудник должен быть экземпляром AbstractEmployee, получено: {type(employee)}")
+            if employee.id in self.__employees or employee.id in batch:
+                raise ValueError(f"Сотрудник с ID {employee.id} уже находится в отделе")
+            batch[employee.id] = employee
+        for observer in self.__observers:
+            for employee in batch.values():
+                observer._validate_new_employee(self, employee)
+            observer._before_department_changed(self)
+        self._put_employees(batch.values())
+        for observer in self.__observers:
+            for employee in batch.values():
+                observer._on_employee_added(self, employee)
     
+    @write_locked
     def remove_employee(self, employee_id: int) -> None:
         """
         Удалить сотрудника по ID.
@@ -59,11 +129,204 @@ class Department:
         Raises:
             ValueError: Если сотрудник не найден
         """
-        employee = self.find_employee_by_id(employee_id)
+        employee = self.__employees.get(employee_id)
         if employee is None:
             raise ValueError(f"Сотрудник с ID {employee_id} не найден в отделе")
-        self.__employees.remove(employee)
+        for observer in self.__observers:
+            observer._before_department_changed(self)
+            observer._before_employee_changed(employee)
+        del self.__employees[employee_id]
+        self._order_remove((employee_id,))
+        self._count_type(employee, -1)
+        employee._detach_observer(self)
+        if self.__employees:
+            self.__total_salary -= employee.calculate_salary()
+        else:
+            self.__total_salary = 0.0  # Сбрасываем накопленную погрешность
+        for observer in self.__observers:
+            observer._on_employee_removed(self, employee)
+    
+    @write_locked
+    def remove_employees(self, employee_ids: Iterable[int]) -> List[AbstractEmployee]:
+        """
+        Удалить нескольких сотрудников за один проход.
+        
+        Все ID проверяются до изменения отдела: при ошибке
+        не удаляется ни один сотрудник.
+        
+        Args:
+            employee_ids: Итерируемый набор ID сотрудников
+        
+        Returns:
+            Список удаленных сотрудников в порядке ID
+        
+        Raises:
+            ValueError: Если сотрудник не найден или ID повторяется
+        """
+        batch: Dict[int, AbstractEmployee] = {}
+        for employee_id in employee_ids:
+            employee = self.__employees.get(employee_id)
+            if employee is None or employee_id in batch:
+                raise ValueError(f"Сотрудник с ID {employee_id} не найден в отделе")
+            batch[employee_id] = employee
+        for observer in self.__observers:
+            observer._before_department_changed(self)
+            for employee in batch.values():
+                observer._before_employee_changed(employee)
+        removed = self._take_employees(batch)
+        for observer in self.__observers:
+            for employee in removed:
+                observer._on_employee_removed(self, employee)
+        return removed
+    
+    def _put_employees(self, employees: Iterable[AbstractEmployee]) -> None:
+        """
+        Добавить проверенных сотрудников без уведомления наблюдателей.
+        
+        Обновляет хранилище, накопленные суммы и подписки сотрудников.
+        Вызывающий код отвечает за проверку ID и за индексы компании.
+        """
+        added = {employee.id: employee for employee in employees}
+        self.__employees.update(added)
+        self._order_append(added.values())
+        salary = 0.0
+        for employee in added.values():
+            salary += employee.calculate_salary()
+            employee._attach_observer(self)
+        self.__total_salary += salary
+        self._count_types(added.values(), 1)
+    
+    def _take_employees(self, employee_ids: Iterable[int]) -> List[AbstractEmployee]:
+        """
+        Удалить сотрудников без уведомления наблюдателей.
+        
+        Returns:
+            Список удаленных сотрудников
+        """
+        employees = self.__employees
+        removed = [employees.pop(employee_id) for employee_id in employee_ids]
+        self._order_remove([employee.id for employee in removed])
+        salary = 0.0
+        for employee in removed:
+            salary += employee.calculate_salary()
+            employee._detach_observer(self)
+        if employees:
+            self.__total_salary -= salary
+        else:
+            self.__total_salary = 0.0  # Сбрасываем накопленную погрешность
+        self._count_types(removed, -1)
+        return removed
+    
+    def _order_append(self, employees: Iterable[AbstractEmployee]) -> None:
+        """Добавить сотрудников в конец порядка доступа по индексу."""
+        for employee in employees:
+            self.__seqs[employee.id] = self.__next_seq
+            self.__ordered_seqs.append(self.__next_seq)
+            self.__ordered.append(employee)
+            self.__next_seq += 1
+    
+    def _order_remove(self, employee_ids: List[int]) -> None:
+        """
+        Удалить сотрудников из порядка доступа по индексу.
+        
+        Позиция находится двоичным поиском по номеру добавления;
+        при удалении большой доли отдела порядок строится заново.
+        """
+        if len(employee_ids) * 8 > len(self.__ordered):
+            for employee_id in employee_ids:
+                del self.__seqs[employee_id]
+            self._order_rebuild()
+            return
+        for employee_id in employee_ids:
+            position = bisect_left(self.__ordered_seqs, self.__seqs.pop(employee_id))
+            del self.__ordered_seqs[position]
+            del self.__ordered[position]
+    
+    def _order_rebuild(self) -> None:
+        """Построить порядок доступа по индексу по словарю сотрудников."""
+        self.__ordered = list(self.__employees.values())
+        self.__seqs = {employee_id: seq for seq, employee_id in enumerate(self.__employees)}
+        self.__ordered_seqs = list(range(len(self.__ordered)))
+        self.__next_seq = len(self.__ordered)
+    
+    def _replace_members(self, employees: List[AbstractEmployee]) -> None:
+        """
+        Заменить состав отдела без уведомления наблюдателей.
+        
+        Используется для отката массовых операций компании, которая
+        сама восстанавливает свои индексы.
+        """
+        current = self.__employees
+        replacement = {emp.id: emp for emp in employees}
+        for emp_id, emp in current.items():
+            if replacement.get(emp_id) is not emp:
+                emp._detach_observer(self)
+        for emp_id, emp in replacement.items():
+            if current.get(emp_id) is not emp:
+                emp._attach_observer(self)
+        current.clear()
+        current.update(replacement)
+        self._order_rebuild()
+        self.__type_counts.clear()
+        self._count_types(employees, 1)
+        self.recalculate_total_salary()
+    
+    def _attach_observer(self, observer) -> None:
+        """
+        Подписать наблюдателя (компанию) на изменения состава отдела.
+        
+        Наблюдатель должен реализовывать методы _validate_new_employee,
+        _before_department_changed, _before_employee_changed,
+        _on_employee_added, _on_employee_removed, а также
+        _validate_department_rename и _on_department_renamed.
+        """
+        if observer not in self.__observers:
+            self.__observers.append(observer)
+    
+    def _detach_observer(self, observer) -> None:
+        """Отписать наблюдателя от изменений состава отдела."""
+        if observer in self.__observers:
+            self.__observers.remove(observer)
+    
+    @write_locked
+    def _before_employee_changed(self, employee: AbstractEmployee) -> None:
+        """Передать наблюдателям уведомление о предстоящем изменении сотрудника."""
+        for observer in self.__observers:
+            observer._before_employee_changed(employee)
+    
+    @write_locked
+    def _on_employee_salary_changed(self, employee: AbstractEmployee,
+                                    old_salary: float, new_salary: float) -> None:
+        """Применить изменение зарплаты сотрудника к накопленной сумме."""
+        self.__total_salary += new_salary - old_salary
+        for observer in self.__observers:
+            observer._on_department_salary_changed(self, employee, old_salary, new_salary)
     
+    @write_locked
+    def _validate_employee_id_change(self, employee: AbstractEmployee, new_id: int) -> None:
+        """
+        Проверить, что новый ID сотрудника не занят.
+        
+        Raises:
+            ValueError: Если в отделе уже есть сотрудник с таким ID
+        """
+        if new_id in self.__employees:
+            raise ValueError(f"Сотрудник с ID {new_id} уже находится в отделе")
+        for observer in self.__observers:
+            observer._validate_employee_id_change(employee, new_id)
+    
+    @write_locked
+    def _on_employee_id_changed(self, employee: AbstractEmployee, old_id: int) -> None:
+        """Перестроить ключи хранилища после смены ID с сохранением порядка."""
+        rekeyed = [(employee.id if emp_id == old_id else emp_id, emp)
+                   for emp_id, emp in self.__employees.items()]
+        self.__employees.clear()
+        self.__employees.update(rekeyed)
+        self.__seqs[employee.id] = self.__seqs.pop(old_id)
+        for observer in self.__observers:
+            observer._on_employee_id_changed(employee, old_id)
+    
+    @read_locked
     def get_employees(self) -> List[AbstractEmployee]:
         """
         Получить список всех сотрудников отдела.
@@ -71,19 +334,57 @@ class Department:
         Returns:
             Список сотрудников
         """
-        return self.__employees.copy()
+        return list(self.__employees.values())
     
+    def employees_view(self) -> Mapping[int, AbstractEmployee]:
+        """
+        Получить представление сотрудников только для чтения без копирования.
+        
+        Представление отражает последующие изменения отдела.
+        
+        Returns:
+            Отображение ID -> сотрудник в порядке добавления
+        """
+        return MappingProxyType(self.__employees)
+    
+    @read_locked
     def calculate_total_salary(self) -> float:
         """
         Вычислить общую зарплату всех сотрудников отдела.
         
         Демонстрирует полиморфизм - метод работает с разными типами сотрудников.
         
+        Сумма поддерживается инкрементально при найме, увольнении и изменении
+        зарплаты сотрудников. В режиме CHECK_CONSISTENCY она сверяется
+        с полным пересчетом.
+        
+        Returns:
+            Сумма зарплат всех сотрудников
+        
+        Raises:
+            AggregateConsistencyError: Если в режиме проверки сумма разошлась с пересчетом
+        """
+        if self.CHECK_CONSISTENCY:
+            expected = sum(emp.calculate_salary() for emp in self.__employees.values())
+            if not math.isclose(self.__total_salary, expected, rel_tol=1e-9, abs_tol=1e-6):
+                raise AggregateConsistencyError(
+                    f"Сумма зарплат отдела '{self.__name}' расходится с пересчетом: "
+                    f"{self.__total_salary} != {expected}"
+                )
+        return self.__total_salary
+    
+    @write_locked
+    def recalculate_total_salary(self) -> float:
+        """
+        Пересчитать суммарную зарплату с нуля и сбросить накопленную погрешность.
+        
         Returns:
             Сумма зарплат всех сотрудников
         """
-        return sum(emp.calculate_salary() for emp in self.__employees)
+        self.__total_salary = sum(emp.calculate_salary() for emp in self.__employees.values())
+        return self.__total_salary
     
+    @read_locked
     def get_employee_count(self) -> Dict[str, int]:
         """
         Получить количество сотрудников каждого типа.
@@ -91,12 +392,37 @@ class Department:
         Returns:
             Словарь с количеством сотрудников по типам
         """
-        counts: Dict[str, int] = {}
-        for emp in self.__employees:
-            emp_type = emp.__class__.__name__
-            counts[emp_type] = counts.get(emp_type, 0) + 1
-        return counts
+        if self.CHECK_CONSISTENCY:
+            expected: Dict[str, int] = {}
+            for emp in self.__employees.values():
+                emp_type = emp.__class__.__name__
+                expected[emp_type] = expected.get(emp_type, 0) + 1
+            if expected != self.__type_counts:
+                raise AggregateConsistencyError(
+                    f"Счетчики типов отдела '{self.__name}' расходятся с пересчетом: "
+                    f"{self.__type_counts} != {expected}"
+                )
+        return dict(self.__type_counts)
     
+    def _count_types(self, employees: Iterable[AbstractEmployee], sign: int) -> None:
+        """Изменить счетчики типов на число сотрудников каждого типа со знаком sign."""
+        for emp_type, count in Counter(emp.__class__.__name__ for emp in employees).items():
+            total = self.__type_counts.get(emp_type, 0) + sign * count
+            if total:
+                self.__type_counts[emp_type] = total
+            else:
+                del self.__type_counts[emp_type]
+    
+    def _count_type(self, employee: AbstractEmployee, delta: int) -> None:
+        """Изменить счетчик сотрудников типа employee на delta."""
+        emp_type = employee.__class__.__name__
+        count = self.__type_counts.get(emp_type, 0) + delta
+        if count:
+            self.__type_counts[emp_type] = count
+        else:
+            del self.__type_counts[emp_type]
+    
+    @read_locked
     def find_employee_by_id(self, employee_id: int) -> Optional[AbstractEmployee]:
         """
         Найти сотрудника по ID.
@@ -107,10 +433,7 @@ class Department:
         Returns:
             Объект сотрудника или None если не найден
         """
-        for emp in self.__employees:
-            if hasattr(emp, 'id') and emp.id == employee_id:
-                return emp
-        return None
+        return self.__employees.get(employee_id)
     
     def __len__(self) -> int:
         """
@@ -121,6 +444,7 @@ class Department:
         """
         return len(self.__employees)
     
+    @read_locked
     def __getitem__(self, key) -> AbstractEmployee:
         """
         Доступ к сотруднику по индексу.
@@ -134,8 +458,9 @@ class Department:
         Raises:
             IndexError: Если индекс вне диапазона
         """
-        return self.__employees[key]
+        return self.__ordered[key]
     
+    @read_locked
     def __contains__(self, employee: AbstractEmployee) -> bool:
         """
         Проверка принадлежности сотрудника отделу.
@@ -146,7 +471,8 @@ class Department:
         Returns:
             True если сотрудник в отделе, False иначе
         """
-        return employee in self.__employees
+        stored = self.__employees.get(getattr(employee, 'id', None))
+        return stored is not None and stored == employee
     
     def __iter__(self):
         """
@@ -155,8 +481,9 @@ class Department:
         Returns:
             Итератор по списку сотрудников
         """
-        return iter(self.__employees)
+        return iter(self.__employees.values())
     
+    @read_locked
     def save_to_file(self, filename: str) -> None:
         """
         Сохранить всех сотрудников отдела в JSON файл.
@@ -166,7 +493,7 @@ class Department:
         """
         data = {
             "name": self.__name,
-            "employees": [self._employee_to_dict(emp) for emp in self.__employees]
+            "employees": [self._employee_to_dict(emp) for emp in self.__employees.values()]
         }
         with open(filename, 'w', encoding='utf-8') as f:
             json.dump(data, f, ensure_ascii=False, indent=2)
@@ -199,9 +526,7 @@ class Department:
             Объект Department
         """
         dept = cls(data["name"])
-        for emp_data in data.get("employees", []):
-            employee = cls._employee_from_dict(emp_data)
-            dept.add_employee(employee)
+        dept.add_employees(employee_from_dict(emp_data) for emp_data in data.get("employees", []))
         return dept
     
     @staticmethod
@@ -218,45 +543,6 @@ class Department:
             "base_salary": getattr(employee, 'base_salary', None)
         }
     
-    @staticmethod
-    def _employee_from_dict(data: dict) -> AbstractEmployee:
-        """Создать объект сотрудника из словаря."""
-        from src.core.employee import Employee
-        from src.employees.manager import Manager
-        from src.employees.developer import Developer
-        from src.employees.salesperson import Salesperson
-        
-        emp_type = data.get("type", "Employee")
-        
-        if emp_type == "Manager":
-            return Manager(
-                id=data["id"],
-                name=data["name"],
-                department=data["department"],
-                base_salary=data["base_salary"],
-                bonus=data.get("bonus", 0)
-            )
-        elif emp_type == "Developer":
-            return Developer(
-                id=data["id"],
-                name=data["name"],
-                department=data["department"],
-                base_salary=data["base_salary"],
-                tech_stack=data.get("tech_stack", []),
-                seniority_level=data.get("seniority_level", "junior")
-            )
-        elif emp_type == "Salesperson":
-            return Salesperson(
-                id=data["id"],
-                name=data["name"],
-                department=data["department"],
-                base_salary=data["base_salary"],
-                commission_rate=data.get("commission_rate", 0),
-                sales_volume=data.get("sales_volume", 0)
-            )
-        else:
-            return Employee.from_dict(data)
-    
     def __str__(self) -> str:
         """
         Строковое представление отдела.
@@ -1,15 +1,24 @@
 """Базовый класс Employee с инкапсуляцией данных."""
 
+import sys
+from contextlib import contextmanager
+from typing import Iterator
 from src.core.abstract_employee import AbstractEmployee
+from src.core.registry import register_employee_type
 
 
+@register_employee_type("Employee")
 class Employee(AbstractEmployee):
     """
     Базовый класс для представления сотрудника компании.
     
     Реализует инкапсуляцию через приватные атрибуты и свойства.
+    Атрибуты хранятся в слотах, а названия отделов интернируются,
+    чтобы миллионы объектов не держали собственные __dict__ и копии строк.
     """
     
+    __slots__ = ('__observers', '__id', '__name', '__department', '__base_salary')
+    
     def __init__(self, id: int, name: str, department: str, base_salary: float):
         """
         Инициализация сотрудника.
@@ -20,9 +29,10 @@ class Employee(AbstractEmployee):
             department: Отдел сотрудника
             base_salary: Базовая зарплата
         """
+        self.__observers: tuple = ()  # Отделы и проекты, хранящие агрегаты по сотруднику
         self.__id = id
         self.__name = name
-        self.__department = department
+        self.__department = sys.intern(department) if isinstance(department, str) else department
         self.__base_salary = base_salary
         
         # Валидация при инициализации
@@ -45,6 +55,76 @@ class Employee(AbstractEmployee):
         if not isinstance(value, (int, float)) or value < 0:
             raise ValueError(f"Базовая зарплата должна быть неотрицательным числом, получено: {value}")
     
+    def _attach_observer(self, observer) -> None:
+        """
+        Подписать контейнер на изменения сотрудника.
+        
+        Наблюдатель должен реализовывать методы _before_employee_changed,
+        _on_employee_salary_changed, _validate_employee_id_change
+        и _on_employee_id_changed.
+        """
+        if not any(obs is observer for obs in self.__observers):
+            self.__observers = self.__observers + (observer,)
+    
+    def _detach_observer(self, observer) -> None:
+        """Отписать контейнер от изменений сотрудника."""
+        self.__observers = tuple(obs for obs in self.__observers if obs is not observer)
+    
+    def _notify_before_change(self) -> None:
+        """Сообщить наблюдателям о предстоящем изменении полей сотрудника."""
+        for observer in self.__observers:
+            observer._before_employee_changed(self)
+    
+    @contextmanager
+    def _locked_change(self) -> Iterator[None]:
+        """
+        Выполнить изменение полей под блокировкой записи наблюдателей.
+        
+        Отделы и проекты компании в многопоточном режиме делят одну
+        блокировку (атрибут _lock), поэтому чтение старой зарплаты,
+        запись поля и уведомления не перемежаются с другими потоками.
+        """
+        locks = []
+        for observer in self.__observers:
+            lock = getattr(observer, '_lock', None)
+            if lock is not None and not any(held is lock for held in locks):
+                locks.append(lock)
+        for lock in locks:
+            lock.acquire_write()
+        try:
+            self._notify_before_change()
+            yield
+        finally:
+            for lock in reversed(locks):
+                lock.release_write()
+    
+    @contextmanager
+    def _salary_change(self) -> Iterator[None]:
+        """
+        Выполнить изменение, влияющее на итоговую зарплату.
+        
+        Под блокировкой наблюдателей запоминает зарплату до изменения
+        и после выхода из блока сообщает наблюдателям разницу.
+        """
+        with self._locked_change():
+            old_salary = self.calculate_salary()
+            yield
+            self._notify_salary_changed(old_salary)
+    
+    def _notify_salary_changed(self, old_salary: float) -> None:
+        """
+        Сообщить наблюдателям об изменении итоговой зарплаты.
+        
+        Args:
+            old_salary: Итоговая зарплата до изменения
+        """
+        if not self.__observers:
+            return
+        new_salary = self.calculate_salary()
+        if new_salary != old_salary:
+            for observer in self.__observers:
+                observer._on_employee_salary_changed(self, old_salary, new_salary)
+    
     @property
     def id(self) -> int:
         """Получить ID сотрудника."""
@@ -54,7 +134,15 @@ class Employee(AbstractEmployee):
     def id(self, value: int) -> None:
         """Установить ID сотрудника."""
         self._validate_id(value)
-        self.__id = value
+        if value == self.__id:
+            return
+        with self._locked_change():
+            for observer in self.__observers:
+                observer._validate_employee_id_change(self, value)
+            old_id = self.__id
+            self.__id = value
+            for observer in self.__observers:
+                observer._on_employee_id_changed(self, old_id)
     
     @property
     def name(self) -> str:
@@ -65,7 +153,8 @@ class Employee(AbstractEmployee):
     def name(self, value: str) -> None:
         """Установить имя сотрудника."""
         self._validate_name(value)
-        self.__name = value
+        with self._locked_change():
+            self.__name = value
     
     @property
     def department(self) -> str:
@@ -77,7 +166,8 @@ class Employee(AbstractEmployee):
         """Установить отдел сотрудника."""
         if not isinstance(value, str) or not value.strip():
             raise ValueError(f"Отдел не должен быть пустой строкой, получено: '{value}'")
-        self.__department = value
+        with self._locked_change():
+            self.__department = sys.intern(value)
     
     @property
     def base_salary(self) -> float:
@@ -88,7 +178,8 @@ class Employee(AbstractEmployee):
     def base_salary(self, value: float) -> None:
         """Установить базовую зарплату сотрудника."""
         self._validate_base_salary(value)
-        self.__base_salary = float(value)
+        with self._salary_change():
+            self.__base_salary = float(value)
     
     def calculate_salary(self) -> float:
         """
@@ -124,6 +215,15 @@ class Employee(AbstractEmployee):
             return NotImplemented
         return self.__id == other.id
     
+    def __hash__(self) -> int:
+        """
+        Хеш сотрудника по ID (согласован с __eq__).
+        
+        Returns:
+            Хеш идентификатора сотрудника
+        """
+        return hash(self.__id)
+    
     def __lt__(self, other) -> bool:
         """
         Сравнение сотрудников по итоговой зарплате.
@@ -199,6 +299,24 @@ class Employee(AbstractEmployee):
             base_salary=data["base_salary"]
         )
     
+    @classmethod
+    def _restore(cls, id: int, name: str, department: str, base_salary: float):
+        """
+        Восстановить сотрудника из заведомо корректных данных без валидации.
+        
+        Используется при загрузке снимков, которые были проверены при записи.
+        
+        Returns:
+            Объект сотрудника
+        """
+        employee = cls.__new__(cls)
+        employee.__observers = ()
+        employee.__id = id
+        employee.__name = name
+        employee.__department = sys.intern(department)
+        employee.__base_salary = base_salary
+        return employee
+    
     def __str__(self) -> str:
         """
         Строковое представление сотрудника.
@@ -1,9 +1,36 @@
 """Класс Project (Проект) с композицией сотрудников."""
 
 from datetime import datetime
-from typing import List, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import List, Optional, Dict, Mapping
 from src.core.abstract_employee import AbstractEmployee
 from src.utils.exceptions import InvalidStatusError
+from src.utils.locks import read_locked, write_locked
+
+
+@lru_cache(maxsize=4096)
+def parse_deadline(value: str) -> datetime:
+    """
+    Разобрать дату срока выполнения в формате YYYY-MM-DD.
+    
+    Канонические строки разбираются через datetime.fromisoformat, что
+    заметно быстрее strptime; остальные строки проверяются strptime.
+    Результаты кэшируются: при массовой загрузке сроки часто совпадают.
+    
+    Args:
+        value: Строка с датой
+    
+    Returns:
+        Объект datetime
+    
+    Raises:
+        ValueError: При неверном формате даты
+    """
+    if (isinstance(value, str) and len(value) == 10 and value[4] == '-' and value[7] == '-'
+            and value[:4].isdigit() and value[5:7].isdigit() and value[8:].isdigit()):
+        return datetime.fromisoformat(value)
+    return datetime.strptime(value, "%Y-%m-%d")
 
 
 class Project:
@@ -33,15 +60,19 @@ class Project:
         """
         self._validate_project_id(project_id)
         self._validate_name(name)
-        self._validate_deadline(deadline)
+        parsed_deadline = self._parse_deadline(deadline)
         self._validate_status(status)
         
         self.__project_id = project_id
         self.__name = name
         self.__description = description
-        self.__deadline = datetime.strptime(deadline, "%Y-%m-%d")
+        self.__deadline = parsed_deadline
         self.__status = status
-        self.__team: List[AbstractEmployee] = []  # Композиция
+        # Композиция: упорядоченный словарь ID -> сотрудник
+        self.__team: Dict[int, AbstractEmployee] = {}
+        self.__budget: Optional[float] = None  # Кэш бюджета команды
+        self.__observers: List = []  # Компании, которые индексируют назначения
+        self._lock = None  # Блокировка компании в многопоточном режиме
     
     def _validate_project_id(self, value: int) -> None:
         """Валидация ID проекта."""
@@ -55,8 +86,13 @@ class Project:
     
     def _validate_deadline(self, value: str) -> None:
         """Валидация срока выполнения."""
+        self._parse_deadline(value)
+    
+    @staticmethod
+    def _parse_deadline(value: str) -> datetime:
+        """Разобрать срок выполнения с проверкой формата."""
         try:
-            datetime.strptime(value, "%Y-%m-%d")
+            return parse_deadline(value)
         except ValueError:
             raise ValueError(f"Срок выполнения должен быть в формате YYYY-MM-DD, получено: '{value}'")
     
@@ -92,6 +128,7 @@ class Project:
         """Получить статус проекта."""
         return self.__status
     
+    @write_locked
     def add_team_member(self, employee: AbstractEmployee) -> None:
         """
         Добавить сотрудника в проект.
@@ -104,10 +141,17 @@ class Project:
         """
         if not isinstance(employee, AbstractEmployee):
             raise TypeError(f"Сотрудник должен быть экземпляром AbstractEmployee, получено: {type(employee)}")
-        if employee in self.__team:
+        if employee.id in self.__team:
             raise ValueError(f"Сотрудник с ID {employee.id} уже в команде проекта")
-        self.__team.append(employee)
+        for observer in self.__observers:
+            observer._before_project_changed(self)
+        self.__team[employee.id] = employee
+        self.__budget = None
+        employee._attach_observer(self)
+        for observer in self.__observers:
+            observer._on_team_member_added(self, employee)
     
+    @write_locked
     def remove_team_member(self, employee_id: int) -> None:
         """
         Удалить сотрудника по ID.
@@ -118,11 +162,69 @@ class Project:
         Raises:
             ValueError: Если сотрудник не найден
         """
-        employee = self.find_team_member(employee_id)
+        employee = self.__team.get(employee_id)
         if employee is None:
             raise ValueError(f"Сотрудник с ID {employee_id} не найден в команде проекта")
-        self.__team.remove(employee)
+        for observer in self.__observers:
+            observer._before_project_changed(self)
+            observer._before_employee_changed(employee)
+        del self.__team[employee_id]
+        self.__budget = None
+        employee._detach_observer(self)
+        for observer in self.__observers:
+            observer._on_team_member_removed(self, employee)
+    
+    def _attach_observer(self, observer) -> None:
+        """
+        Подписать наблюдателя (компанию) на изменения команды и статуса.
+        
+        Наблюдатель должен реализовывать методы _before_project_changed,
+        _before_employee_changed, _on_team_member_added,
+        _on_team_member_removed, _on_project_status_changed
+        и _on_project_budget_changed.
+        """
+        if observer not in self.__observers:
+            self.__observers.append(observer)
+    
+    def _detach_observer(self, observer) -> None:
+        """Отписать наблюдателя от изменений команды."""
+        if observer in self.__observers:
+            self.__observers.remove(observer)
     
+    @write_locked
+    def _before_employee_changed(self, employee: AbstractEmployee) -> None:
+        """Передать наблюдателям уведомление о предстоящем изменении члена команды."""
+        for observer in self.__observers:
+            observer._before_employee_changed(employee)
+    
+    @write_locked
+    def _on_employee_salary_changed(self, employee: AbstractEmployee,
+                                    old_salary: float, new_salary: float) -> None:
+        """Сбросить кэш бюджета и сообщить наблюдателям об изменении бюджета."""
+        self.__budget = None
+        for observer in self.__observers:
+            observer._on_project_budget_changed(self, new_salary - old_salary)
+    
+    @write_locked
+    def _validate_employee_id_change(self, employee: AbstractEmployee, new_id: int) -> None:
+        """
+        Проверить, что новый ID сотрудника не занят в команде.
+        
+        Raises:
+            ValueError: Если в команде уже есть сотрудник с таким ID
+        """
+        if new_id in self.__team:
+            raise ValueError(f"Сотрудник с ID {new_id} уже в команде проекта")
+    
+    @write_locked
+    def _on_employee_id_changed(self, employee: AbstractEmployee, old_id: int) -> None:
+        """Перестроить ключи команды на месте с сохранением порядка."""
+        rekeyed = [(employee.id if emp_id == old_id else emp_id, emp)
+                   for emp_id, emp in self.__team.items()]
+        self.__team.clear()
+        self.__team.update(rekeyed)
+    
+    @read_locked
     def get_team(self) -> List[AbstractEmployee]:
         """
         Получить список команды проекта.
@@ -130,7 +232,18 @@ class Project:
         Returns:
             Список сотрудников команды
         """
-        return self.__team.copy()
+        return list(self.__team.values())
+    
+    def team_view(self) -> Mapping[int, AbstractEmployee]:
+        """
+        Получить представление команды только для чтения без копирования.
+        
+        Представление отражает последующие изменения команды.
+        
+        Returns:
+            Отображение ID -> сотрудник в порядке добавления
+        """
+        return MappingProxyType(self.__team)
     
     def get_team_size(self) -> int:
         """
@@ -141,15 +254,22 @@ class Project:
         """
         return len(self.__team)
     
+    @read_locked
     def calculate_total_salary(self) -> float:
         """
         Рассчитать суммарную зарплату команды.
         
+        Значение кэшируется и сбрасывается при изменении состава команды
+        или зарплаты любого из ее членов.
+        
         Returns:
             Сумма зарплат всех членов команды
         """
-        return sum(emp.calculate_salary() for emp in self.__team)
+        if self.__budget is None:
+            self.__budget = sum(emp.calculate_salary() for emp in self.__team.values())
+        return self.__budget
     
+    @read_locked
     def get_project_info(self) -> str:
         """
         Получить полную информацию о проекте.
@@ -162,6 +282,7 @@ class Project:
                 f"статус: {self.__status}, размер команды: {len(self.__team)}, "
                 f"бюджет команды: {self.calculate_total_salary()}]")
     
+    @write_locked
     def change_status(self, new_status: str) -> None:
         """
         Изменить статус проекта.
@@ -173,8 +294,15 @@ class Project:
             InvalidStatusError: Если статус невалиден
         """
         self._validate_status(new_status)
+        for observer in self.__observers:
+            observer._before_project_changed(self)
+        old_status = self.__status
         self.__status = new_status
+        if old_status != new_status:
+            for observer in self.__observers:
+                observer._on_project_status_changed(self, old_status)
     
+    @read_locked
     def find_team_member(self, employee_id: int) -> Optional[AbstractEmployee]:
         """
         Найти члена команды по ID.
@@ -185,11 +313,9 @@ class Project:
         Returns:
             Объект сотрудника или None
         """
-        for emp in self.__team:
-            if hasattr(emp, 'id') and emp.id == employee_id:
-                return emp
-        return None
+        return self.__team.get(employee_id)
     
+    @read_locked
     def to_dict(self) -> dict:
         """
         Сериализация проекта в словарь.
@@ -203,7 +329,7 @@ class Project:
             "description": self.__description,
             "deadline": self.__deadline.strftime("%Y-%m-%d"),
             "status": self.__status,
-            "team": [self._employee_to_dict(emp) for emp in self.__team]
+            "team": [self._employee_to_dict(emp) for emp in self.__team.values()]
         }
     
     @staticmethod
@@ -0,0 +1,95 @@
+"""
+Реестр типов сотрудников для полиморфной десериализации.
+
+Тег "type" из словаря сериализации отображается на конструктор
+класса (его from_dict). Классы сотрудников регистрируются декоратором
+register_employee_type при импорте своего модуля, поэтому новый тип
+подключается без правки кода загрузки.
+"""
+
+from typing import Callable, Dict, List, Type
+from src.core.abstract_employee import AbstractEmployee
+
+
+DEFAULT_EMPLOYEE_TYPE = "Employee"
+
+# Тег -> конструктор из словаря
+_constructors: Dict[str, Callable[[dict], AbstractEmployee]] = {}
+# Тег в нижнем регистре -> тег (для фабрики и билдера)
+_aliases: Dict[str, str] = {}
+
+
+def register_employee_type(tag: str) -> Callable[[Type[AbstractEmployee]], Type[AbstractEmployee]]:
+    """
+    Декоратор класса: зарегистрировать тип сотрудника под тегом.
+    
+    Конструктором служит метод класса from_dict.
+    
+    Args:
+        tag: Значение поля "type" в словаре сериализации
+    
+    Returns:
+        Декоратор, возвращающий класс без изменений
+    
+    Raises:
+        ValueError: Если тег уже занят другим классом
+    """
+    def decorator(cls: Type[AbstractEmployee]) -> Type[AbstractEmployee]:
+        existing = _constructors.get(tag)
+        if existing is not None and existing.__self__ is not cls:
+            raise ValueError(f"Тип сотрудника '{tag}' уже зарегистрирован")
+        _constructors[tag] = cls.from_dict
+        _aliases[tag.lower()] = tag
+        return cls
+    return decorator
+
+
+def get_employee_constructor(tag: str) -> Callable[[dict], AbstractEmployee]:
+    """
+    Получить конструктор зарегистрированного типа без учета регистра.
+    
+    Args:
+        tag: Тег типа ("Manager", "manager", ...)
+    
+    Returns:
+        Функция, создающая сотрудника из словаря
+    
+    Raises:
+        ValueError: Если тип не зарегистрирован
+    """
+    constructor = _constructors.get(tag) or _constructors.get(_aliases.get(tag.lower(), ""))
+    if constructor is None:
+        raise ValueError(
+            f"Неизвестный тип сотрудника: {tag}. "
+            f"Доступные типы: {', '.join(alias for alias in _aliases)}"
+        )
+    return constructor
+
+
+def employee_from_dict(data: dict) -> AbstractEmployee:
+    """
+    Создать сотрудника из словаря по тегу "type".
+    
+    Записи без тега и с незарегистрированным тегом создаются
+    как базовый Employee.
+    
+    Args:
+        data: Словарь сериализации сотрудника
+    
+    Returns:
+        Объект сотрудника
+    """
+    constructor = _constructors.get(data.get("type", DEFAULT_EMPLOYEE_TYPE))
+    if constructor is None:
+        constructor = _constructors[DEFAULT_EMPLOYEE_TYPE]
+    return constructor(data)
+
+
+def registered_employee_types() -> List[str]:
+    """
+    Получить теги зарегистрированных типов в порядке регистрации.
+    
+    Returns:
+        Список тегов
+    """
+    return list(_constructors)
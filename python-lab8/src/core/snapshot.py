@@ -0,0 +1,299 @@
+"""
+Согласованные снимки компании для длительных отчетов.
+
+Снимок не копирует компанию при создании. Перед первым изменением
+сотрудника, состава отдела, проекта или набора отделов и проектов
+компания сохраняет в каждый живой снимок прежнее состояние этого объекта
+(копирование при записи). Неизмененные объекты читаются из живой
+компании, поэтому расход памяти пропорционален числу изменений,
+а не размеру компании.
+"""
+
+import csv
+import json
+from typing import Dict, Iterator, List, Mapping, NamedTuple, Optional, Tuple
+from src.core.abstract_employee import AbstractEmployee
+from src.core.department import Department
+from src.core.project import Project
+
+
+class EmployeeState(NamedTuple):
+    """Состояние сотрудника в снимке."""
+    
+    record: dict  # Словарь сериализации сотрудника
+    type: str  # Имя класса сотрудника
+    salary: float  # Итоговая зарплата
+
+
+class ProjectState(NamedTuple):
+    """Состояние проекта в снимке."""
+    
+    project_id: int
+    name: str
+    description: str
+    deadline: str
+    status: str
+    team: Tuple[EmployeeState, ...]
+    
+    @property
+    def budget(self) -> float:
+        """Суммарная зарплата команды."""
+        return sum(member.salary for member in self.team)
+
+
+class CompanySnapshot:
+    """
+    Неизменяемое представление компании на момент создания.
+    
+    Создается методом Company.snapshot(). Чтение идет по отделам
+    под короткими блокировками чтения компании, поэтому длительный
+    экспорт не останавливает запись.
+    """
+    
+    def __init__(self, company, department_stats: Dict, budget_analysis: Dict, total_cost: float):
+        """
+        Инициализация снимка.
+        
+        Args:
+            company: Компания, с которой снят снимок
+            department_stats: Статистика отделов на момент снимка
+            budget_analysis: Анализ бюджетов на момент снимка
+            total_cost: Месячные затраты на момент снимка
+        """
+        self.__company = company
+        self.__name = company.name
+        self.__department_stats = department_stats
+        self.__budget_analysis = budget_analysis
+        self.__total_cost = total_cost
+        # Прежние состояния, сохраненные перед первым изменением
+        self.__departments: Optional[List[Tuple[str, Department]]] = None
+        self.__projects: Optional[List[Project]] = None
+        self.__members: Dict[int, Tuple[Department, List[AbstractEmployee]]] = {}
+        self.__employees: Dict[int, Tuple[AbstractEmployee, EmployeeState]] = {}
+        self.__project_states: Dict[int, Tuple[Project, str, List[AbstractEmployee]]] = {}
+        self.__closed = False
+    
+    @property
+    def name(self) -> str:
+        """Получить название компании на момент снимка."""
+        return self.__name
+    
+    def get_change_count(self) -> int:
+        """
+        Получить число объектов, сохраненных снимком при изменениях.
+        
+        Returns:
+            Количество сохраненных прежних состояний
+        """
+        return (len(self.__members) + len(self.__employees) + len(self.__project_states)
+                + (self.__departments is not None) + (self.__projects is not None))
+    
+    # Копирование при записи: вызывается компанией под блокировкой записи
+    
+    def _capture_departments(self, departments: Mapping[str, Department]) -> None:
+        """Сохранить набор отделов перед его изменением."""
+        if self.__departments is None:
+            self.__departments = list(departments.items())
+    
+    def _capture_projects(self, projects: Mapping[int, Project]) -> None:
+        """Сохранить набор проектов перед его изменением."""
+        if self.__projects is None:
+            self.__projects = list(projects.values())
+    
+    def _capture_members(self, department: Department) -> None:
+        """Сохранить состав отдела перед его изменением."""
+        if id(department) not in self.__members:
+            self.__members[id(department)] = (department, list(department))
+    
+    def _capture_employee(self, employee: AbstractEmployee) -> None:
+        """Сохранить состояние сотрудника перед его изменением."""
+        if id(employee) not in self.__employees:
+            self.__employees[id(employee)] = (employee, self._read_employee(employee))
+    
+    def _capture_project(self, project: Project) -> None:
+        """Сохранить статус и команду проекта перед их изменением."""
+        if id(project) not in self.__project_states:
+            self.__project_states[id(project)] = (project, project.status, list(project.team_view().values()))
+    
+    # Чтение
+    
+    @staticmethod
+    def _read_employee(employee: AbstractEmployee) -> EmployeeState:
+        """Прочитать текущее состояние сотрудника."""
+        return EmployeeState(Department._employee_to_dict(employee),
+                             employee.__class__.__name__,
+                             employee.calculate_salary())
+    
+    def _employee_state(self, employee: AbstractEmployee) -> EmployeeState:
+        """Состояние сотрудника на момент снимка."""
+        saved = self.__employees.get(id(employee))
+        return saved[1] if saved is not None else self._read_employee(employee)
+    
+    def _check_open(self) -> None:
+        """Проверить, что снимок не закрыт."""
+        if self.__closed:
+            raise ValueError("Снимок закрыт")
+    
+    def iter_departments(self) -> Iterator[Tuple[str, List[EmployeeState]]]:
+        """
+        Перебрать отделы снимка.
+        
+        Каждый отдел читается под отдельной короткой блокировкой чтения.
+        
+        Yields:
+            Пары (название отдела, состояния сотрудников)
+        """
+        self._check_open()
+        with self.__company.read_transaction():
+            departments = self.__departments
+            if departments is None:
+                departments = list(self.__company.departments_view().items())
+        for name, department in departments:
+            with self.__company.read_transaction():
+                saved = self.__members.get(id(department))
+                members = saved[1] if saved is not None else department
+                states = [self._employee_state(emp) for emp in members]
+            yield name, states
+    
+    def iter_employees(self) -> Iterator[EmployeeState]:
+        """
+        Перебрать сотрудников снимка в порядке отделов.
+        
+        Yields:
+            Состояния сотрудников
+        """
+        for _, states in self.iter_departments():
+            yield from states
+    
+    def iter_projects(self) -> Iterator[ProjectState]:
+        """
+        Перебрать проекты снимка.
+        
+        Yields:
+            Состояния проектов
+        """
+        self._check_open()
+        with self.__company.read_transaction():
+            projects = self.__projects
+            if projects is None:
+                projects = list(self.__company.projects_view().values())
+        for project in projects:
+            with self.__company.read_transaction():
+                saved = self.__project_states.get(id(project))
+                if saved is not None:
+                    status, team = saved[1], saved[2]
+                else:
+                    status, team = project.status, project.team_view().values()
+                states = tuple(self._employee_state(emp) for emp in team)
+            yield ProjectState(project.project_id, project.name, project.description,
+                               project.deadline.strftime("%Y-%m-%d"), status, states)
+    
+    def calculate_total_monthly_cost(self) -> float:
+        """Получить месячные затраты на момент снимка."""
+        return self.__total_cost
+    
+    def get_department_stats(self) -> Dict:
+        """Получить статистику по отделам на момент снимка."""
+        return {name: {**stats, "employee_types": dict(stats["employee_types"])}
+                for name, stats in self.__department_stats.items()}
+    
+    def get_project_budget_analysis(self) -> Dict:
+        """Получить анализ бюджетов проектов на момент снимка."""
+        analysis = dict(self.__budget_analysis)
+        analysis["by_status"] = {status: dict(entry) for status, entry in analysis["by_status"].items()}
+        return analysis
+    
+    def to_dict(self) -> dict:
+        """
+        Сериализовать снимок в формат Company.save_to_json.
+        
+        Returns:
+            Словарь с данными компании
+        """
+        return {
+            "name": self.__name,
+            "departments": [
+                {"name": name, "employees": [dict(state.record) for state in states]}
+                for name, states in self.iter_departments()
+            ],
+            "projects": [
+                {
+                    "project_id": proj.project_id,
+                    "name": proj.name,
+                    "description": proj.description,
+                    "deadline": proj.deadline,
+                    "status": proj.status,
+                    "team": [dict(member.record) for member in proj.team]
+                }
+                for proj in self.iter_projects()
+            ]
+        }
+    
+    def save_to_json(self, filename: str) -> None:
+        """
+        Сохранить снимок в JSON файл.
+        
+        Args:
+            filename: Имя файла для сохранения
+        """
+        data = self.to_dict()
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+    
+    def export_employees_csv(self, filename: str) -> None:
+        """
+        Экспортировать отчет по сотрудникам снимка в CSV.
+        
+        Args:
+            filename: Имя файла для экспорта
+        """
+        with open(filename, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(["ID", "Имя", "Отдел", "Тип", "Базовая зарплата", "Итоговая зарплата"])
+            for state in self.iter_employees():
+                record = state.record
+                writer.writerow([
+                    record["id"],
+                    record["name"],
+                    record["department"],
+                    state.type,
+                    record["base_salary"],
+                    state.salary
+                ])
+    
+    def export_projects_csv(self, filename: str) -> None:
+        """
+        Экспортировать отчет по проектам снимка в CSV.
+        
+        Args:
+            filename: Имя файла для экспорта
+        """
+        with open(filename, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(["ID проекта", "Название", "Статус", "Срок", "Размер команды", "Бюджет команды"])
+            for proj in self.iter_projects():
+                writer.writerow([
+                    proj.project_id,
+                    proj.name,
+                    proj.status,
+                    proj.deadline,
+                    len(proj.team),
+                    proj.budget
+                ])
+    
+    def close(self) -> None:
+        """Закрыть снимок: компания перестает сохранять для него изменения."""
+        if not self.__closed:
+            self.__closed = True
+            self.__company._release_snapshot(self)
+            self.__members.clear()
+            self.__employees.clear()
+            self.__project_states.clear()
+    
+    def __enter__(self) -> 'CompanySnapshot':
+        """Вход в контекстный менеджер."""
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Выход из контекстного менеджера с закрытием снимка."""
+        self.close()
@@ -1,3 +1,7 @@
 """Классы сотрудников."""
 
+from src.employees.manager import Manager
+from src.employees.developer import Developer
+from src.employees.salesperson import Salesperson
 
+__all__ = ["Manager", "Developer", "Salesperson"]
@@ -1,22 +1,54 @@
 """Класс Developer (Разработчик)."""
 
-from typing import List
+import sys
+import weakref
+from typing import List, Tuple
 from src.core.employee import Employee
+from src.core.registry import register_employee_type
 
 
+class _TechStack:
+    """
+    Общий стек технологий.
+    
+    Обертка над кортежем нужна для слабых ссылок из пула:
+    на сам кортеж слабую ссылку создать нельзя.
+    """
+    
+    __slots__ = ('skills', '__weakref__')
+    
+    def __init__(self, skills: Tuple[str, ...]):
+        """
+        Инициализация стека.
+        
+        Args:
+            skills: Кортеж интернированных названий технологий
+        """
+        self.skills = skills
+
+
+@register_employee_type("Developer")
 class Developer(Employee):
     """
     Класс для представления разработчика.
     
     Разработчик получает базовую зарплату, умноженную на коэффициент уровня.
+    Стек технологий хранится как общий для всех разработчиков кортеж
+    интернированных строк: одинаковые стеки не дублируются в памяти.
     """
     
+    __slots__ = ('__tech_stack', '__seniority_level')
+    
     SENIORITY_COEFFICIENTS = {
         "junior": 1.0,
         "middle": 1.5,
         "senior": 2.0
     }
     
+    # Пул используемых стеков технологий: кортеж -> общий стек.
+    # Стек удаляется из пула, когда на него не ссылается ни один разработчик.
+    _TECH_STACK_POOL: 'weakref.WeakValueDictionary[Tuple[str, ...], _TechStack]' = weakref.WeakValueDictionary()
+    
     def __init__(self, id: int, name: str, department: str, base_salary: float,
                  tech_stack: List[str], seniority_level: str):
         """
@@ -31,10 +63,35 @@ class Developer(Employee):
             seniority_level: Уровень (junior, middle, senior)
         """
         super().__init__(id, name, department, base_salary)
-        self.__tech_stack = list(tech_stack) if tech_stack else []
-        self.__seniority_level = seniority_level
         self._validate_seniority_level(seniority_level)
         self._validate_tech_stack(tech_stack)
+        self.__tech_stack = self._share_tech_stack(tech_stack)
+        self.__seniority_level = self._canonical_level(seniority_level)
+    
+    @classmethod
+    def _share_tech_stack(cls, skills) -> _TechStack:
+        """
+        Получить общий стек технологий из пула.
+        
+        Args:
+            skills: Последовательность названий технологий
+        
+        Returns:
+            Общий стек с кортежем интернированных строк
+        """
+        key = tuple(sys.intern(skill) for skill in skills)
+        stack = cls._TECH_STACK_POOL.get(key)
+        if stack is None:
+            stack = _TechStack(key)
+            cls._TECH_STACK_POOL[key] = stack
+        return stack
+    
+    def _canonical_level(self, value: str) -> str:
+        """Вернуть строку уровня из SENIORITY_COEFFICIENTS вместо копии."""
+        for level in self.SENIORITY_COEFFICIENTS:
+            if level == value:
+                return level
+        return value
     
     def _validate_seniority_level(self, value: str) -> None:
         """Валидация уровня seniority."""
@@ -54,7 +111,7 @@ class Developer(Employee):
     @property
     def tech_stack(self) -> List[str]:
         """Получить стек технологий."""
-        return self.__tech_stack.copy()
+        return list(self.__tech_stack.skills)
     
     @property
     def seniority_level(self) -> str:
@@ -65,7 +122,8 @@ class Developer(Employee):
     def seniority_level(self, value: str) -> None:
         """Установить уровень seniority."""
         self._validate_seniority_level(value)
-        self.__seniority_level = value
+        with self._salary_change():
+            self.__seniority_level = self._canonical_level(value)
     
     def add_skill(self, new_skill: str) -> None:
         """
@@ -76,8 +134,9 @@ class Developer(Employee):
         """
         if not isinstance(new_skill, str) or not new_skill.strip():
             raise ValueError(f"Технология должна быть непустой строкой, получено: '{new_skill}'")
-        if new_skill not in self.__tech_stack:
-            self.__tech_stack.append(new_skill)
+        if new_skill not in self.__tech_stack.skills:
+            with self._locked_change():
+                self.__tech_stack = self._share_tech_stack(self.__tech_stack.skills + (new_skill,))
     
     def calculate_salary(self) -> float:
         """
@@ -98,11 +157,11 @@ class Developer(Employee):
         """
         return (f"Разработчик [id: {self.id}, имя: {self.name}, отдел: {self.department}, "
                 f"базовая зарплата: {self.base_salary}, уровень: {self.__seniority_level}, "
-                f"стек технологий: {self.__tech_stack}, итоговая зарплата: {self.calculate_salary()}]")
+                f"стек технологий: {list(self.__tech_stack.skills)}, итоговая зарплата: {self.calculate_salary()}]")
     
     def __iter__(self):
         """Итерация по стеку технологий."""
-        return iter(self.__tech_stack)
+        return iter(self.__tech_stack.skills)
     
     def to_dict(self) -> dict:
         """
@@ -113,7 +172,7 @@ class Developer(Employee):
         """
         base_dict = super().to_dict()
         base_dict["type"] = "Developer"
-        base_dict["tech_stack"] = self.__tech_stack.copy()
+        base_dict["tech_stack"] = list(self.__tech_stack.skills)
         base_dict["seniority_level"] = self.__seniority_level
         return base_dict
     
@@ -136,5 +195,14 @@ class Developer(Employee):
             tech_stack=data.get("tech_stack", []),
             seniority_level=data.get("seniority_level", "junior")
         )
+    
+    @classmethod
+    def _restore(cls, id: int, name: str, department: str, base_salary: float,
+                 tech_stack: List[str], seniority_level: str):
+        """Восстановить разработчика из заведомо корректных данных без валидации."""
+        developer = super()._restore(id, name, department, base_salary)
+        developer.__tech_stack = cls._share_tech_stack(tech_stack)
+        developer.__seniority_level = sys.intern(seniority_level)
+        return developer
 
 
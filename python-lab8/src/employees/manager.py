@@ -1,8 +1,10 @@
 """Класс Manager (Менеджер)."""
 
 from src.core.employee import Employee
+from src.core.registry import register_employee_type
 
 
+@register_employee_type("Manager")
 class Manager(Employee):
     """
     Класс для представления менеджера.
@@ -10,6 +12,8 @@ class Manager(Employee):
     Менеджер получает базовую зарплату плюс бонус.
     """
     
+    __slots__ = ('__bonus',)
+    
     def __init__(self, id: int, name: str, department: str, base_salary: float, bonus: float):
         """
         Инициализация менеджера.
@@ -39,7 +43,8 @@ class Manager(Employee):
     def bonus(self, value: float) -> None:
         """Установить бонус менеджера."""
         self._validate_bonus(value)
-        self.__bonus = float(value)
+        with self._salary_change():
+            self.__bonus = float(value)
     
     def calculate_salary(self) -> float:
         """
@@ -91,5 +96,12 @@ class Manager(Employee):
             base_salary=data["base_salary"],
             bonus=data.get("bonus", 0)
         )
+    
+    @classmethod
+    def _restore(cls, id: int, name: str, department: str, base_salary: float, bonus: float):
+        """Восстановить менеджера из заведомо корректных данных без валидации."""
+        manager = super()._restore(id, name, department, base_salary)
+        manager.__bonus = bonus
+        return manager
 
 
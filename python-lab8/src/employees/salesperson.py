@@ -1,8 +1,10 @@
 """Класс Salesperson (Продавец)."""
 
 from src.core.employee import Employee
+from src.core.registry import register_employee_type
 
 
+@register_employee_type("Salesperson")
 class Salesperson(Employee):
     """
     Класс для представления продавца.
@@ -10,6 +12,8 @@ class Salesperson(Employee):
     Продавец получает базовую зарплату плюс комиссию от объема продаж.
     """
     
+    __slots__ = ('__commission_rate', '__sales_volume')
+    
     def __init__(self, id: int, name: str, department: str, base_salary: float,
                  commission_rate: float, sales_volume: float):
         """
@@ -52,7 +56,8 @@ class Salesperson(Employee):
     def commission_rate(self, value: float) -> None:
         """Установить процент комиссии."""
         self._validate_commission_rate(value)
-        self.__commission_rate = float(value)
+        with self._salary_change():
+            self.__commission_rate = float(value)
     
     @property
     def sales_volume(self) -> float:
@@ -63,7 +68,8 @@ class Salesperson(Employee):
     def sales_volume(self, value: float) -> None:
         """Установить объем продаж."""
         self._validate_sales_volume(value)
-        self.__sales_volume = float(value)
+        with self._salary_change():
+            self.__sales_volume = float(value)
     
     def update_sales(self, new_sales: float) -> None:
         """
@@ -76,7 +82,8 @@ class Salesperson(Employee):
             raise ValueError(
                 f"Новая сумма продаж должна быть неотрицательным числом, получено: {new_sales}"
             )
-        self.__sales_volume += new_sales
+        with self._salary_change():
+            self.__sales_volume += new_sales
     
     def calculate_salary(self) -> float:
         """
@@ -130,5 +137,14 @@ class Salesperson(Employee):
             commission_rate=data.get("commission_rate", 0),
             sales_volume=data.get("sales_volume", 0)
         )
+    
+    @classmethod
+    def _restore(cls, id: int, name: str, department: str, base_salary: float,
+                 commission_rate: float, sales_volume: float):
+        """Восстановить продавца из заведомо корректных данных без валидации."""
+        salesperson = super()._restore(id, name, department, base_salary)
+        salesperson.__commission_rate = commission_rate
+        salesperson.__sales_volume = sales_volume
+        return salesperson
 
 
@@ -3,7 +3,7 @@
 from abc import ABC, abstractmethod
 from typing import Dict, Any
 from src.core.abstract_employee import AbstractEmployee
-from src.core.employee import Employee
+from src.core.registry import get_employee_constructor
 from src.employees.manager import Manager
 from src.employees.developer import Developer
 from src.employees.salesperson import Salesperson
@@ -117,7 +117,8 @@ class EmployeeFactoryMethod:
         Создать сотрудника указанного типа (старый интерфейс для обратной совместимости).
         
         Args:
-            emp_type: Тип сотрудника ("manager", "developer", "salesperson", "employee")
+            emp_type: Тип сотрудника ("manager", "developer", "salesperson", "employee"
+                или тег другого зарегистрированного типа)
             **kwargs: Параметры для создания сотрудника
         
         Returns:
@@ -126,22 +127,11 @@ class EmployeeFactoryMethod:
         Raises:
             ValueError: Если указан неверный тип сотрудника
         """
-        emp_type = emp_type.lower()
-        
-        if emp_type == "employee":
-            return Employee(
-                id=kwargs.get("id"),
-                name=kwargs.get("name"),
-                department=kwargs.get("department"),
-                base_salary=kwargs.get("base_salary")
-            )
-        elif emp_type in EmployeeFactoryMethod._factories:
-            factory = EmployeeFactoryMethod._factories[emp_type]
+        factory = EmployeeFactoryMethod._factories.get(emp_type.lower())
+        if factory is not None:
             return factory.create_employee(**kwargs)
-        else:
-            raise ValueError(
-                f"Неизвестный тип сотрудника: {emp_type}. "
-                f"Доступные типы: employee, manager, developer, salesperson"
-            )
-
-
+        # Базовый Employee и типы без отдельной фабрики создаются через реестр.
+        # Пропущенные поля передаются как None, чтобы их отклонила валидация (ValueError)
+        data = dict.fromkeys(("id", "name", "department", "base_salary"))
+        data.update(kwargs)
+        return get_employee_constructor(emp_type)(data)
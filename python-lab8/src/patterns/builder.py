@@ -2,10 +2,8 @@
 
 from typing import List, Optional
 from src.core.abstract_employee import AbstractEmployee
-from src.core.employee import Employee
-from src.employees.manager import Manager
-from src.employees.developer import Developer
-from src.employees.salesperson import Salesperson
+from src.core.registry import DEFAULT_EMPLOYEE_TYPE, get_employee_constructor
+import src.employees  # noqa: F401  Регистрирует встроенные типы сотрудников
 
 
 class EmployeeBuilder:
@@ -104,49 +102,27 @@ class EmployeeBuilder:
             raise ValueError("Базовая зарплата обязательна")
         
         employee_type = self._employee_type or "employee"
+        if employee_type == "manager" and self._bonus is None:
+            raise ValueError("Бонус обязателен для менеджера")
         
-        if employee_type == "manager":
-            if self._bonus is None:
-                raise ValueError("Бонус обязателен для менеджера")
-            return Manager(
-                id=self._id,
-                name=self._name,
-                department=self._department,
-                base_salary=self._base_salary,
-                bonus=self._bonus
-            )
-        elif employee_type == "developer":
-            if self._tech_stack is None:
-                self._tech_stack = []
-            if self._seniority_level is None:
-                self._seniority_level = "junior"
-            return Developer(
-                id=self._id,
-                name=self._name,
-                department=self._department,
-                base_salary=self._base_salary,
-                tech_stack=self._tech_stack,
-                seniority_level=self._seniority_level
-            )
-        elif employee_type == "salesperson":
-            if self._commission_rate is None:
-                self._commission_rate = 0.0
-            if self._sales_volume is None:
-                self._sales_volume = 0.0
-            return Salesperson(
-                id=self._id,
-                name=self._name,
-                department=self._department,
-                base_salary=self._base_salary,
-                commission_rate=self._commission_rate,
-                sales_volume=self._sales_volume
-            )
-        else:
-            return Employee(
-                id=self._id,
-                name=self._name,
-                department=self._department,
-                base_salary=self._base_salary
-            )
-
-
+        data = {
+            "id": self._id,
+            "name": self._name,
+            "department": self._department,
+            "base_salary": self._base_salary
+        }
+        # Необязательные параметры передаются, только если заданы: умолчания задает from_dict типа
+        optional = {
+            "bonus": self._bonus,
+            "tech_stack": self._tech_stack,
+            "seniority_level": self._seniority_level,
+            "commission_rate": self._commission_rate,
+            "sales_volume": self._sales_volume
+        }
+        data.update((key, value) for key, value in optional.items() if value is not None)
+        try:
+            constructor = get_employee_constructor(employee_type)
+        except ValueError:
+            # Незарегистрированный тип, как и раньше, строится базовым Employee
+            constructor = get_employee_constructor(DEFAULT_EMPLOYEE_TYPE)
+        return constructor(data)
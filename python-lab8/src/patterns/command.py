@@ -63,7 +63,6 @@ class HireEmployeeCommand(Command):
     
     def _find_department(self) -> Optional[Department]:
         """Найти отдел по названию."""
-        departments = self._company.get_departments()
-        return next((d for d in departments if d.name == self._department_name), None)
+        return self._company.departments_view().get(self._department_name)
 
 
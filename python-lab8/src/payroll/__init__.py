@@ -0,0 +1,3 @@
+"""Пакетные расчеты зарплат."""
+
+
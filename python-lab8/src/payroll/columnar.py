@@ -0,0 +1,200 @@
+"""Колоночное (struct-of-arrays) представление сотрудников для пакетных расчетов."""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+import numpy as np
+from src.core.employee import Employee
+from src.employees.manager import Manager
+from src.employees.developer import Developer
+from src.employees.salesperson import Salesperson
+
+
+class PayrollFrame:
+    """
+    Колоночное представление сотрудников компании.
+    
+    Каждый атрибут, влияющий на зарплату, хранится в отдельном массиве NumPy,
+    поэтому зарплаты всех сотрудников считаются векторными операциями
+    по единой формуле:
+    
+        base_salary * seniority_coefficient + bonus + sales_volume * commission_rate
+    
+    Для каждого типа неиспользуемые колонки заполнены нейтральными значениями
+    (коэффициент 1.0, остальное 0.0), так что результат побитово совпадает
+    с calculate_salary() соответствующего класса.
+    """
+    
+    TYPE_EMPLOYEE = 0
+    TYPE_MANAGER = 1
+    TYPE_DEVELOPER = 2
+    TYPE_SALESPERSON = 3
+    TYPE_OTHER = 4  # Прочие реализации AbstractEmployee: зарплата фиксируется при построении
+    
+    TYPE_NAMES = {
+        TYPE_EMPLOYEE: "Employee",
+        TYPE_MANAGER: "Manager",
+        TYPE_DEVELOPER: "Developer",
+        TYPE_SALESPERSON: "Salesperson",
+        TYPE_OTHER: "Other"
+    }
+    
+    def __init__(self, ids: np.ndarray, type_codes: np.ndarray, base_salary: np.ndarray,
+                 bonus: np.ndarray, seniority_coefficient: np.ndarray,
+                 commission_rate: np.ndarray, sales_volume: np.ndarray,
+                 department_codes: np.ndarray, department_names: List[str]):
+        """
+        Инициализация колоночного представления.
+        
+        Args:
+            ids: ID сотрудников (int64)
+            type_codes: Коды типов сотрудников (int8)
+            base_salary: Базовые зарплаты
+            bonus: Бонусы менеджеров
+            seniority_coefficient: Коэффициенты уровня разработчиков
+            commission_rate: Проценты комиссии продавцов
+            sales_volume: Объемы продаж продавцов
+            department_codes: Индексы отделов в department_names (int32)
+            department_names: Названия отделов
+        """
+        size = len(ids)
+        columns = (type_codes, base_salary, bonus, seniority_coefficient,
+                   commission_rate, sales_volume, department_codes)
+        if any(len(column) != size for column in columns):
+            raise ValueError("Все колонки должны иметь одинаковую длину")
+        self.ids = ids
+        self.type_codes = type_codes
+        self.base_salary = base_salary
+        self.bonus = bonus
+        self.seniority_coefficient = seniority_coefficient
+        self.commission_rate = commission_rate
+        self.sales_volume = sales_volume
+        self.department_codes = department_codes
+        self.department_names = list(department_names)
+        self._salaries: Optional[np.ndarray] = None
+    
+    @classmethod
+    def from_company(cls, company) -> 'PayrollFrame':
+        """
+        Построить колоночное представление всех сотрудников компании.
+        
+        Args:
+            company: Объект Company
+        
+        Returns:
+            Объект PayrollFrame
+        """
+        return cls.from_departments(company.departments_view().values())
+    
+    @classmethod
+    def from_departments(cls, departments: Iterable) -> 'PayrollFrame':
+        """
+        Построить колоночное представление сотрудников нескольких отделов.
+        
+        Args:
+            departments: Итерируемый набор объектов Department
+        
+        Returns:
+            Объект PayrollFrame
+        """
+        departments = list(departments)
+        size = sum(len(dept) for dept in departments)
+        
+        ids = np.empty(size, dtype=np.int64)
+        type_codes = np.empty(size, dtype=np.int8)
+        base_salary = np.empty(size, dtype=np.float64)
+        bonus = np.zeros(size, dtype=np.float64)
+        seniority_coefficient = np.ones(size, dtype=np.float64)
+        commission_rate = np.zeros(size, dtype=np.float64)
+        sales_volume = np.zeros(size, dtype=np.float64)
+        department_codes = np.empty(size, dtype=np.int32)
+        
+        coefficients = Developer.SENIORITY_COEFFICIENTS
+        row = 0
+        for dept_code, dept in enumerate(departments):
+            for emp in dept:
+                ids[row] = emp.id
+                department_codes[row] = dept_code
+                emp_type = type(emp)
+                if emp_type is Manager:
+                    type_codes[row] = cls.TYPE_MANAGER
+                    base_salary[row] = emp.base_salary
+                    bonus[row] = emp.bonus
+                elif emp_type is Developer:
+                    type_codes[row] = cls.TYPE_DEVELOPER
+                    base_salary[row] = emp.base_salary
+                    seniority_coefficient[row] = coefficients[emp.seniority_level]
+                elif emp_type is Salesperson:
+                    type_codes[row] = cls.TYPE_SALESPERSON
+                    base_salary[row] = emp.base_salary
+                    commission_rate[row] = emp.commission_rate
+                    sales_volume[row] = emp.sales_volume
+                elif emp_type is Employee:
+                    type_codes[row] = cls.TYPE_EMPLOYEE
+                    base_salary[row] = emp.base_salary
+                else:
+                    # Неизвестная формула: фиксируем итоговую зарплату объекта
+                    type_codes[row] = cls.TYPE_OTHER
+                    base_salary[row] = emp.calculate_salary()
+                row += 1
+        
+        return cls(ids, type_codes, base_salary, bonus, seniority_coefficient,
+                   commission_rate, sales_volume, department_codes,
+                   [dept.name for dept in departments])
+    
+    def __len__(self) -> int:
+        """Количество сотрудников в представлении."""
+        return len(self.ids)
+    
+    def calculate_salaries(self) -> np.ndarray:
+        """
+        Рассчитать итоговые зарплаты всех сотрудников.
+        
+        Результат кэшируется; массив возвращается только для чтения.
+        
+        Returns:
+            Массив итоговых зарплат в порядке строк представления
+        """
+        if self._salaries is None:
+            salaries = self.base_salary * self.seniority_coefficient
+            salaries += self.bonus
+            salaries += self.sales_volume * self.commission_rate
+            salaries.flags.writeable = False
+            self._salaries = salaries
+        return self._salaries
+    
+    def department_totals(self) -> Dict[str, float]:
+        """
+        Рассчитать сумму зарплат по отделам.
+        
+        Суммирование идет последовательно в порядке сотрудников отдела,
+        как и при пересчете Department.recalculate_total_salary().
+        
+        Returns:
+            Словарь {название отдела: сумма зарплат}
+        """
+        totals = np.bincount(self.department_codes, weights=self.calculate_salaries(),
+                             minlength=len(self.department_names))
+        return {name: float(total) for name, total in zip(self.department_names, totals)}
+    
+    def total_cost(self) -> float:
+        """
+        Рассчитать общие месячные затраты на зарплаты.
+        
+        Returns:
+            Сумма зарплат всех сотрудников
+        """
+        return float(sum(self.department_totals().values()))
+    
+    def type_totals(self) -> Dict[str, Tuple[int, float]]:
+        """
+        Рассчитать количество сотрудников и сумму зарплат по типам.
+        
+        Returns:
+            Словарь {тип: (количество, сумма зарплат)} для присутствующих типов
+        """
+        size = len(self.TYPE_NAMES)
+        counts = np.bincount(self.type_codes, minlength=size)
+        sums = np.bincount(self.type_codes, weights=self.calculate_salaries(), minlength=size)
+        return {
+            self.TYPE_NAMES[code]: (int(counts[code]), float(sums[code]))
+            for code in range(size) if counts[code] > 0
+        }
@@ -0,0 +1,186 @@
+"""
+Моделирование сценариев изменения зарплат ("что если").
+
+Сценарий - именованный набор декларативных корректировок колонок
+PayrollFrame, например "+10% базовой зарплаты senior-разработчикам
+отдела X" или "ограничить бонус менеджеров". Сценарии считаются
+векторно над копиями колонок, живые объекты компании не изменяются.
+Независимые сценарии можно считать параллельно в пуле процессов.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+import numpy as np
+from src.employees.developer import Developer
+from src.payroll.columnar import PayrollFrame
+
+
+# Поле -> типы сотрудников, для которых оно входит в формулу зарплаты
+FIELD_TYPES = {
+    "base_salary": (PayrollFrame.TYPE_EMPLOYEE, PayrollFrame.TYPE_MANAGER,
+                    PayrollFrame.TYPE_DEVELOPER, PayrollFrame.TYPE_SALESPERSON),
+    "bonus": (PayrollFrame.TYPE_MANAGER,),
+    "commission_rate": (PayrollFrame.TYPE_SALESPERSON,),
+    "sales_volume": (PayrollFrame.TYPE_SALESPERSON,),
+}
+
+OPERATIONS = {
+    "scale": np.multiply,  # Умножить на value
+    "add": np.add,  # Прибавить value
+    "set": lambda column, value: np.full_like(column, value),  # Заменить на value
+    "cap": np.minimum,  # Ограничить сверху
+    "floor": np.maximum,  # Ограничить снизу
+}
+
+
+class Adjustment(NamedTuple):
+    """
+    Корректировка одного поля у сотрудников, подходящих под фильтры.
+    
+    Поле меняется только у типов, в формулу которых оно входит
+    (см. FIELD_TYPES). Фильтр seniority относится к разработчикам.
+    """
+    
+    field: str  # "base_salary", "bonus", "commission_rate" или "sales_volume"
+    operation: str  # "scale", "add", "set", "cap" или "floor"
+    value: float
+    employee_type: Optional[str] = None  # Например, "Developer"
+    department: Optional[str] = None  # Название отдела
+    seniority: Optional[str] = None  # Уровень разработчика
+
+
+class Scenario(NamedTuple):
+    """Именованный набор корректировок, применяемых по порядку."""
+    
+    name: str
+    adjustments: Tuple[Adjustment, ...]
+
+
+class ScenarioResult(NamedTuple):
+    """Результат сценария в разрезе сотрудников, отделов и компании."""
+    
+    name: str
+    employee_ids: np.ndarray  # ID сотрудников в порядке строк PayrollFrame
+    salaries: np.ndarray  # Зарплаты по сценарию
+    salary_deltas: np.ndarray  # Изменение зарплаты каждого сотрудника
+    department_deltas: Dict[str, float]  # Изменение затрат по отделам
+    total_cost: float  # Месячные затраты по сценарию
+    total_delta: float  # Изменение месячных затрат
+
+
+def _adjustment_mask(frame: PayrollFrame, adjustment: Adjustment) -> np.ndarray:
+    """
+    Построить маску строк, к которым применяется корректировка.
+    
+    Raises:
+        ValueError: При неизвестном поле, операции, типе, отделе или уровне
+    """
+    if adjustment.field not in FIELD_TYPES:
+        raise ValueError(f"Неизвестное поле корректировки: '{adjustment.field}'. "
+                         f"Доступные поля: {', '.join(FIELD_TYPES)}")
+    if adjustment.operation not in OPERATIONS:
+        raise ValueError(f"Неизвестная операция корректировки: '{adjustment.operation}'. "
+                         f"Доступные операции: {', '.join(OPERATIONS)}")
+    types = FIELD_TYPES[adjustment.field]
+    if adjustment.employee_type is not None:
+        codes = [code for code, name in PayrollFrame.TYPE_NAMES.items() if name == adjustment.employee_type]
+        if not codes:
+            raise ValueError(f"Неизвестный тип сотрудника: '{adjustment.employee_type}'")
+        types = tuple(code for code in types if code in codes)
+    if adjustment.seniority is not None:
+        if adjustment.seniority not in Developer.SENIORITY_COEFFICIENTS:
+            raise ValueError(f"Неизвестный уровень разработчика: '{adjustment.seniority}'")
+        types = tuple(code for code in types if code == PayrollFrame.TYPE_DEVELOPER)
+    
+    mask = np.isin(frame.type_codes, types)
+    if adjustment.seniority is not None:
+        coefficient = Developer.SENIORITY_COEFFICIENTS[adjustment.seniority]
+        mask &= frame.seniority_coefficient == coefficient
+    if adjustment.department is not None:
+        if adjustment.department not in frame.department_names:
+            raise ValueError(f"Отдел '{adjustment.department}' отсутствует в расчете")
+        mask &= frame.department_codes == frame.department_names.index(adjustment.department)
+    return mask
+
+
+def evaluate_scenario(frame: PayrollFrame, scenario: Scenario) -> ScenarioResult:
+    """
+    Рассчитать сценарий над колонками PayrollFrame.
+    
+    Каждая корректировка создает новый массив поля,
+    сам frame не изменяется.
+    
+    Args:
+        frame: Колоночное представление сотрудников
+        scenario: Сценарий
+    
+    Returns:
+        Результат сценария
+    
+    Raises:
+        ValueError: При некорректной корректировке
+    """
+    columns = {field: getattr(frame, field) for field in FIELD_TYPES}
+    for adjustment in scenario.adjustments:
+        mask = _adjustment_mask(frame, adjustment)
+        column = columns[adjustment.field]
+        adjusted = OPERATIONS[adjustment.operation](column, float(adjustment.value))
+        columns[adjustment.field] = np.where(mask, adjusted, column)
+    
+    salaries = columns["base_salary"] * frame.seniority_coefficient
+    salaries += columns["bonus"]
+    salaries += columns["sales_volume"] * columns["commission_rate"]
+    deltas = salaries - frame.calculate_salaries()
+    department_deltas = np.bincount(frame.department_codes, weights=deltas,
+                                    minlength=len(frame.department_names))
+    return ScenarioResult(
+        name=scenario.name,
+        employee_ids=frame.ids,
+        salaries=salaries,
+        salary_deltas=deltas,
+        department_deltas={name: float(delta) for name, delta in zip(frame.department_names, department_deltas)},
+        total_cost=float(salaries.sum()),
+        total_delta=float(deltas.sum())
+    )
+
+
+# Колоночное представление в процессе пула: передается один раз при запуске процесса
+_worker_frame: Optional[PayrollFrame] = None
+
+
+def _init_worker(frame: PayrollFrame) -> None:
+    """Сохранить колоночное представление в процессе пула."""
+    global _worker_frame
+    _worker_frame = frame
+
+
+def _evaluate_in_worker(scenario: Scenario) -> ScenarioResult:
+    """Рассчитать сценарий в процессе пула."""
+    return evaluate_scenario(_worker_frame, scenario)
+
+
+def run_scenarios(frame: PayrollFrame, scenarios: Iterable[Scenario],
+                  processes: Optional[int] = None) -> List[ScenarioResult]:
+    """
+    Рассчитать несколько независимых сценариев.
+    
+    При processes > 1 сценарии распределяются по пулу процессов;
+    колонки передаются каждому процессу один раз при его запуске.
+    
+    Args:
+        frame: Колоночное представление сотрудников
+        scenarios: Сценарии
+        processes: Число процессов (None или 1 - в текущем процессе)
+    
+    Returns:
+        Результаты в порядке сценариев
+    
+    Raises:
+        ValueError: При некорректной корректировке
+    """
+    scenarios = list(scenarios)
+    if processes is None or processes <= 1 or len(scenarios) <= 1:
+        return [evaluate_scenario(frame, scenario) for scenario in scenarios]
+    frame.calculate_salaries()  # Базовые зарплаты считаются один раз до передачи в процессы
+    with ProcessPoolExecutor(max_workers=processes, initializer=_init_worker, initargs=(frame,)) as pool:
+        return list(pool.map(_evaluate_in_worker, scenarios))
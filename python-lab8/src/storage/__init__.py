@@ -0,0 +1,3 @@
+"""Форматы хранения данных компании."""
+
+
@@ -0,0 +1,412 @@
+"""
+Бинарный снимок компании с отображением в память (mmap).
+
+Файл состоит из заголовка, каталога секций и самих секций. Каждая секция -
+массив фиксированной ширины (колонка), строки хранятся один раз в общей
+таблице строк и адресуются номером. Данные записываются в порядке байтов
+машины, на которой создан снимок.
+
+MappedCompany открывает файл через mmap и читает колонки через memoryview,
+поэтому открытие не зависит от размера снимка. Объекты Department, Employee
+и Project создаются только при первом обращении, без повторной валидации.
+"""
+
+import mmap
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from typing import Dict, List, Optional
+from src.core.abstract_employee import AbstractEmployee
+from src.core.department import Department
+from src.core.employee import Employee
+from src.core.project import Project
+from src.employees.manager import Manager
+from src.employees.developer import Developer
+from src.employees.salesperson import Salesperson
+from src.utils.exceptions import EmployeeNotFoundError, ProjectNotFoundError
+
+
+MAGIC = b"CMPSNAP\x00"
+FORMAT_VERSION = 1
+
+# Секции снимка в порядке записи: (имя, код типа array/memoryview)
+SECTIONS = [
+    ("string_offsets", "Q"),
+    ("string_blob", "B"),
+    ("dept_name", "I"),
+    ("dept_start", "Q"),
+    ("dept_count", "Q"),
+    ("emp_id", "q"),
+    ("emp_type", "B"),
+    ("emp_name", "I"),
+    ("emp_department", "I"),
+    ("emp_base_salary", "d"),
+    ("emp_bonus", "d"),
+    ("emp_seniority", "I"),
+    ("emp_commission_rate", "d"),
+    ("emp_sales_volume", "d"),
+    ("emp_skill_start", "Q"),
+    ("emp_skill_count", "I"),
+    ("skills", "I"),
+    ("sorted_ids", "q"),
+    ("sorted_rows", "Q"),
+    ("proj_id", "q"),
+    ("proj_name", "I"),
+    ("proj_description", "I"),
+    ("proj_deadline", "I"),
+    ("proj_status", "I"),
+    ("proj_team_start", "Q"),
+    ("proj_team_count", "I"),
+    ("team", "q"),
+]
+
+# magic, версия, порядок байтов (0 - little, 1 - big), номер строки с названием компании
+_HEADER = struct.Struct("=8sIII")
+_SECTION_ENTRY = struct.Struct("=QQ")
+
+TYPE_CODES = {"Employee": 0, "Manager": 1, "Developer": 2, "Salesperson": 3}
+
+
+def _align(offset: int) -> int:
+    """Выровнять смещение по границе 8 байт."""
+    return (offset + 7) & ~7
+
+
+class _StringTable:
+    """Таблица уникальных строк для записи снимка."""
+    
+    def __init__(self):
+        """Инициализация пустой таблицы."""
+        self._ids: Dict[str, int] = {}
+        self.offsets = array("Q", [0])
+        self.blob = bytearray()
+    
+    def add(self, value: str) -> int:
+        """Добавить строку и вернуть ее номер."""
+        sid = self._ids.get(value)
+        if sid is None:
+            sid = len(self._ids)
+            self._ids[value] = sid
+            self.blob += value.encode("utf-8")
+            self.offsets.append(len(self.blob))
+        return sid
+
+
+def write_company(company, filename: str) -> None:
+    """
+    Записать компанию в бинарный снимок.
+    
+    Args:
+        company: Объект Company
+        filename: Имя файла
+    
+    Raises:
+        ValueError: Если в компании есть сотрудник типа без кода в TYPE_CODES
+    """
+    strings = _StringTable()
+    columns = {name: array(code) for name, code in SECTIONS if name not in ("string_offsets", "string_blob")}
+    company_sid = strings.add(company.name)
+    
+    row = 0
+    for dept in company.departments_view().values():
+        columns["dept_name"].append(strings.add(dept.name))
+        columns["dept_start"].append(row)
+        columns["dept_count"].append(len(dept))
+        for emp in dept:
+            data = Department._employee_to_dict(emp)
+            columns["emp_id"].append(data["id"])
+            type_code = TYPE_CODES.get(data.get("type", "Employee"))
+            if type_code is None:
+                # Колонки снимка хранят только поля встроенных типов: остальные потеряли бы данные
+                raise ValueError(f"Тип сотрудника '{data['type']}' не поддерживается бинарным снимком")
+            columns["emp_type"].append(type_code)
+            columns["emp_name"].append(strings.add(data["name"]))
+            columns["emp_department"].append(strings.add(data["department"]))
+            columns["emp_base_salary"].append(data["base_salary"])
+            columns["emp_bonus"].append(data.get("bonus", 0.0))
+            columns["emp_seniority"].append(strings.add(data.get("seniority_level", "junior")))
+            columns["emp_commission_rate"].append(data.get("commission_rate", 0.0))
+            columns["emp_sales_volume"].append(data.get("sales_volume", 0.0))
+            skills = data.get("tech_stack", [])
+            columns["emp_skill_start"].append(len(columns["skills"]))
+            columns["emp_skill_count"].append(len(skills))
+            columns["skills"].extend(strings.add(skill) for skill in skills)
+            row += 1
+    
+    order = sorted(range(row), key=columns["emp_id"].__getitem__)
+    columns["sorted_ids"].extend(columns["emp_id"][i] for i in order)
+    columns["sorted_rows"].extend(order)
+    
+    for proj in company.projects_view().values():
+        columns["proj_id"].append(proj.project_id)
+        columns["proj_name"].append(strings.add(proj.name))
+        columns["proj_description"].append(strings.add(proj.description))
+        columns["proj_deadline"].append(strings.add(proj.deadline.strftime("%Y-%m-%d")))
+        columns["proj_status"].append(strings.add(proj.status))
+        team = proj.team_view()
+        columns["proj_team_start"].append(len(columns["team"]))
+        columns["proj_team_count"].append(len(team))
+        columns["team"].extend(team)
+    
+    columns["string_offsets"] = strings.offsets
+    columns["string_blob"] = array("B", bytes(strings.blob))
+    
+    byte_order = 0 if sys.byteorder == "little" else 1
+    offset = _align(_HEADER.size + _SECTION_ENTRY.size * len(SECTIONS))
+    directory = []
+    for name, _ in SECTIONS:
+        size = len(columns[name]) * columns[name].itemsize
+        directory.append((offset, size))
+        offset = _align(offset + size)
+    
+    with open(filename, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, byte_order, company_sid))
+        for entry in directory:
+            f.write(_SECTION_ENTRY.pack(*entry))
+        for (name, _), (section_offset, _) in zip(SECTIONS, directory):
+            f.write(b"\x00" * (section_offset - f.tell()))
+            columns[name].tofile(f)
+
+
+class MappedCompany:
+    """
+    Компания, открытая из бинарного снимка.
+    
+    Колонки читаются напрямую из отображенного файла; отделы, сотрудники
+    и проекты создаются при первом обращении и кэшируются. Полную
+    изменяемую компанию дает метод to_company().
+    """
+    
+    def __init__(self, filename: str):
+        """
+        Открыть снимок.
+        
+        Args:
+            filename: Имя файла снимка
+        
+        Raises:
+            ValueError: Если файл не является снимком поддерживаемой версии
+        """
+        self._file = open(filename, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"Файл '{filename}' пуст и не является бинарным снимком")
+        self._buffer = memoryview(self._mmap)
+        if len(self._buffer) < _HEADER.size:
+            self.close()
+            raise ValueError(f"Файл '{filename}' не является бинарным снимком компании")
+        magic, version, byte_order, company_sid = _HEADER.unpack_from(self._buffer, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"Файл '{filename}' не является бинарным снимком компании")
+        if version != FORMAT_VERSION:
+            self.close()
+            raise ValueError(f"Неподдерживаемая версия снимка: {version}")
+        if byte_order != (0 if sys.byteorder == "little" else 1):
+            self.close()
+            raise ValueError("Снимок записан с другим порядком байтов")
+        
+        self._columns: Dict[str, memoryview] = {}
+        for index, (name, code) in enumerate(SECTIONS):
+            offset, size = _SECTION_ENTRY.unpack_from(self._buffer, _HEADER.size + index * _SECTION_ENTRY.size)
+            self._columns[name] = self._buffer[offset:offset + size].cast(code)
+        
+        self._strings: Dict[int, str] = {}
+        self._name = self._string(company_sid)
+        self._employees: Dict[int, AbstractEmployee] = {}  # строка -> сотрудник
+        self._departments: Dict[int, Department] = {}  # номер отдела -> отдел
+        self._projects: Optional[List[Project]] = None
+    
+    def close(self) -> None:
+        """Освободить отображение файла."""
+        for column in getattr(self, "_columns", {}).values():
+            column.release()
+        self._columns = {}
+        if getattr(self, "_buffer", None) is not None:
+            self._buffer.release()
+            self._buffer = None
+        if getattr(self, "_mmap", None) is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._file.close()
+    
+    def __enter__(self) -> 'MappedCompany':
+        """Вход в контекстный менеджер."""
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        """Выход из контекстного менеджера."""
+        self.close()
+    
+    def _string(self, sid: int) -> str:
+        """Получить строку по номеру (с кэшированием)."""
+        value = self._strings.get(sid)
+        if value is None:
+            offsets = self._columns["string_offsets"]
+            raw = self._columns["string_blob"][offsets[sid]:offsets[sid + 1]]
+            value = sys.intern(raw.tobytes().decode("utf-8"))
+            self._strings[sid] = value
+        return value
+    
+    @property
+    def name(self) -> str:
+        """Получить название компании."""
+        return self._name
+    
+    def __len__(self) -> int:
+        """Количество сотрудников в снимке."""
+        return len(self._columns["emp_id"])
+    
+    def get_department_names(self) -> List[str]:
+        """
+        Получить названия отделов без создания объектов.
+        
+        Returns:
+            Список названий отделов
+        """
+        return [self._string(sid) for sid in self._columns["dept_name"]]
+    
+    def _employee_at(self, row: int) -> AbstractEmployee:
+        """Получить (создать при необходимости) сотрудника по номеру строки."""
+        employee = self._employees.get(row)
+        if employee is not None:
+            return employee
+        c = self._columns
+        emp_type = c["emp_type"][row]
+        args = (c["emp_id"][row], self._string(c["emp_name"][row]),
+                self._string(c["emp_department"][row]), c["emp_base_salary"][row])
+        if emp_type == TYPE_CODES["Manager"]:
+            employee = Manager._restore(*args, bonus=c["emp_bonus"][row])
+        elif emp_type == TYPE_CODES["Developer"]:
+            start = c["emp_skill_start"][row]
+            skills = [self._string(sid) for sid in c["skills"][start:start + c["emp_skill_count"][row]]]
+            employee = Developer._restore(*args, tech_stack=skills,
+                                          seniority_level=self._string(c["emp_seniority"][row]))
+        elif emp_type == TYPE_CODES["Salesperson"]:
+            employee = Salesperson._restore(*args, commission_rate=c["emp_commission_rate"][row],
+                                            sales_volume=c["emp_sales_volume"][row])
+        else:
+            employee = Employee._restore(*args)
+        self._employees[row] = employee
+        return employee
+    
+    def _department_at(self, index: int) -> Department:
+        """Получить (создать при необходимости) отдел по номеру."""
+        department = self._departments.get(index)
+        if department is None:
+            start = self._columns["dept_start"][index]
+            count = self._columns["dept_count"][index]
+            department = Department(self._string(self._columns["dept_name"][index]))
+            department.add_employees(self._employee_at(row) for row in range(start, start + count))
+            self._departments[index] = department
+        return department
+    
+    def get_department(self, name: str) -> Optional[Department]:
+        """
+        Получить отдел по названию (создается при первом обращении).
+        
+        Args:
+            name: Название отдела
+        
+        Returns:
+            Объект отдела или None
+        """
+        for index, sid in enumerate(self._columns["dept_name"]):
+            if self._string(sid) == name:
+                return self._department_at(index)
+        return None
+    
+    def get_departments(self) -> List[Department]:
+        """
+        Получить все отделы (создает недостающие объекты).
+        
+        Returns:
+            Список отделов
+        """
+        return [self._department_at(index) for index in range(len(self._columns["dept_name"]))]
+    
+    def find_employee_by_id(self, employee_id: int) -> Optional[AbstractEmployee]:
+        """
+        Найти сотрудника по ID двоичным поиском по отсортированной колонке.
+        
+        Args:
+            employee_id: ID сотрудника
+        
+        Returns:
+            Объект сотрудника или None
+        """
+        ids = self._columns["sorted_ids"]
+        pos = bisect_left(ids, employee_id)
+        if pos < len(ids) and ids[pos] == employee_id:
+            return self._employee_at(self._columns["sorted_rows"][pos])
+        return None
+    
+    def _project_at(self, index: int) -> Project:
+        """Создать проект без команды по номеру строки."""
+        c = self._columns
+        return Project.from_dict({
+            "project_id": c["proj_id"][index],
+            "name": self._string(c["proj_name"][index]),
+            "description": self._string(c["proj_description"][index]),
+            "deadline": self._string(c["proj_deadline"][index]),
+            "status": self._string(c["proj_status"][index])
+        })
+    
+    def _team_ids(self, index: int) -> List[int]:
+        """Получить ID членов команды проекта по номеру строки."""
+        start = self._columns["proj_team_start"][index]
+        return self._columns["team"][start:start + self._columns["proj_team_count"][index]].tolist()
+    
+    def get_projects(self) -> List[Project]:
+        """
+        Получить проекты с восстановленными командами.
+        
+        Returns:
+            Список проектов
+        """
+        if self._projects is None:
+            projects = []
+            for index in range(len(self._columns["proj_id"])):
+                project = self._project_at(index)
+                for emp_id in self._team_ids(index):
+                    employee = self.find_employee_by_id(emp_id)
+                    if employee is not None:
+                        project.add_team_member(employee)
+                projects.append(project)
+            self._projects = projects
+        return list(self._projects)
+    
+    def to_company(self, company_cls=None):
+        """
+        Создать полноценную компанию из снимка.
+        
+        Объекты отделов и сотрудников общие с кэшем снимка.
+        
+        Args:
+            company_cls: Класс компании (по умолчанию Company)
+        
+        Returns:
+            Объект компании
+        """
+        if company_cls is None:
+            from src.core.company import Company as company_cls
+        company = company_cls(self._name)
+        for department in self.get_departments():
+            company.add_department(department)
+        for index in range(len(self._columns["proj_id"])):
+            project = self._project_at(index)
+            company.add_project(project)
+            for emp_id in self._team_ids(index):
+                try:
+                    company.assign_employee_to_project(emp_id, project.project_id)
+                except (EmployeeNotFoundError, ProjectNotFoundError):
+                    pass  # Пропускаем если не удалось восстановить связь
+        return company
+    
+    def __str__(self) -> str:
+        """Строковое представление снимка."""
+        return (f"Снимок компании '{self._name}' "
+                f"(отделов: {len(self._columns['dept_name'])}, сотрудников: {len(self)})")
@@ -0,0 +1,220 @@
+"""
+Потоковый формат NDJSON для снимков компании.
+
+Файл состоит из JSON-записей, по одной на строку:
+
+    {"record": "company", "format": "company-ndjson", "version": 1, "name": ...}
+    {"record": "department", "name": ...}
+    {"record": "employee", "type": ..., "id": ..., ...}   # относится к последнему отделу
+    {"record": "project", "project_id": ..., ..., "team": [ID, ...]}
+
+Запись и чтение идут построчно, поэтому расход памяти не зависит
+от размера файла. Поддерживается сжатие gzip и zstd (нужен пакет zstandard).
+"""
+
+import gzip
+import json
+from typing import IO, Iterator, Optional
+from src.core.department import Department
+from src.core.project import Project
+from src.core.registry import employee_from_dict
+from src.utils.exceptions import EmployeeNotFoundError, ProjectNotFoundError
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+FORMAT_NAME = "company-ndjson"
+FORMAT_VERSION = 1
+COMPRESSIONS = (None, "gzip", "zstd")
+
+# Сотрудники отдела добавляются пакетами такого размера
+CHUNK_SIZE = 10000
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+def _require_zstandard() -> None:
+    """Проверить наличие пакета zstandard."""
+    if zstandard is None:
+        raise ImportError("Для сжатия zstd требуется пакет 'zstandard' (pip install zstandard)")
+
+
+def detect_compression(filename: str) -> Optional[str]:
+    """
+    Определить сжатие файла по сигнатуре.
+    
+    Args:
+        filename: Имя файла
+    
+    Returns:
+        "gzip", "zstd" или None
+    """
+    with open(filename, 'rb') as f:
+        magic = f.read(4)
+    if magic.startswith(_GZIP_MAGIC):
+        return "gzip"
+    if magic == _ZSTD_MAGIC:
+        return "zstd"
+    return None
+
+
+def open_text(filename: str, mode: str, compression: Optional[str] = None) -> IO[str]:
+    """
+    Открыть файл снимка в текстовом режиме с учетом сжатия.
+    
+    Args:
+        filename: Имя файла
+        mode: "r" или "w"
+        compression: None, "gzip" или "zstd"
+    
+    Returns:
+        Текстовый файловый объект
+    
+    Raises:
+        ValueError: При неизвестном способе сжатия
+        ImportError: Если для zstd не установлен пакет zstandard
+    """
+    if compression not in COMPRESSIONS:
+        raise ValueError(f"Сжатие должно быть одним из: {COMPRESSIONS}, получено: '{compression}'")
+    text_mode = mode + "t"
+    if compression == "gzip":
+        return gzip.open(filename, text_mode, encoding='utf-8')
+    if compression == "zstd":
+        _require_zstandard()
+        return zstandard.open(filename, text_mode, encoding='utf-8')
+    return open(filename, mode, encoding='utf-8')
+
+
+def _dumps(record: dict) -> str:
+    """Сериализовать запись в одну строку."""
+    return json.dumps(record, ensure_ascii=False, separators=(',', ':')) + "\n"
+
+
+def write_company(company, filename: str, compression: Optional[str] = None) -> None:
+    """
+    Записать компанию в NDJSON построчно.
+    
+    Args:
+        company: Объект Company
+        filename: Имя файла
+        compression: None, "gzip" или "zstd"
+    """
+    with open_text(filename, 'w', compression) as f:
+        f.write(_dumps({
+            "record": "company",
+            "format": FORMAT_NAME,
+            "version": FORMAT_VERSION,
+            "name": company.name
+        }))
+        for dept in company.departments_view().values():
+            f.write(_dumps({"record": "department", "name": dept.name}))
+            for emp in dept:
+                record = Department._employee_to_dict(emp)
+                f.write(_dumps({"record": "employee", **record}))
+        for proj in company.projects_view().values():
+            f.write(_dumps({
+                "record": "project",
+                "project_id": proj.project_id,
+                "name": proj.name,
+                "description": proj.description,
+                "deadline": proj.deadline.strftime("%Y-%m-%d"),
+                "status": proj.status,
+                "team": list(proj.team_view())
+            }))
+
+
+def iter_records(filename: str) -> Iterator[dict]:
+    """
+    Построчно прочитать записи NDJSON-снимка.
+    
+    Args:
+        filename: Имя файла (сжатие определяется автоматически)
+    
+    Yields:
+        Словари записей
+    """
+    with open_text(filename, 'r', detect_compression(filename)) as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def is_ndjson_snapshot(filename: str) -> bool:
+    """
+    Проверить, что файл является NDJSON-снимком компании.
+    
+    Args:
+        filename: Имя файла
+    
+    Returns:
+        True если первая запись - заголовок company-ndjson
+    """
+    with open_text(filename, 'r', detect_compression(filename)) as f:
+        first_line = f.readline()
+    try:
+        header = json.loads(first_line)
+    except ValueError:
+        return False
+    return isinstance(header, dict) and header.get("format") == FORMAT_NAME
+
+
+def read_company(filename: str, company_cls=None):
+    """
+    Прочитать компанию из NDJSON-снимка или из прежнего JSON-формата.
+    
+    Args:
+        filename: Имя файла (сжатие определяется автоматически)
+        company_cls: Класс компании (по умолчанию Company)
+    
+    Returns:
+        Объект компании
+    
+    Raises:
+        ValueError: При неподдерживаемой версии формата или порядке записей
+    """
+    if company_cls is None:
+        from src.core.company import Company as company_cls
+    
+    if not is_ndjson_snapshot(filename):
+        with open_text(filename, 'r', detect_compression(filename)) as f:
+            return company_cls.from_dict(json.load(f))
+    
+    records = iter_records(filename)
+    header = next(records)
+    if header.get("version") != FORMAT_VERSION:
+        raise ValueError(f"Неподдерживаемая версия формата: {header.get('version')}")
+    company = company_cls(header["name"])
+    
+    department = None
+    pending = []
+    for record in records:
+        kind = record.pop("record", None)
+        if kind == "employee":
+            if department is None:
+                raise ValueError("Запись сотрудника встречена до записи отдела")
+            pending.append(employee_from_dict(record))
+            if len(pending) >= CHUNK_SIZE:
+                department.add_employees(pending)
+                pending = []
+            continue
+        if pending:
+            department.add_employees(pending)
+            pending = []
+        if kind == "department":
+            department = Department(record["name"])
+            company.add_department(department)
+        elif kind == "project":
+            project = Project.from_dict(record)
+            company.add_project(project)
+            for emp_id in record.get("team", []):
+                try:
+                    company.assign_employee_to_project(emp_id, project.project_id)
+                except (EmployeeNotFoundError, ProjectNotFoundError):
+                    pass  # Пропускаем если не удалось восстановить связь
+    if pending:
+        department.add_employees(pending)
+    return company
@@ -26,3 +26,6 @@ class DuplicateIdError(Exception):
     pass
 
 
+class AggregateConsistencyError(Exception):
+    """Исключение при расхождении накопленного агрегата с пересчитанным значением."""
+    pass
@@ -0,0 +1,179 @@
+"""
+Блокировки для многопоточного режима компании.
+
+ReadWriteLock допускает параллельное чтение и монопольную запись.
+Запись реентерабельна в пределах потока, а поток-писатель может брать
+блокировку чтения. ExclusiveLock - одна глобальная блокировка с тем же
+интерфейсом, используется для сравнения.
+"""
+
+import threading
+from contextlib import contextmanager
+from functools import wraps
+from typing import Callable, Iterator
+
+
+class ReadWriteLock:
+    """
+    Блокировка читателей-писателей с приоритетом писателей.
+    
+    Пока писатель ждет, новые читатели не допускаются, поэтому
+    поток записи не голодает при постоянной нагрузке чтения.
+    Повышение блокировки чтения до записи не поддерживается.
+    """
+    
+    def __init__(self):
+        """Инициализация блокировки."""
+        self.__condition = threading.Condition(threading.Lock())
+        self.__readers = 0  # Число потоков, удерживающих чтение
+        self.__waiting_writers = 0
+        self.__writer = None  # Идентификатор потока-писателя
+        self.__write_depth = 0
+        self.__local = threading.local()
+    
+    def _depths(self):
+        """Получить счетчики вложенности текущего потока."""
+        local = self.__local
+        try:
+            local.reads
+        except AttributeError:
+            local.reads = 0  # Вложенные захваты чтения
+            local.reads_in_write = 0  # Захваты чтения внутри собственной записи
+        return local
+    
+    def acquire_read(self) -> None:
+        """Захватить блокировку на чтение."""
+        local = self._depths()
+        if self.__writer == threading.get_ident():
+            local.reads_in_write += 1
+            return
+        if local.reads:
+            local.reads += 1
+            return
+        with self.__condition:
+            while self.__writer is not None or self.__waiting_writers:
+                self.__condition.wait()
+            self.__readers += 1
+        local.reads = 1
+    
+    def release_read(self) -> None:
+        """Освободить блокировку чтения."""
+        local = self._depths()
+        if local.reads_in_write:
+            local.reads_in_write -= 1
+            return
+        if not local.reads:
+            raise RuntimeError("Блокировка чтения не удерживается текущим потоком")
+        local.reads -= 1
+        if local.reads:
+            return
+        with self.__condition:
+            self.__readers -= 1
+            if not self.__readers:
+                self.__condition.notify_all()
+    
+    def acquire_write(self) -> None:
+        """
+        Захватить блокировку на запись.
+        
+        Raises:
+            RuntimeError: При попытке повысить удерживаемую блокировку чтения
+        """
+        me = threading.get_ident()
+        if self.__writer == me:
+            self.__write_depth += 1
+            return
+        if self._depths().reads:
+            raise RuntimeError("Повышение блокировки чтения до записи не поддерживается")
+        with self.__condition:
+            self.__waiting_writers += 1
+            while self.__writer is not None or self.__readers:
+                self.__condition.wait()
+            self.__waiting_writers -= 1
+            self.__writer = me
+        self.__write_depth = 1
+    
+    def release_write(self) -> None:
+        """Освободить блокировку записи."""
+        if self.__writer != threading.get_ident():
+            raise RuntimeError("Блокировка записи не удерживается текущим потоком")
+        self.__write_depth -= 1
+        if self.__write_depth:
+            return
+        with self.__condition:
+            self.__writer = None
+            self.__condition.notify_all()
+    
+    @contextmanager
+    def read(self) -> Iterator[None]:
+        """Контекстный менеджер чтения."""
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+    
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        """Контекстный менеджер записи."""
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+
+class ExclusiveLock:
+    """Одна реентерабельная блокировка и для чтения, и для записи."""
+    
+    def __init__(self):
+        """Инициализация блокировки."""
+        self.__lock = threading.RLock()
+        self.acquire_read = self.acquire_write = self.__lock.acquire
+        self.release_read = self.release_write = self.__lock.release
+    
+    def read(self):
+        """Контекстный менеджер чтения (монопольный)."""
+        return self.__lock
+    
+    def write(self):
+        """Контекстный менеджер записи."""
+        return self.__lock
+
+
+def read_locked(method: Callable) -> Callable:
+    """
+    Выполнять метод под блокировкой чтения объекта, если она задана.
+    
+    Объект хранит блокировку в атрибуте _lock (None - без синхронизации).
+    """
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        lock = self._lock
+        if lock is None:
+            return method(self, *args, **kwargs)
+        lock.acquire_read()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            lock.release_read()
+    return wrapper
+
+
+def write_locked(method: Callable) -> Callable:
+    """
+    Выполнять метод под блокировкой записи объекта, если она задана.
+    
+    Объект хранит блокировку в атрибуте _lock (None - без синхронизации).
+    """
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        lock = self._lock
+        if lock is None:
+            return method(self, *args, **kwargs)
+        lock.acquire_write()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            lock.release_write()
+    return wrapper
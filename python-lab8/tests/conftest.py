@@ -0,0 +1,12 @@
+"""Общие фикстуры тестов."""
+
+import pytest
+from src.core.company import Company
+from src.core.department import Department
+
+
+@pytest.fixture(autouse=True)
+def check_aggregates_consistency(monkeypatch):
+    """Сверять накопленные суммы зарплат с полным пересчетом во всех тестах."""
+    monkeypatch.setattr(Department, "CHECK_CONSISTENCY", True)
+    monkeypatch.setattr(Company, "CHECK_CONSISTENCY", True)
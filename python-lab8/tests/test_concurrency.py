@@ -0,0 +1,258 @@
+"""Тесты многопоточного режима компании."""
+
+import random
+import sys
+import threading
+import time
+import pytest
+from src.core.employee import Employee
+from src.core.department import Department
+from src.core.company import Company
+from src.core.project import Project
+from src.utils.exceptions import EmployeeNotFoundError
+from src.utils.locks import ReadWriteLock, ExclusiveLock
+
+
+THREADS = 8
+ITERATIONS = 300
+
+
+class SlowEmployee(Employee):
+    """Сотрудник, уступающий поток при расчете зарплаты, чтобы расширить окно гонки."""
+    
+    __slots__ = ()
+    
+    def calculate_salary(self) -> float:
+        time.sleep(0)
+        return super().calculate_salary()
+
+
+@pytest.fixture(autouse=True)
+def fast_switching():
+    """Чаще переключать потоки, чтобы гонки проявлялись в тестах."""
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def run_threads(targets):
+    """Запустить функции в отдельных потоках и вернуть возникшие ошибки."""
+    errors = []
+    
+    def guarded(target):
+        try:
+            target()
+        except Exception as error:  # Ошибки потоков проверяются в тесте
+            errors.append(error)
+    
+    threads = [threading.Thread(target=guarded, args=(target,)) for target in targets]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return errors
+
+
+class TestReadWriteLock:
+    """Тесты блокировки читателей-писателей."""
+    
+    def test_readers_run_in_parallel(self):
+        """Тест одновременного удержания чтения несколькими потоками."""
+        # Arrange
+        lock = ReadWriteLock()
+        barrier = threading.Barrier(3, timeout=5)
+        
+        def reader():
+            with lock.read():
+                barrier.wait()  # Не пройдет, если читатели исключают друг друга
+        
+        # Act
+        errors = run_threads([reader] * 3)
+        
+        # Assert
+        assert errors == []
+    
+    def test_writer_is_reentrant_and_can_read(self):
+        """Тест вложенных захватов в потоке-писателе."""
+        # Arrange
+        lock = ReadWriteLock()
+        
+        # Act & Assert
+        with lock.write():
+            with lock.write():
+                with lock.read():
+                    pass
+        with lock.read():
+            with pytest.raises(RuntimeError):
+                lock.acquire_write()
+    
+    def test_writer_excludes_readers(self):
+        """Тест монопольности записи."""
+        # Arrange
+        lock = ReadWriteLock()
+        state = {"value": 0, "torn": 0}
+        
+        def writer():
+            for _ in range(ITERATIONS):
+                with lock.write():
+                    state["value"] += 1
+                    state["value"] -= 1
+        
+        def reader():
+            for _ in range(ITERATIONS):
+                with lock.read():
+                    if state["value"] != 0:
+                        state["torn"] += 1
+        
+        # Act
+        errors = run_threads([writer, reader] * (THREADS // 2))
+        
+        # Assert
+        assert errors == []
+        assert state["torn"] == 0
+
+
+@pytest.mark.parametrize("lock_cls", [ReadWriteLock, ExclusiveLock])
+class TestConcurrentCompany:
+    """Стресс-тесты компании под нагрузкой из многих потоков."""
+    
+    def _build_company(self, lock_cls, size=100):
+        """Создать компанию из двух отделов с общей блокировкой."""
+        company = Company("ThreadCorp", lock=lock_cls())
+        first, second = Department("First"), Department("Second")
+        company.add_department(first)
+        company.add_department(second)
+        first.add_employees(Employee(i, f"Employee {i}", "First", 1000 + i) for i in range(1, size + 1))
+        return company
+    
+    def test_transfers_are_atomic_for_readers(self, lock_cls):
+        """Тест: читатели никогда не видят перенос наполовину."""
+        # Arrange
+        company = self._build_company(lock_cls)
+        expected_cost = company.calculate_total_monthly_cost()
+        
+        def mover(seed):
+            rng = random.Random(seed)
+            for _ in range(ITERATIONS):
+                emp_id = rng.randint(1, 100)
+                source = company.find_employee_department(emp_id)
+                target = "Second" if source.name == "First" else "First"
+                try:
+                    company.transfer_employee(emp_id, source.name, target)
+                except EmployeeNotFoundError:
+                    pass  # Сотрудника успел перенести другой поток
+        
+        def reader():
+            for _ in range(ITERATIONS):
+                stats = company.get_department_stats()
+                assert sum(dept["employee_count"] for dept in stats.values()) == 100
+                assert sum(dept["total_salary"] for dept in stats.values()) == pytest.approx(expected_cost)
+        
+        # Act
+        errors = run_threads([lambda s=s: mover(s) for s in range(THREADS // 2)] + [reader] * (THREADS // 2))
+        
+        # Assert
+        assert errors == []
+        assert len(company.get_all_employees()) == 100
+        assert company.recalculate_total_monthly_cost() == pytest.approx(expected_cost)
+        for emp in company.get_all_employees():
+            assert emp in company.find_employee_department(emp.id)
+    
+    def test_concurrent_hires_and_assignments(self, lock_cls):
+        """Тест параллельного найма и назначения на проекты."""
+        # Arrange
+        company = self._build_company(lock_cls, size=0)
+        company.add_project(Project(1, "Shared", "", "2030-01-01", "active"))
+        department = company._find_department_by_name("Second")
+        
+        def hirer(offset):
+            for i in range(ITERATIONS):
+                emp_id = offset * ITERATIONS + i + 1
+                department.add_employee(Employee(emp_id, f"Employee {emp_id}", "Second", 1000))
+                company.assign_employee_to_project(emp_id, 1)
+                company.find_employee_by_id(emp_id).base_salary = 2000
+        
+        # Act
+        errors = run_threads([lambda o=o: hirer(o) for o in range(THREADS)])
+        
+        # Assert
+        hired = THREADS * ITERATIONS
+        assert errors == []
+        assert len(department) == hired
+        assert company.calculate_total_monthly_cost() == 2000 * hired
+        assert company.get_project_budget_analysis()["total_budget"] == 2000 * hired
+        assert company.get_employee_project_count(hired) == 1
+    
+    def test_concurrent_salary_changes_keep_totals(self, lock_cls):
+        """Тест: параллельные изменения одного сотрудника не ломают суммы."""
+        # Arrange
+        company = self._build_company(lock_cls, size=2)
+        department = company._find_department_by_name("First")
+        employee = SlowEmployee(1000, "Slow", "First", 1000)
+        department.add_employee(employee)
+        company.add_project(Project(1, "Shared", "", "2030-01-01", "active"))
+        company.assign_employee_to_project(1000, 1)
+        
+        def writer(seed):
+            rng = random.Random(seed)
+            for _ in range(ITERATIONS):
+                employee.base_salary = rng.randrange(1000, 20000)
+        
+        # Act
+        errors = run_threads([lambda s=s: writer(s) for s in range(4)])
+        
+        # Assert
+        assert errors == []
+        assert department.calculate_total_salary() == pytest.approx(department.recalculate_total_salary())
+        assert company.calculate_total_monthly_cost() == pytest.approx(company.recalculate_total_monthly_cost())
+        assert company.get_project_budget_analysis()["total_budget"] == pytest.approx(employee.calculate_salary())
+    
+    def test_transactions_group_calls(self, lock_cls):
+        """Тест согласованного чтения и атомарной записи нескольких вызовов."""
+        # Arrange
+        company = self._build_company(lock_cls, size=10)
+        
+        # Act
+        with company.write_transaction():
+            company.transfer_employee(1, "First", "Second")
+            company.transfer_employee(2, "First", "Second")
+        with company.read_transaction():
+            stats = company.get_department_stats()
+        
+        # Assert
+        assert stats["Second"]["employee_count"] == 2
+        with Company("Plain").read_transaction():
+            pass
+    
+    def test_snapshot_consistent_under_writes(self, lock_cls):
+        """Тест: снимок остается согласованным при параллельной записи."""
+        # Arrange
+        company = self._build_company(lock_cls)
+        stop = threading.Event()
+        
+        def writer(seed):
+            rng = random.Random(seed)
+            while not stop.is_set():
+                emp_id = rng.randint(1, 100)
+                with company.write_transaction():
+                    source = company.find_employee_department(emp_id)
+                    target = "Second" if source.name == "First" else "First"
+                    company.transfer_employee(emp_id, source.name, target)
+                    company.find_employee_by_id(emp_id).base_salary += 1
+        
+        def exporter():
+            try:
+                for _ in range(20):
+                    with company.snapshot() as snapshot:
+                        salaries = [state.salary for state in snapshot.iter_employees()]
+                        assert len(salaries) == 100
+                        assert sum(salaries) == pytest.approx(snapshot.calculate_total_monthly_cost())
+            finally:
+                stop.set()
+        
+        # Act
+        errors = run_threads([lambda s=s: writer(s) for s in range(THREADS // 2)] + [exporter])
+        
+        # Assert
+        assert errors == []
@@ -349,3 +349,121 @@ class TestDepartmentIntegration:
         assert dept[1] == developer
 
 
+
+
+class TestDepartmentStorage:
+    """Тесты хранения сотрудников отдела по ID."""
+    
+    def test_employee_hash_consistent_with_eq(self):
+        """Тест хеширования сотрудников по ID."""
+        # Arrange
+        emp1 = Employee(1, "John", "IT", 5000)
+        emp2 = Manager(1, "Jane", "HR", 4000, 500)  # Тот же ID
+        emp3 = Employee(2, "Bob", "IT", 5000)
+        
+        # Act
+        unique = {emp1, emp2, emp3}
+        
+        # Assert
+        assert hash(emp1) == hash(emp2)
+        assert len(unique) == 2
+    
+    def test_add_employees_bulk(self):
+        """Тест пакетного добавления с сохранением порядка."""
+        # Arrange
+        dept = Department("IT")
+        employees = [Employee(i, f"Emp{i}", "IT", 5000) for i in range(3, 0, -1)]
+        
+        # Act
+        dept.add_employees(employees)
+        
+        # Assert
+        assert [emp.id for emp in dept] == [3, 2, 1]
+        assert dept[0].id == 3
+        assert dept.find_employee_by_id(2) is employees[1]
+    
+    def test_add_employees_bulk_is_atomic(self):
+        """Тест отказа всего пакета при дублировании ID."""
+        # Arrange
+        dept = Department("IT")
+        dept.add_employee(Employee(1, "John", "IT", 5000))
+        
+        # Assert - дубликат внутри пакета
+        with pytest.raises(ValueError, match="уже находится в отделе"):
+            dept.add_employees([Employee(2, "Jane", "IT", 5000), Employee(2, "Jack", "IT", 5000)])
+        # Assert - дубликат с существующим сотрудником
+        with pytest.raises(ValueError, match="уже находится в отделе"):
+            dept.add_employees([Employee(3, "Bob", "IT", 5000), Employee(1, "Ann", "IT", 5000)])
+        assert len(dept) == 1
+    
+    def test_remove_and_contains_after_reorder(self):
+        """Тест удаления и проверки принадлежности по ID."""
+        # Arrange
+        dept = Department("IT")
+        dept.add_employees(Employee(i, f"Emp{i}", "IT", 5000) for i in range(1, 4))
+        
+        # Act
+        dept.remove_employee(2)
+        
+        # Assert
+        assert Employee(2, "Other", "IT", 1000) not in dept
+        assert Employee(3, "Other", "IT", 1000) in dept
+        assert [emp.id for emp in dept.get_employees()] == [1, 3]
+        assert dept[1].id == 3
+        with pytest.raises(ValueError):
+            dept.remove_employee(2)
+    
+    def test_employees_view_is_live_and_read_only(self):
+        """Тест представления сотрудников без копирования."""
+        # Arrange
+        dept = Department("IT")
+        dept.add_employee(Employee(1, "John", "IT", 5000))
+        view = dept.employees_view()
+        
+        # Act
+        dept.add_employee(Employee(2, "Jane", "IT", 6000))
+        dept.find_employee_by_id(1).id = 5
+        
+        # Assert
+        assert list(view) == [5, 2]
+        assert view[2].name == "Jane"
+        with pytest.raises(TypeError):
+            view[3] = Employee(3, "Bob", "IT", 1000)
+    
+    def test_index_order_is_maintained_incrementally(self, monkeypatch):
+        """Тест доступа по индексу после изменений без полного копирования отдела."""
+        # Arrange
+        dept = Department("IT")
+        dept.add_employees(Employee(i, f"Emp{i}", "IT", 1000) for i in range(1, 21))
+        rebuilds = []
+        monkeypatch.setattr(Department, "_order_rebuild", lambda self: rebuilds.append(self))
+        
+        # Act
+        dept.add_employee(Employee(21, "New", "IT", 1000))
+        dept.remove_employee(5)
+        dept.remove_employees([1, 20])
+        dept.find_employee_by_id(10).id = 100
+        dept.remove_employee(100)
+        
+        # Assert
+        assert rebuilds == []
+        assert [dept[i].id for i in range(len(dept))] == [emp.id for emp in dept]
+        assert [emp.id for emp in dept[:3]] == [2, 3, 4]
+        assert dept[-1].id == 21
+    
+    def test_remove_employees_bulk(self):
+        """Тест пакетного удаления с проверкой всего пакета."""
+        # Arrange
+        dept = Department("IT")
+        dept.add_employees(Employee(i, f"Emp{i}", "IT", 1000 * i) for i in range(1, 5))
+        
+        # Act
+        removed = dept.remove_employees([3, 1])
+        
+        # Assert
+        assert [emp.id for emp in removed] == [3, 1]
+        assert [emp.id for emp in dept] == [2, 4]
+        assert dept.calculate_total_salary() == 6000
+        with pytest.raises(ValueError):
+            dept.remove_employees([2, 3])
+        assert len(dept) == 2
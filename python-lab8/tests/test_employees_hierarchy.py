@@ -1,5 +1,6 @@
 """Тесты для Части 2: Тестирование наследования и абстрактных классов."""
 
+import gc
 import pytest
 from abc import ABC
 from src.core.abstract_employee import AbstractEmployee
@@ -7,7 +8,11 @@ from src.core.employee import Employee
 from src.employees.manager import Manager
 from src.employees.developer import Developer
 from src.employees.salesperson import Salesperson
+from src.core.department import Department
+from src.core import registry
+from src.core.registry import register_employee_type, get_employee_constructor, employee_from_dict
 from src.factories.employee_factory import EmployeeFactoryMethod
+from src.patterns.builder import EmployeeBuilder
 
 
 class TestAbstractEmployee:
@@ -211,6 +216,93 @@ class TestEmployeeFactory:
                                                   department="IT", base_salary=5000)
 
 
+class TestEmployeeTypeRegistry:
+    """Тесты реестра типов сотрудников."""
+    
+    @pytest.fixture
+    def isolated_registry(self, monkeypatch):
+        """Регистрировать тестовые типы в копии реестра."""
+        monkeypatch.setattr(registry, "_constructors", dict(registry._constructors))
+        monkeypatch.setattr(registry, "_aliases", dict(registry._aliases))
+    
+    def test_builtin_types_are_registered(self):
+        """Тест восстановления встроенных типов по тегу."""
+        # Arrange
+        employees = [
+            Employee(1, "John", "IT", 5000),
+            Manager(2, "Alice", "IT", 7000, 2000),
+            Developer(3, "Bob", "IT", 5000, ["Python"], "senior"),
+            Salesperson(4, "Charlie", "SAL", 4000, 0.1, 1000)
+        ]
+        
+        # Act
+        restored = [employee_from_dict(emp.to_dict()) for emp in employees]
+        
+        # Assert
+        assert [type(emp) for emp in restored] == [type(emp) for emp in employees]
+        assert [emp.calculate_salary() for emp in restored] == [emp.calculate_salary() for emp in employees]
+        assert get_employee_constructor("manager") == Manager.from_dict
+    
+    def test_missing_or_unknown_tag_falls_back_to_employee(self):
+        """Тест загрузки записей без тега и с незарегистрированным тегом."""
+        # Arrange
+        record = {"id": 1, "name": "John", "department": "IT", "base_salary": 5000}
+        
+        # Act & Assert
+        assert type(employee_from_dict(record)) is Employee
+        assert type(employee_from_dict({**record, "type": "Unknown"})) is Employee
+        with pytest.raises(ValueError):
+            get_employee_constructor("Unknown")
+    
+    def test_new_subclass_is_loaded_everywhere(self, isolated_registry):
+        """Тест: новый подкласс подключается к загрузке, фабрике и билдеру."""
+        # Arrange
+        @register_employee_type("Intern")
+        class Intern(Employee):
+            __slots__ = ()
+            
+            def calculate_salary(self) -> float:
+                return self.base_salary / 2
+            
+            def to_dict(self) -> dict:
+                return {**super().to_dict(), "type": "Intern"}
+        
+        # Act
+        department = Department.load_from_file_dict(
+            {"name": "IT", "employees": [Intern(1, "Tim", "IT", 2000).to_dict()]})
+        from_factory = EmployeeFactoryMethod.create_employee(
+            "intern", id=2, name="Ann", department="IT", base_salary=3000)
+        from_builder = (EmployeeBuilder().set_id(3).set_name("Max").set_department("IT")
+                        .set_base_salary(1000).set_type("Intern").build())
+        
+        # Assert
+        assert type(department.find_employee_by_id(1)) is Intern
+        assert department.calculate_total_salary() == 1000
+        assert type(from_factory) is Intern
+        assert type(from_builder) is Intern
+    
+    def test_unregistered_type_keeps_legacy_behavior(self):
+        """Тест: билдер строит Employee, фабрика отклоняет неполные данные через ValueError."""
+        # Act
+        built = (EmployeeBuilder().set_id(1).set_name("Tim").set_department("IT")
+                 .set_base_salary(2000).set_type("intern").build())
+        
+        # Assert
+        assert type(built) is Employee
+        with pytest.raises(ValueError):
+            EmployeeFactoryMethod.create_employee("employee", id=2, name="Ann", department="IT")
+        with pytest.raises(ValueError):
+            EmployeeFactoryMethod.create_employee("intern", id=2, name="Ann", department="IT", base_salary=1)
+    
+    def test_duplicate_tag_is_rejected(self, isolated_registry):
+        """Тест запрета регистрации двух классов под одним тегом."""
+        # Act & Assert
+        with pytest.raises(ValueError):
+            @register_employee_type("Manager")
+            class OtherManager(Employee):
+                __slots__ = ()
+
+
 class TestPolymorphicBehavior:
     """Тесты полиморфного поведения."""
     
@@ -238,3 +330,59 @@ class TestPolymorphicBehavior:
         assert employees[3].calculate_salary() == 11500
 
 
+
+
+class TestCompactLayout:
+    """Тесты компактного хранения сотрудников."""
+    
+    def test_employees_have_no_instance_dict(self):
+        """Тест отсутствия __dict__ у слотовых классов."""
+        # Arrange
+        employees = [
+            Employee(1, "John", "IT", 5000),
+            Manager(2, "Alice", "IT", 7000, 2000),
+            Developer(3, "Bob", "IT", 5000, ["Python"], "senior"),
+            Salesperson(4, "Charlie", "SAL", 4000, 0.1, 1000)
+        ]
+        
+        # Assert
+        for emp in employees:
+            assert not hasattr(emp, "__dict__")
+    
+    def test_tech_stacks_and_strings_are_shared(self):
+        """Тест разделения одинаковых стеков и строк между объектами."""
+        # Arrange
+        dev1 = Developer(1, "Bob", "".join(["D", "EV"]), 5000, ["Py" + "thon".lower(), "SQL"], "".join(["sen", "ior"]))
+        dev2 = Developer(2, "Ann", "DEV", 5000, ["Python", "SQL"], "senior")
+        
+        # Assert
+        assert dev1.department is dev2.department
+        assert dev1.seniority_level is dev2.seniority_level
+        assert dev1._Developer__tech_stack is dev2._Developer__tech_stack
+        
+        # Act - изменение стека одного не затрагивает другого
+        dev1.add_skill("Kafka")
+        
+        # Assert
+        assert dev1.tech_stack == ["Python", "SQL", "Kafka"]
+        assert dev2.tech_stack == ["Python", "SQL"]
+    
+    def test_unused_tech_stacks_are_released(self):
+        """Тест удаления из пула стеков, на которые не ссылается ни один разработчик."""
+        # Arrange
+        dev = Developer(1, "Bob", "DEV", 5000, ["Cobol"], "junior")
+        
+        # Act - промежуточный стек ("Cobol",) больше никому не нужен
+        dev.add_skill("Fortran")
+        gc.collect()
+        
+        # Assert
+        assert ("Cobol",) not in Developer._TECH_STACK_POOL
+        assert ("Cobol", "Fortran") in Developer._TECH_STACK_POOL
+        
+        # Act
+        del dev
+        gc.collect()
+        
+        # Assert
+        assert ("Cobol", "Fortran") not in Developer._TECH_STACK_POOL
@@ -0,0 +1,223 @@
+"""Тесты колоночного расчета зарплат."""
+
+import random
+import pytest
+from src.core.employee import Employee
+from src.core.department import Department
+from src.core.company import Company
+from src.employees.manager import Manager
+from src.employees.developer import Developer
+from src.employees.salesperson import Salesperson
+from src.patterns.decorator import BonusDecorator
+from src.core.registry import employee_from_dict
+from src.payroll.columnar import PayrollFrame
+from src.payroll.scenarios import Adjustment, Scenario, evaluate_scenario, run_scenarios
+
+
+def build_random_company(size: int, seed: int = 42) -> Company:
+    """Создать компанию со случайными сотрудниками всех типов."""
+    rng = random.Random(seed)
+    company = Company("TechCorp")
+    departments = [Department(name) for name in ("Development", "Sales", "Support")]
+    levels = list(Developer.SENIORITY_COEFFICIENTS)
+    for emp_id in range(1, size + 1):
+        dept = rng.choice(departments)
+        base = round(rng.uniform(1000, 20000), 2)
+        kind = emp_id % 4
+        if kind == 0:
+            emp = Employee(emp_id, f"Emp{emp_id}", dept.name, base)
+        elif kind == 1:
+            emp = Manager(emp_id, f"Emp{emp_id}", dept.name, base, round(rng.uniform(0, 5000), 2))
+        elif kind == 2:
+            emp = Developer(emp_id, f"Emp{emp_id}", dept.name, base, ["Python"], rng.choice(levels))
+        else:
+            emp = Salesperson(emp_id, f"Emp{emp_id}", dept.name, base,
+                              round(rng.uniform(0, 0.3), 3), round(rng.uniform(0, 100000), 2))
+        dept.add_employee(emp)
+    for dept in departments:
+        company.add_department(dept)
+    return company
+
+
+class TestPayrollFrame:
+    """Тесты PayrollFrame."""
+    
+    def test_salaries_match_object_model(self):
+        """Тест побитового совпадения зарплат с calculate_salary()."""
+        # Arrange
+        company = build_random_company(2000)
+        
+        # Act
+        frame = PayrollFrame.from_company(company)
+        salaries = frame.calculate_salaries()
+        
+        # Assert
+        employees = company.get_all_employees()
+        assert len(frame) == len(employees)
+        assert list(frame.ids) == [emp.id for emp in employees]
+        assert salaries.tolist() == [emp.calculate_salary() for emp in employees]
+    
+    def test_department_and_company_totals(self):
+        """Тест совпадения сумм по отделам и компании с пересчетом."""
+        # Arrange
+        company = build_random_company(1000)
+        
+        # Act
+        frame = PayrollFrame.from_company(company)
+        totals = frame.department_totals()
+        
+        # Assert
+        for dept in company.get_departments():
+            assert totals[dept.name] == sum(emp.calculate_salary() for emp in dept)
+        assert frame.total_cost() == company.recalculate_total_monthly_cost()
+    
+    def test_type_totals_and_unknown_types(self):
+        """Тест сумм по типам и фиксации зарплаты неизвестных типов."""
+        # Arrange
+        dept = Department("IT")
+        dept.add_employee(Manager(1, "Alice", "IT", 7000, 2000))
+        dept.add_employee(BonusDecorator(Employee(2, "Bob", "IT", 5000), 500))
+        
+        # Act
+        frame = PayrollFrame.from_departments([dept])
+        
+        # Assert
+        assert frame.calculate_salaries().tolist() == [9000.0, 5500.0]
+        assert frame.type_totals() == {"Manager": (1, 9000.0), "Other": (1, 5500.0)}
+    
+    def test_empty_company(self):
+        """Тест пустой компании."""
+        # Arrange
+        company = Company("Empty")
+        company.add_department(Department("IT"))
+        
+        # Act
+        frame = PayrollFrame.from_company(company)
+        
+        # Assert
+        assert len(frame) == 0
+        assert frame.department_totals() == {"IT": 0.0}
+        assert frame.total_cost() == 0.0
+        with pytest.raises(ValueError):
+            frame.calculate_salaries()[0:1] = 1.0
+
+
+class TestScenarioSimulator:
+    """Тесты моделирования сценариев изменения зарплат."""
+    
+    SCENARIOS = [
+        Scenario("senior_raise", (
+            Adjustment("base_salary", "scale", 1.1, employee_type="Developer",
+                       department="Development", seniority="senior"),
+        )),
+        Scenario("bonus_cap", (Adjustment("bonus", "cap", 1000),)),
+        Scenario("sales_plan", (
+            Adjustment("commission_rate", "set", 0.05, department="Sales"),
+            Adjustment("sales_volume", "add", 10000),
+            Adjustment("base_salary", "floor", 5000)
+        ))
+    ]
+    
+    @staticmethod
+    def apply_to_clone(employee, department, scenario):
+        """Применить сценарий к копии сотрудника через сеттеры (эталон)."""
+        clone = employee_from_dict(employee.to_dict())
+        for adjustment in scenario.adjustments:
+            emp_type = type(clone).__name__
+            if adjustment.employee_type not in (None, emp_type):
+                continue
+            if adjustment.department not in (None, department):
+                continue
+            if adjustment.seniority is not None and getattr(clone, "seniority_level", None) != adjustment.seniority:
+                continue
+            if not hasattr(clone, adjustment.field):
+                continue
+            current = getattr(clone, adjustment.field)
+            value = {
+                "scale": lambda: current * adjustment.value,
+                "add": lambda: current + adjustment.value,
+                "set": lambda: adjustment.value,
+                "cap": lambda: min(current, adjustment.value),
+                "floor": lambda: max(current, adjustment.value)
+            }[adjustment.operation]()
+            setattr(clone, adjustment.field, value)
+        return clone.calculate_salary()
+    
+    def test_scenarios_match_mutated_clones(self):
+        """Тест совпадения сценариев с изменением копий объектов."""
+        # Arrange
+        company = build_random_company(1000)
+        frame = PayrollFrame.from_company(company)
+        employees = company.get_all_employees()
+        cost_before = company.calculate_total_monthly_cost()
+        
+        # Act
+        results = run_scenarios(frame, self.SCENARIOS)
+        
+        # Assert
+        for scenario, result in zip(self.SCENARIOS, results):
+            expected = [self.apply_to_clone(emp, emp.department, scenario) for emp in employees]
+            assert result.name == scenario.name
+            assert result.salaries.tolist() == pytest.approx(expected)
+            assert result.total_delta == pytest.approx(sum(expected) - cost_before)
+            for dept in company.get_departments():
+                expected_delta = sum(self.apply_to_clone(emp, dept.name, scenario) - emp.calculate_salary()
+                                     for emp in dept)
+                assert result.department_deltas[dept.name] == pytest.approx(expected_delta)
+        assert company.calculate_total_monthly_cost() == cost_before
+        assert frame.calculate_salaries().tolist() == [emp.calculate_salary() for emp in employees]
+    
+    def test_targeted_adjustment_touches_only_matching_rows(self):
+        """Тест: корректировка затрагивает только подходящих сотрудников."""
+        # Arrange
+        dept = Department("Development")
+        dept.add_employees([
+            Developer(1, "Alice", "DEV", 5000, ["Python"], "senior"),
+            Developer(2, "Bob", "DEV", 5000, ["Go"], "junior"),
+            Manager(3, "Carl", "DEV", 5000, 3000),
+            Employee(4, "Dan", "DEV", 5000)
+        ])
+        frame = PayrollFrame.from_departments([dept])
+        scenario = Scenario("raise", (
+            Adjustment("base_salary", "scale", 1.1, seniority="senior"),
+            Adjustment("bonus", "add", 500),
+        ))
+        
+        # Act
+        result = evaluate_scenario(frame, scenario)
+        
+        # Assert
+        assert result.salary_deltas.tolist() == pytest.approx([1000.0, 0.0, 500.0, 0.0])
+        assert result.department_deltas == pytest.approx({"Development": 1500.0})
+        assert result.total_cost == pytest.approx(10000 + 5000 + 8000 + 5000 + 1500)
+    
+    def test_process_pool_matches_sequential(self):
+        """Тест совпадения результатов пула процессов с последовательным расчетом."""
+        # Arrange
+        frame = PayrollFrame.from_company(build_random_company(500))
+        
+        # Act
+        sequential = run_scenarios(frame, self.SCENARIOS)
+        parallel = run_scenarios(frame, self.SCENARIOS, processes=2)
+        
+        # Assert
+        for left, right in zip(sequential, parallel):
+            assert left.name == right.name
+            assert left.salaries.tolist() == right.salaries.tolist()
+            assert left.department_deltas == right.department_deltas
+    
+    @pytest.mark.parametrize("adjustment", [
+        Adjustment("salary", "scale", 1.1),
+        Adjustment("bonus", "multiply", 1.1),
+        Adjustment("bonus", "add", 1, employee_type="Intern"),
+        Adjustment("base_salary", "add", 1, department="Unknown"),
+        Adjustment("base_salary", "add", 1, seniority="lead")
+    ])
+    def test_invalid_adjustments(self, adjustment):
+        """Тест отказа на некорректных корректировках."""
+        # Arrange
+        frame = PayrollFrame.from_company(build_random_company(10))
+        
+        # Act & Assert
+        with pytest.raises(ValueError):
+            evaluate_scenario(frame, Scenario("broken", (adjustment,)))
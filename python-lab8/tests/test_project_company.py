@@ -3,6 +3,7 @@
 import pytest
 import os
 import tempfile
+from datetime import date
 from src.core.employee import Employee
 from src.core.department import Department
 from src.core.company import Company
@@ -12,7 +13,7 @@ from src.employees.developer import Developer
 from src.employees.salesperson import Salesperson
 from src.utils.exceptions import (
     DuplicateIdError, InvalidStatusError, EmployeeNotFoundError,
-    DepartmentNotFoundError, ProjectNotFoundError
+    DepartmentNotFoundError, ProjectNotFoundError, AggregateConsistencyError
 )
 
 
@@ -68,6 +69,70 @@ class TestProject:
             assert project.status == status
 
 
+class TestProjectTeamIndex:
+    """Тесты индексированной команды проекта и кэша бюджета."""
+    
+    def test_team_lookup_and_order(self):
+        """Тест поиска, удаления и порядка членов команды."""
+        # Arrange
+        project = Project(1, "AI Platform", "ML", "2024-12-31", "active")
+        members = [Employee(i, f"Emp{i}", "DEV", 1000 * i) for i in (3, 1, 2)]
+        for emp in members:
+            project.add_team_member(emp)
+        
+        # Act
+        project.remove_team_member(1)
+        
+        # Assert
+        assert [emp.id for emp in project.get_team()] == [3, 2]
+        assert project.find_team_member(2) is members[2]
+        assert project.find_team_member(1) is None
+        with pytest.raises(ValueError, match="уже в команде"):
+            project.add_team_member(Employee(3, "Copy", "DEV", 1))
+    
+    def test_budget_cache_invalidated_by_salary_change(self):
+        """Тест сброса кэша бюджета при изменении зарплаты члена команды."""
+        # Arrange
+        project = Project(1, "AI Platform", "ML", "2024-12-31", "active")
+        manager = Manager(1, "Alice", "DEV", 7000, 2000)
+        developer = Developer(2, "Bob", "DEV", 5000, ["Python"], "junior")
+        project.add_team_member(manager)
+        project.add_team_member(developer)
+        assert project.calculate_total_salary() == 14000
+        
+        # Act
+        manager.bonus = 3000
+        developer.seniority_level = "senior"
+        
+        # Assert
+        assert project.calculate_total_salary() == 20000
+        
+        # Act - бывший член команды больше не влияет на бюджет
+        project.remove_team_member(2)
+        developer.base_salary = 100000
+        
+        # Assert
+        assert project.calculate_total_salary() == 10000
+    
+    def test_team_follows_employee_id_change(self):
+        """Тест смены ID члена команды."""
+        # Arrange
+        project = Project(1, "AI Platform", "ML", "2024-12-31", "active")
+        emp1 = Employee(1, "John", "DEV", 5000)
+        emp2 = Employee(2, "Jane", "DEV", 5000)
+        project.add_team_member(emp1)
+        project.add_team_member(emp2)
+        
+        # Act
+        emp1.id = 10
+        
+        # Assert
+        assert project.find_team_member(10) is emp1
+        assert [emp.id for emp in project.get_team()] == [10, 2]
+        with pytest.raises(ValueError):
+            emp1.id = 2
+
+
 class TestCompany:
     """Тесты для класса Company."""
     
@@ -354,3 +419,717 @@ class TestComplexCompanyStructure:
             company.remove_project(1)
 
 
+
+
+class TestCompanyEmployeeIndex:
+    """Тесты индекса сотрудников компании."""
+    
+    def test_index_tracks_department_changes(self):
+        """Тест обновления индекса при найме и увольнении через отдел."""
+        # Arrange
+        company = Company("TechCorp")
+        dept = Department("Development")
+        company.add_department(dept)
+        emp = Employee(1, "John", "DEV", 5000)
+        
+        # Act
+        dept.add_employee(emp)
+        
+        # Assert
+        assert company.find_employee_by_id(1) is emp
+        assert company.find_employee_department(1) is dept
+        
+        # Act - Увольнение
+        dept.remove_employee(1)
+        
+        # Assert
+        assert company.find_employee_by_id(1) is None
+        assert company.find_employee_department(1) is None
+    
+    def test_index_follows_transfer(self):
+        """Тест обновления индекса при переводе сотрудника."""
+        # Arrange
+        company = Company("TechCorp")
+        dev = Department("Development")
+        sales = Department("Sales")
+        emp = Employee(1, "John", "DEV", 5000)
+        dev.add_employee(emp)
+        company.add_department(dev)
+        company.add_department(sales)
+        
+        # Act
+        company.transfer_employee(1, "Development", "Sales")
+        
+        # Assert
+        assert company.find_employee_department(1) is sales
+        assert emp in sales
+        with pytest.raises(EmployeeNotFoundError):
+            company.transfer_employee(1, "Development", "Sales")
+    
+    def test_duplicate_id_across_departments_raises_error(self):
+        """Тест запрета одинаковых ID сотрудников в разных отделах."""
+        # Arrange
+        company = Company("TechCorp")
+        dev = Department("Development")
+        sales = Department("Sales")
+        dev.add_employee(Employee(1, "John", "DEV", 5000))
+        company.add_department(dev)
+        company.add_department(sales)
+        
+        # Assert
+        with pytest.raises(DuplicateIdError):
+            sales.add_employee(Employee(1, "Jane", "SAL", 6000))
+        assert len(sales) == 0
+        
+        other = Department("Support")
+        other.add_employee(Employee(1, "Jack", "SUP", 4000))
+        with pytest.raises(DuplicateIdError):
+            company.add_department(other)
+        assert other not in company.get_departments()
+    
+    def test_removed_department_is_not_indexed(self):
+        """Тест отписки индекса от удаленного отдела."""
+        # Arrange
+        company = Company("TechCorp")
+        dept = Department("Development")
+        company.add_department(dept)
+        
+        # Act
+        company.remove_department("Development")
+        dept.add_employee(Employee(1, "John", "DEV", 5000))
+        
+        # Assert
+        assert company.find_employee_by_id(1) is None
+
+
+class TestRunningSalaryTotals:
+    """Тесты инкрементально поддерживаемых сумм зарплат."""
+    
+    def _build_company(self):
+        """Создать компанию из двух отделов и трех сотрудников."""
+        company = Company("TechCorp")
+        dev = Department("Development")
+        sales = Department("Sales")
+        manager = Manager(1, "Alice", "DEV", 7000, 2000)
+        developer = Developer(2, "Bob", "DEV", 5000, ["Python"], "junior")
+        salesperson = Salesperson(3, "Charlie", "SAL", 4000, 0.1, 10000)
+        dev.add_employees([manager, developer])
+        sales.add_employee(salesperson)
+        company.add_department(dev)
+        company.add_department(sales)
+        return company, dev, sales, manager, developer, salesperson
+    
+    def test_totals_follow_salary_inputs(self):
+        """Тест обновления сумм при изменении параметров зарплаты."""
+        # Arrange
+        company, dev, sales, manager, developer, salesperson = self._build_company()
+        
+        # Act
+        manager.base_salary = 8000
+        manager.bonus = 3000
+        developer.seniority_level = "senior"
+        salesperson.commission_rate = 0.2
+        salesperson.sales_volume = 20000
+        salesperson.update_sales(5000)
+        
+        # Assert
+        assert dev.calculate_total_salary() == 11000 + 10000
+        assert sales.calculate_total_salary() == 4000 + 25000 * 0.2
+        assert company.calculate_total_monthly_cost() == 21000 + 9000
+    
+    def test_totals_follow_hire_fire_and_transfer(self):
+        """Тест обновления сумм при найме, увольнении и переводе."""
+        # Arrange
+        company, dev, sales, manager, developer, salesperson = self._build_company()
+        
+        # Act
+        company.transfer_employee(2, "Development", "Sales")
+        dev.remove_employee(1)
+        sales.add_employee(Employee(4, "Dan", "SAL", 3000))
+        
+        # Assert
+        assert dev.calculate_total_salary() == 0
+        assert sales.calculate_total_salary() == 5000 + 5000 + 3000
+        assert company.calculate_total_monthly_cost() == 13000
+        
+        # Уволенный сотрудник больше не влияет на суммы
+        manager.bonus = 100000
+        assert company.calculate_total_monthly_cost() == 13000
+    
+    def test_consistency_check_detects_drift(self, monkeypatch):
+        """Тест режима проверки согласованности."""
+        # Arrange
+        company, dev, *_ = self._build_company()
+        developer = dev.find_employee_by_id(2)
+        
+        # Act - изменение в обход уведомлений
+        monkeypatch.setitem(Developer.SENIORITY_COEFFICIENTS, "junior", 3.0)
+        
+        # Assert
+        with pytest.raises(AggregateConsistencyError):
+            dev.calculate_total_salary()
+        assert dev.recalculate_total_salary() == 9000 + developer.calculate_salary()
+        assert company.recalculate_total_monthly_cost() == company.calculate_total_monthly_cost()
+    
+    def test_employee_id_change_rekeys_indexes(self):
+        """Тест смены ID сотрудника внутри отдела и компании."""
+        # Arrange
+        company, dev, sales, manager, *_ = self._build_company()
+        
+        # Act
+        manager.id = 10
+        
+        # Assert
+        assert dev.find_employee_by_id(10) is manager
+        assert company.find_employee_by_id(10) is manager
+        assert company.find_employee_by_id(1) is None
+        with pytest.raises(DuplicateIdError):
+            manager.id = 3
+        assert manager.id == 10
+
+
+class TestEmployeeProjectIndex:
+    """Тесты обратного индекса сотрудник -> проекты."""
+    
+    def _build_company(self):
+        """Создать компанию с тремя проектами."""
+        company = Company("IndexCorp")
+        dept = Department("Development")
+        for emp_id in range(1, 5):
+            dept.add_employee(Employee(emp_id, f"Employee {emp_id}", "Development", 5000))
+        company.add_department(dept)
+        for project_id in range(1, 4):
+            company.add_project(Project(project_id, f"Project {project_id}", "", "2024-12-31", "active"))
+        return company
+    
+    def test_assignments_update_counters(self):
+        """Тест счетчиков загрузки при назначении и снятии с проектов."""
+        # Arrange
+        company = self._build_company()
+        
+        # Act
+        company.assign_employee_to_project(1, 1)
+        company.assign_employee_to_project(1, 2)
+        company.assign_employee_to_project(1, 3)
+        company.assign_employee_to_project(2, 1)
+        company.assign_employee_to_project(2, 2)
+        company.assign_employee_to_project(3, 3)
+        company._find_project_by_id(3).remove_team_member(1)
+        
+        # Assert
+        assert company.get_employee_project_count(1) == 2
+        assert [p.project_id for p in company.get_employee_projects(1)] == [1, 2]
+        assert company.get_employee_project_count(4) == 0
+        assert company.get_employee_projects(4) == []
+        assert sorted(e.id for e in company.find_overloaded_employees()) == [1, 2]
+        assert company.find_employees_with_more_projects_than(2) == []
+        assert [e.id for e in company.find_employees_with_more_projects_than(0)][0] == 3
+        assert len(company.find_employees_with_more_projects_than(0)) == 3
+        assert company.check_employee_availability(3)
+        assert not company.check_employee_availability(1)
+    
+    def test_existing_team_is_indexed_on_add_project(self):
+        """Тест индексации команды проекта, добавленного с участниками."""
+        # Arrange
+        company = self._build_company()
+        company.assign_employee_to_project(1, 1)
+        project = Project(4, "Prepared", "", "2024-12-31", "planning")
+        project.add_team_member(company.find_employee_by_id(1))
+        
+        # Act
+        company.add_project(project)
+        
+        # Assert
+        assert company.get_employee_project_count(1) == 2
+        assert [e.id for e in company.find_overloaded_employees()] == [1]
+    
+    def test_index_follows_employee_id_change(self):
+        """Тест переноса назначений при смене ID сотрудника."""
+        # Arrange
+        company = self._build_company()
+        company.assign_employee_to_project(1, 1)
+        company.assign_employee_to_project(1, 2)
+        employee = company.find_employee_by_id(1)
+        
+        # Act
+        employee.id = 10
+        
+        # Assert
+        assert company.get_employee_project_count(1) == 0
+        assert company.get_employee_project_count(10) == 2
+        assert company.find_overloaded_employees() == [employee]
+    
+    def test_removed_project_is_not_tracked(self):
+        """Тест отписки компании от удаленного проекта."""
+        # Arrange
+        company = self._build_company()
+        project = company._find_project_by_id(1)
+        
+        # Act
+        company.remove_project(1)
+        project.add_team_member(company.find_employee_by_id(1))
+        
+        # Assert
+        assert company.get_employee_project_count(1) == 0
+
+
+class TestCompanyLookupIndexes:
+    """Тесты индексов отделов по названию и проектов по ID и статусу."""
+    
+    def test_department_name_index(self):
+        """Тест поиска, переименования и удаления отделов по названию."""
+        # Arrange
+        company = Company("IndexCorp")
+        dev = Department("Development")
+        dev.add_employee(Employee(1, "John", "DEV", 5000))
+        company.add_department(dev)
+        company.add_department(Department("Sales"))
+        
+        # Act
+        dev.name = "Engineering"
+        
+        # Assert
+        assert company._find_department_by_name("Engineering") is dev
+        assert company._find_department_by_name("Development") is None
+        assert [d.name for d in company.get_departments()] == ["Engineering", "Sales"]
+        with pytest.raises(ValueError):
+            dev.name = "Sales"
+        assert dev.name == "Engineering"
+        with pytest.raises(ValueError):
+            company.add_department(Department("Sales"))
+        assert company.transfer_employee(1, "Engineering", "Sales")
+        company.remove_department("Engineering")
+        assert company._find_department_by_name("Engineering") is None
+    
+    def test_project_id_and_status_indexes(self):
+        """Тест индекса проектов по ID и по статусу."""
+        # Arrange
+        company = Company("IndexCorp")
+        first = Project(1, "First", "", "2024-12-31", "planning")
+        second = Project(2, "Second", "", "2024-12-31", "active")
+        company.add_project(first)
+        company.add_project(second)
+        
+        # Act
+        first.change_status("active")
+        second.change_status("completed")
+        
+        # Assert
+        assert company._find_project_by_id(2) is second
+        assert company.get_projects_by_status("active") == [first]
+        assert company.get_projects_by_status("completed") == [second]
+        assert company.get_projects_by_status("planning") == []
+        with pytest.raises(DuplicateIdError):
+            company.add_project(Project(1, "Clone", "", "2024-12-31"))
+        company.remove_project(2)
+        assert company._find_project_by_id(2) is None
+        assert company.get_projects_by_status("completed") == []
+        second.change_status("active")
+        assert company.get_projects_by_status("active") == [first]
+
+
+class TestDeadlineIndex:
+    """Тесты упорядоченного индекса сроков проектов."""
+    
+    def _build_company(self):
+        """Создать компанию с проектами на разные сроки."""
+        company = Company("DeadlineCorp")
+        company.add_project(Project(1, "Late", "", "2024-03-01", "active"))
+        company.add_project(Project(2, "Early", "", "2024-01-10", "planning"))
+        company.add_project(Project(3, "Middle", "", "2024-02-01", "active"))
+        company.add_project(Project(4, "Same day", "", "2024-02-01", "planning"))
+        return company
+    
+    def test_range_query(self):
+        """Тест выборки проектов по диапазону сроков."""
+        # Arrange
+        company = self._build_company()
+        
+        # Act
+        projects = company.get_projects_due_between("2024-01-10", "2024-02-01")
+        
+        # Assert
+        assert [p.project_id for p in projects] == [2, 3, 4]
+        assert [p.project_id for p in company.get_projects_due_between(
+            "2024-01-01", "2024-12-31", status="active")] == [3, 1]
+        assert company.get_projects_due_between("2025-01-01", "2025-12-31") == []
+    
+    def test_due_within_and_nearest(self):
+        """Тест запросов ближайших сроков."""
+        # Arrange
+        company = self._build_company()
+        
+        # Act
+        due_soon = company.get_projects_due_within(14, since="2024-01-20")
+        nearest = company.get_nearest_deadlines(2, since=date(2024, 1, 11))
+        
+        # Assert
+        assert [p.project_id for p in due_soon] == [3, 4]
+        assert [p.project_id for p in nearest] == [3, 4]
+        assert [p.project_id for p in company.get_nearest_deadlines(
+            5, since="2024-01-01", status="planning")] == [2, 4]
+    
+    def test_index_follows_status_and_removal(self):
+        """Тест обновления индекса при смене статуса и удалении проекта."""
+        # Arrange
+        company = self._build_company()
+        project = company._find_project_by_id(4)
+        
+        # Act
+        project.change_status("active")
+        company.remove_project(3)
+        
+        # Assert
+        assert [p.project_id for p in company.get_projects_due_between(
+            "2024-01-01", "2024-12-31", status="active")] == [4, 1]
+        assert [p.project_id for p in company.get_projects_due_between(
+            "2024-01-01", "2024-12-31", status="planning")] == [2]
+        assert [p.project_id for p in company.get_nearest_deadlines(10, since="2024-01-01")] == [2, 4, 1]
+
+
+class TestMaterializedStats:
+    """Тесты инкрементально поддерживаемой статистики компании."""
+    
+    def test_department_stats_follow_changes(self):
+        """Тест статистики отделов после найма, увольнения и повышения."""
+        # Arrange
+        company = Company("StatsCorp")
+        dept = Department("Development")
+        company.add_department(dept)
+        dept.add_employee(Employee(1, "John", "DEV", 5000))
+        dept.add_employee(Developer(2, "Alice", "DEV", 6000, ["Python"], "senior"))
+        dept.add_employee(Developer(3, "Bob", "DEV", 4000, ["Go"], "junior"))
+        
+        # Act
+        dept.remove_employee(3)
+        dept.find_employee_by_id(1).base_salary = 5500
+        
+        # Assert
+        assert company.get_department_stats() == {
+            "Development": {
+                "employee_count": 2,
+                "total_salary": 5500 + 6000 * 2.0,
+                "employee_types": {"Employee": 1, "Developer": 1}
+            }
+        }
+        dept.remove_employee(2)
+        assert dept.get_employee_count() == {"Employee": 1}
+    
+    def test_project_budget_analysis_follows_changes(self):
+        """Тест анализа бюджетов при смене команд, статусов и зарплат."""
+        # Arrange
+        company = Company("StatsCorp")
+        dept = Department("Development")
+        for emp_id, salary in [(1, 5000), (2, 6000), (3, 7000)]:
+            dept.add_employee(Employee(emp_id, f"Employee {emp_id}", "DEV", salary))
+        company.add_department(dept)
+        company.add_project(Project(1, "Alpha", "", "2024-12-31", "active"))
+        company.add_project(Project(2, "Beta", "", "2024-12-31", "active"))
+        company.add_project(Project(3, "Gamma", "", "2024-12-31", "planning"))
+        company.assign_employee_to_project(1, 1)
+        company.assign_employee_to_project(2, 1)
+        company.assign_employee_to_project(3, 2)
+        
+        # Act
+        dept.find_employee_by_id(2).base_salary = 6500
+        company._find_project_by_id(2).change_status("completed")
+        company._find_project_by_id(1).remove_team_member(1)
+        company.remove_project(3)
+        
+        # Assert
+        analysis = company.get_project_budget_analysis()
+        assert analysis == {
+            "total_projects": 2,
+            "by_status": {
+                "active": {"count": 1, "total_budget": 6500.0},
+                "completed": {"count": 1, "total_budget": 7000.0}
+            },
+            "total_budget": 13500.0
+        }
+        
+        # Возвращаемый словарь - копия, а не само представление
+        analysis["by_status"]["active"]["count"] = 100
+        assert company.get_project_budget_analysis()["by_status"]["active"]["count"] == 1
+    
+    def test_status_change_of_only_project_keeps_total_budget(self):
+        """Тест смены статуса единственного проекта с командой."""
+        # Arrange
+        company = Company("SoloCorp")
+        dept = Department("Development")
+        dept.add_employee(Employee(1, "Employee 1", "DEV", 5000))
+        company.add_department(dept)
+        company.add_project(Project(1, "Alpha", "", "2024-12-31", "active"))
+        company.assign_employee_to_project(1, 1)
+        
+        # Act
+        company._find_project_by_id(1).change_status("completed")
+        
+        # Assert
+        assert company.get_project_budget_analysis() == {
+            "total_projects": 1,
+            "by_status": {"completed": {"count": 1, "total_budget": 5000.0}},
+            "total_budget": 5000.0
+        }
+
+
+class TestCompanyViewsAndPaging:
+    """Тесты представлений и постраничного обхода компании."""
+    
+    def _build_company(self):
+        """Создать компанию из трех отделов разного размера."""
+        company = Company("PagingCorp")
+        emp_id = 1
+        for name, size in [("A", 3), ("B", 0), ("C", 4)]:
+            dept = Department(name)
+            for _ in range(size):
+                dept.add_employee(Employee(emp_id, f"Employee {emp_id}", name, 5000))
+                emp_id += 1
+            company.add_department(dept)
+        return company
+    
+    def test_views_are_read_only_and_live(self):
+        """Тест представлений отделов, проектов и команды."""
+        # Arrange
+        company = self._build_company()
+        departments = company.departments_view()
+        projects = company.projects_view()
+        project = Project(1, "Alpha", "", "2024-12-31")
+        
+        # Act
+        company.add_project(project)
+        company.assign_employee_to_project(2, 1)
+        departments["A"].name = "Renamed"
+        
+        # Assert
+        assert list(departments) == ["Renamed", "B", "C"]
+        assert projects[1] is project
+        assert list(project.team_view()) == [2]
+        with pytest.raises(TypeError):
+            projects[2] = project
+    
+    def test_iter_all_employees(self):
+        """Тест ленивого перебора сотрудников."""
+        # Arrange
+        company = self._build_company()
+        
+        # Act
+        ids = [emp.id for emp in company.iter_all_employees()]
+        
+        # Assert
+        assert ids == list(range(1, 8))
+        assert [emp.id for emp in company.get_all_employees()] == ids
+    
+    def test_offset_paging(self):
+        """Тест постраничного обхода по смещению."""
+        # Arrange
+        company = self._build_company()
+        
+        # Act
+        pages = [[emp.id for emp in company.get_employees_page(offset, 3)] for offset in range(0, 9, 3)]
+        
+        # Assert
+        assert pages == [[1, 2, 3], [4, 5, 6], [7]]
+        assert company.get_employees_page(2, 0) == []
+        with pytest.raises(ValueError):
+            company.get_employees_page(-1, 3)
+    
+    def test_cursor_paging(self):
+        """Тест постраничного обхода по курсору."""
+        # Arrange
+        company = self._build_company()
+        pages = []
+        cursor = None
+        
+        # Act
+        while True:
+            page, cursor = company.get_employees_by_cursor(2, cursor)
+            pages.append([emp.id for emp in page])
+            if cursor is None:
+                break
+        
+        # Assert
+        assert pages == [[1, 2], [3, 4], [5, 6], [7]]
+        with pytest.raises(DepartmentNotFoundError):
+            company.get_employees_by_cursor(2, ("Missing", 0))
+
+
+class TestSalaryQueries:
+    """Тесты запросов top-k и процентилей зарплат."""
+    
+    def _build_company(self):
+        """Создать компанию из двух отделов с сотрудниками разных типов."""
+        company = Company("SalaryCorp")
+        dev, sales = Department("Development"), Department("Sales")
+        company.add_department(dev)
+        company.add_department(sales)
+        dev.add_employees([
+            Employee(1, "John", "DEV", 5000),
+            Developer(2, "Alice", "DEV", 6000, ["Python"], "senior"),
+            Manager(3, "Bob", "DEV", 7000, 1000),
+            Developer(4, "Eve", "DEV", 4000, ["Go"], "junior")
+        ])
+        sales.add_employees([
+            Salesperson(5, "Carl", "SAL", 3000, 0.1, 20000),
+            Employee(6, "Dan", "SAL", 4500)
+        ])
+        return company
+    
+    def test_top_earners_overall_and_grouped(self):
+        """Тест top-k по компании, отделам и типам."""
+        # Arrange
+        company = self._build_company()
+        
+        # Act
+        overall = company.get_top_earners(3)
+        by_department = company.get_top_earners(2, by="department")
+        by_type = company.get_top_earners(1, by="type")
+        
+        # Assert
+        assert [emp.id for emp in overall] == [2, 3, 1]  # При равенстве с ID 5 - порядок индекса
+        assert {name: [emp.id for emp in emps] for name, emps in by_department.items()} == {
+            "Development": [2, 3], "Sales": [5, 6]
+        }
+        assert {name: [emp.id for emp in emps] for name, emps in by_type.items()} == {
+            "Employee": [1], "Developer": [2], "Manager": [3], "Salesperson": [5]
+        }
+        assert company.get_top_earners(0) == []
+    
+    def test_queries_follow_salary_changes_and_moves(self):
+        """Тест: кэш зарплат следует за изменениями, переносами и сменой ID."""
+        # Arrange
+        company = self._build_company()
+        
+        # Act
+        company.find_employee_by_id(1).base_salary = 20000
+        company.transfer_employee(1, "Development", "Sales")
+        company.find_employee_by_id(1).id = 10
+        company._find_department_by_name("Development").remove_employee(2)
+        
+        # Assert
+        assert [emp.id for emp in company.get_top_earners(2)] == [10, 3]
+        assert [emp.id for emp in company.get_top_earners(1, by="department")["Sales"]] == [10]
+        assert company.get_salary_percentiles([100]) == {100: 20000.0}
+    
+    def test_exact_percentiles_interpolate(self):
+        """Тест точных процентилей с линейной интерполяцией."""
+        # Arrange
+        company = self._build_company()
+        # Зарплаты: 5000, 12000, 8000, 4000, 5000, 4500
+        
+        # Act
+        overall = company.get_salary_percentiles([0, 50, 90, 100])
+        by_type = company.get_salary_percentiles([50], by="type")
+        
+        # Assert
+        assert overall == {0: 4000.0, 50: 5000.0, 90: 10000.0, 100: 12000.0}
+        assert by_type == {
+            "Employee": {50: 4750.0},
+            "Developer": {50: 8000.0},
+            "Manager": {50: 8000.0},
+            "Salesperson": {50: 5000.0}
+        }
+        assert Company("Empty").get_salary_percentiles() == {}
+    
+    def test_approximate_percentiles_are_close(self):
+        """Тест приближенных процентилей на большой группе."""
+        # Arrange
+        company = Company("BigCorp")
+        dept = Department("Ops")
+        company.add_department(dept)
+        dept.add_employees(Employee(i, f"Employee {i}", "OPS", 1000 + i) for i in range(1, 20001))
+        
+        # Act
+        exact = company.get_salary_percentiles([50, 90])
+        approximate = company.get_salary_percentiles([50, 90], approximate=True, sample_size=2000)
+        
+        # Assert
+        assert exact == {50: 11000.5, 90: 19000.1}
+        for point in exact:
+            assert approximate[point] == pytest.approx(exact[point], rel=0.05)
+    
+    def test_invalid_arguments(self):
+        """Тест проверки аргументов запросов."""
+        # Arrange
+        company = self._build_company()
+        
+        # Act & Assert
+        with pytest.raises(ValueError):
+            company.get_top_earners(-1)
+        with pytest.raises(ValueError):
+            company.get_top_earners(1, by="project")
+        with pytest.raises(ValueError):
+            company.get_salary_percentiles([101])
+
+
+class TestBulkTransfer:
+    """Тесты массового переноса сотрудников."""
+    
+    def _build_company(self):
+        """Создать компанию из трех отделов."""
+        company = Company("ReorgCorp")
+        for name, ids in [("A", [1, 2, 3]), ("B", [4, 5]), ("C", [])]:
+            dept = Department(name)
+            dept.add_employees(Employee(i, f"Employee {i}", name, 1000 * i) for i in ids)
+            company.add_department(dept)
+        return company
+    
+    def _layout(self, company):
+        """Состав отделов компании по ID."""
+        return {d.name: [e.id for e in d] for d in company.get_departments()}
+    
+    def test_bulk_transfer_moves_all(self):
+        """Тест переноса пакета с обновлением индекса и сумм."""
+        # Arrange
+        company = self._build_company()
+        cost = company.calculate_total_monthly_cost()
+        
+        # Act
+        moved = company.bulk_transfer([(1, "C"), (4, "A"), (5, "C"), (2, "A")])
+        
+        # Assert
+        assert moved == 3
+        assert self._layout(company) == {"A": [2, 3, 4], "B": [], "C": [1, 5]}
+        assert company.find_employee_department(5).name == "C"
+        assert company._find_department_by_name("C").calculate_total_salary() == 6000
+        assert company.calculate_total_monthly_cost() == cost
+        company.find_employee_by_id(1).base_salary = 500
+        assert company._find_department_by_name("C").calculate_total_salary() == 5500
+    
+    def test_invalid_batch_changes_nothing(self):
+        """Тест проверки всего пакета до применения."""
+        # Arrange
+        company = self._build_company()
+        before = self._layout(company)
+        
+        # Act & Assert
+        with pytest.raises(DepartmentNotFoundError):
+            company.bulk_transfer([(1, "C"), (2, "Missing")])
+        with pytest.raises(EmployeeNotFoundError):
+            company.bulk_transfer([(1, "C"), (99, "C")])
+        with pytest.raises(ValueError):
+            company.bulk_transfer([(1, "C"), (1, "B")])
+        assert self._layout(company) == before
+    
+    def test_failure_during_apply_rolls_back(self, monkeypatch):
+        """Тест отката при ошибке на этапе применения."""
+        # Arrange
+        company = self._build_company()
+        before = self._layout(company)
+        target = company._find_department_by_name("C")
+        
+        def fail(employees):
+            raise RuntimeError("сбой хранилища")
+        
+        monkeypatch.setattr(target, "_put_employees", fail)
+        
+        # Act
+        with pytest.raises(RuntimeError):
+            company.bulk_transfer([(2, "C"), (4, "A")])
+        
+        # Assert
+        assert self._layout(company) == before
+        assert company.find_employee_department(2).name == "A"
+        assert company.find_employee_department(4).name == "B"
+        assert company.recalculate_total_monthly_cost() == company.calculate_total_monthly_cost()
+        company.find_employee_by_id(2).base_salary = 0
+        assert company._find_department_by_name("A").calculate_total_salary() == 4000
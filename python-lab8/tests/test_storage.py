@@ -0,0 +1,291 @@
+"""Тесты форматов хранения компании."""
+
+import json
+import pytest
+from src.core.employee import Employee
+from src.core.department import Department
+from src.core.company import Company
+from src.core.project import Project
+from src.employees.manager import Manager
+from src.employees.developer import Developer
+from src.employees.salesperson import Salesperson
+from src.storage import ndjson
+
+
+@pytest.fixture
+def company():
+    """Компания с отделами, сотрудниками и проектами."""
+    company = Company("TechCorp")
+    dev = Department("Development")
+    sales = Department("Sales")
+    dev.add_employees([
+        Manager(1, "Alice", "DEV", 7000, 2000),
+        Developer(2, "Bob", "DEV", 5000, ["Python", "SQL"], "senior"),
+        Employee(3, "Eve", "DEV", 3000)
+    ])
+    sales.add_employee(Salesperson(4, "Charlie", "SAL", 4000, 0.15, 50000))
+    company.add_department(dev)
+    company.add_department(sales)
+    company.add_project(Project(1, "AI Platform", "ML", "2025-06-30", "active"))
+    company.add_project(Project(2, "CRM", "Sales tools", "2025-12-31", "planning"))
+    company.assign_employee_to_project(2, 1)
+    company.assign_employee_to_project(4, 1)
+    company.assign_employee_to_project(2, 2)
+    return company
+
+
+def assert_same_company(loaded: Company, original: Company) -> None:
+    """Сравнить состав и сериализацию двух компаний."""
+    assert loaded.name == original.name
+    assert [d.name for d in loaded.get_departments()] == [d.name for d in original.get_departments()]
+    assert ([e.to_dict() for e in loaded.get_all_employees()]
+            == [e.to_dict() for e in original.get_all_employees()])
+    assert [p.to_dict() for p in loaded.get_projects()] == [p.to_dict() for p in original.get_projects()]
+    assert loaded.calculate_total_monthly_cost() == original.calculate_total_monthly_cost()
+
+
+class TestNdjsonSnapshot:
+    """Тесты потокового NDJSON-снимка."""
+    
+    @pytest.mark.parametrize("compression", [None, "gzip"])
+    def test_roundtrip(self, company, tmp_path, compression):
+        """Тест сохранения и загрузки с разным сжатием."""
+        # Arrange
+        filename = str(tmp_path / "company.ndjson")
+        
+        # Act
+        company.save_to_ndjson(filename, compression=compression)
+        loaded = Company.load_from_ndjson(filename)
+        
+        # Assert
+        assert ndjson.detect_compression(filename) == compression
+        assert_same_company(loaded, company)
+        assert loaded.find_employee_by_id(2) is loaded.get_projects()[1].get_team()[0]
+    
+    def test_project_team_stored_as_ids(self, company, tmp_path):
+        """Тест хранения команды проекта ссылками на ID."""
+        # Arrange
+        filename = str(tmp_path / "company.ndjson")
+        
+        # Act
+        company.save_to_ndjson(filename)
+        records = list(ndjson.iter_records(filename))
+        
+        # Assert
+        assert records[0]["format"] == ndjson.FORMAT_NAME
+        projects = [r for r in records if r["record"] == "project"]
+        assert [p["team"] for p in projects] == [[2, 4], [2]]
+        assert sum(1 for r in records if r["record"] == "employee") == 4
+    
+    def test_reads_legacy_json(self, company, tmp_path):
+        """Тест чтения прежнего формата save_to_json."""
+        # Arrange
+        filename = str(tmp_path / "company.json")
+        company.save_to_json(filename)
+        
+        # Act
+        loaded = Company.load_from_ndjson(filename)
+        
+        # Assert
+        assert_same_company(loaded, company)
+    
+    def test_large_department_loaded_in_chunks(self, tmp_path, monkeypatch):
+        """Тест пакетной загрузки сотрудников отдела."""
+        # Arrange
+        monkeypatch.setattr(ndjson, "CHUNK_SIZE", 7)
+        company = Company("Big")
+        dept = Department("Ops")
+        dept.add_employees(Employee(i, f"Emp{i}", "OPS", 1000 + i) for i in range(1, 51))
+        company.add_department(dept)
+        filename = str(tmp_path / "big.ndjson.gz")
+        
+        # Act
+        company.save_to_ndjson(filename, compression="gzip")
+        loaded = Company.load_from_ndjson(filename)
+        
+        # Assert
+        assert [e.id for e in loaded.get_all_employees()] == list(range(1, 51))
+    
+    def test_invalid_compression_raises_error(self, company, tmp_path):
+        """Тест неизвестного способа сжатия."""
+        with pytest.raises(ValueError):
+            company.save_to_ndjson(str(tmp_path / "c.ndjson"), compression="lz4")
+    
+    def test_zstd_requires_package(self, company, tmp_path, monkeypatch):
+        """Тест понятной ошибки при отсутствии zstandard."""
+        monkeypatch.setattr(ndjson, "zstandard", None)
+        with pytest.raises(ImportError):
+            company.save_to_ndjson(str(tmp_path / "c.ndjson.zst"), compression="zstd")
+
+
+class TestBinarySnapshot:
+    """Тесты бинарного снимка с отображением в память."""
+    
+    def test_roundtrip_matches_json(self, company, tmp_path):
+        """Тест совпадения JSON-сериализации после бинарного снимка."""
+        # Arrange
+        binary_file = str(tmp_path / "company.bin")
+        original_json = tmp_path / "original.json"
+        restored_json = tmp_path / "restored.json"
+        company.save_to_json(str(original_json))
+        
+        # Act
+        company.save_to_binary(binary_file)
+        with Company.open_binary(binary_file) as mapped:
+            restored = mapped.to_company()
+        restored.save_to_json(str(restored_json))
+        
+        # Assert
+        assert json.loads(restored_json.read_text(encoding='utf-8')) == json.loads(
+            original_json.read_text(encoding='utf-8'))
+        assert_same_company(Company.load_from_json(str(restored_json)), company)
+    
+    def test_lazy_materialization(self, company, tmp_path):
+        """Тест создания объектов только при обращении."""
+        # Arrange
+        filename = str(tmp_path / "company.bin")
+        company.save_to_binary(filename)
+        
+        # Act
+        with Company.open_binary(filename) as mapped:
+            # Assert - открытие не создает объектов
+            assert len(mapped) == 4
+            assert mapped.get_department_names() == ["Development", "Sales"]
+            assert mapped._employees == {} and mapped._departments == {}
+            
+            developer = mapped.find_employee_by_id(2)
+            assert developer.to_dict() == company.find_employee_by_id(2).to_dict()
+            assert list(mapped._employees) == [1]
+            assert mapped.find_employee_by_id(99) is None
+            
+            sales = mapped.get_department("Sales")
+            assert [e.id for e in sales] == [4]
+            assert mapped.get_department("Development").find_employee_by_id(2) is developer
+            assert mapped.get_department("Missing") is None
+            assert [p.get_team_size() for p in mapped.get_projects()] == [2, 1]
+    
+    def test_rejects_type_without_code(self, company, tmp_path):
+        """Тест отказа записывать тип сотрудника, которого нет в колонках снимка."""
+        # Arrange
+        class Intern(Employee):
+            __slots__ = ()
+            
+            def to_dict(self) -> dict:
+                return {**super().to_dict(), "type": "Intern", "mentor_id": 1}
+        
+        company.get_departments()[0].add_employee(Intern(50, "Tim", "Development", 2000))
+        filename = tmp_path / "company.bin"
+        
+        # Act & Assert
+        with pytest.raises(ValueError):
+            company.save_to_binary(str(filename))
+        assert not filename.exists()
+    
+    def test_rejects_foreign_file(self, tmp_path):
+        """Тест отказа открывать файл другого формата."""
+        # Arrange
+        filename = tmp_path / "not_a_snapshot.bin"
+        filename.write_bytes(b"{}" * 32)
+        
+        # Assert
+        with pytest.raises(ValueError):
+            Company.open_binary(str(filename))
+
+
+def live_dict(company: Company) -> dict:
+    """Сериализовать живую компанию напрямую, без снимка."""
+    return {
+        "name": company.name,
+        "departments": [{"name": d.name, "employees": [e.to_dict() for e in d]}
+                        for d in company.get_departments()],
+        "projects": [p.to_dict() for p in company.get_projects()]
+    }
+
+
+class TestCompanySnapshot:
+    """Тесты согласованных снимков компании."""
+    
+    def test_snapshot_matches_live_company(self, company):
+        """Тест совпадения свежего снимка с живой компанией."""
+        # Act
+        with company.snapshot() as snapshot:
+            data = snapshot.to_dict()
+        
+        # Assert
+        assert data == live_dict(company)
+        assert snapshot.get_change_count() == 0
+    
+    def test_snapshot_is_isolated_from_changes(self, company):
+        """Тест: изменения после снимка не видны в нем."""
+        # Arrange
+        expected = live_dict(company)
+        stats = company.get_department_stats()
+        analysis = company.get_project_budget_analysis()
+        cost = company.calculate_total_monthly_cost()
+        snapshot = company.snapshot()
+        dev = company._find_department_by_name("Development")
+        
+        # Act
+        company.find_employee_by_id(2).seniority_level = "junior"
+        company.find_employee_by_id(2).add_skill("Rust")
+        company.find_employee_by_id(1).name = "Alicia"
+        company.transfer_employee(3, "Development", "Sales")
+        company._find_department_by_name("Sales").remove_employee(3)
+        dev.add_employee(Employee(5, "Newbie", "DEV", 1000))
+        dev.name = "Engineering"
+        company._find_project_by_id(1).change_status("completed")
+        company._find_project_by_id(2).remove_team_member(2)
+        company.remove_project(2)
+        company.add_department(Department("Support"))
+        company.find_employee_by_id(4).id = 40
+        
+        # Assert
+        assert snapshot.to_dict() == expected
+        assert snapshot.get_department_stats() == stats
+        assert snapshot.get_project_budget_analysis() == analysis
+        assert snapshot.calculate_total_monthly_cost() == cost
+        assert live_dict(company) != expected
+        snapshot.close()
+    
+    def test_memory_scales_with_changes(self):
+        """Тест: снимок хранит только затронутые объекты."""
+        # Arrange
+        company = Company("BigCorp")
+        dept = Department("Ops")
+        dept.add_employees(Employee(i, f"Employee {i}", "OPS", 1000) for i in range(1, 1001))
+        company.add_department(dept)
+        snapshot = company.snapshot()
+        
+        # Act
+        company.find_employee_by_id(10).base_salary = 2000
+        company.find_employee_by_id(10).base_salary = 3000
+        company.find_employee_by_id(20).name = "Renamed"
+        
+        # Assert
+        assert snapshot.get_change_count() == 2
+        assert [s.salary for s in snapshot.iter_employees()][9] == 1000
+        snapshot.close()
+        company.find_employee_by_id(30).base_salary = 2000
+        assert snapshot.get_change_count() == 0
+        with pytest.raises(ValueError):
+            snapshot.to_dict()
+    
+    def test_exports_use_snapshot(self, company, tmp_path):
+        """Тест экспорта JSON и CSV через снимок."""
+        # Arrange
+        json_file = tmp_path / "company.json"
+        employees_csv = tmp_path / "employees.csv"
+        projects_csv = tmp_path / "projects.csv"
+        
+        # Act
+        company.save_to_json(str(json_file))
+        company.export_employees_csv(str(employees_csv))
+        company.export_projects_csv(str(projects_csv))
+        
+        # Assert
+        with open(json_file, encoding='utf-8') as f:
+            assert json.load(f) == live_dict(company)
+        employee_rows = employees_csv.read_text(encoding='utf-8').splitlines()
+        assert employee_rows[2] == "2,Bob,DEV,Developer,5000,10000.0"
+        project_rows = projects_csv.read_text(encoding='utf-8').splitlines()
+        assert project_rows[1] == "1,AI Platform,active,2025-06-30,2,21500.0"